@@ -0,0 +1,128 @@
+"""
+Benchmark of jet.codec against the plain PyYAML/json calls it replaces.
+
+Payloads:
+- a `kubectl get pods -o json` list of 10k pods (parsed by the TUI and by wait/log helpers)
+- a large job template (many env variables, volumes and pod failure rules)
+
+Run from the repository root:
+
+    python benchmarks/codec_benchmark.py [--pods 10000] [--repeat 5]
+"""
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from jet import codec  # noqa: E402
+
+
+def make_pod(i):
+    name = f"train-{i // 8}-{i % 8}-x7k2p"
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": "research",
+            "uid": f"6f1c2b7e-0000-4000-8000-{i:012d}",
+            "resourceVersion": str(1000000 + i),
+            "creationTimestamp": "2025-01-01T12:00:00Z",
+            "labels": {"job-name": f"train-{i // 8}", "job-type": "job", "batch.kubernetes.io/job-completion-index": str(i % 8)},
+            "ownerReferences": [{"apiVersion": "batch/v1", "kind": "Job", "name": f"train-{i // 8}", "uid": f"job-{i // 8}", "controller": True}],
+        },
+        "spec": {
+            "containers": [{
+                "name": "main",
+                "image": "registry.example.com/ml/train:2025.01",
+                "command": ["/bin/bash", "-c"],
+                "args": ["python train.py --config configs/large.yaml --seed 1"],
+                "env": [{"name": f"VAR_{k}", "value": f"value-{k}"} for k in range(10)],
+                "resources": {"requests": {"cpu": "8", "memory": "64Gi"}, "limits": {"nvidia.com/gpu": "1", "memory": "64Gi"}},
+                "volumeMounts": [{"name": f"vol-{k}", "mountPath": f"/mnt/data{k}"} for k in range(4)],
+            }],
+            "volumes": [{"name": f"vol-{k}", "hostPath": {"path": f"/data/{k}", "type": "Directory"}} for k in range(4)],
+            "nodeName": f"node-{i % 64}",
+            "restartPolicy": "Never",
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": f"10.0.{i // 256 % 256}.{i % 256}",
+            "startTime": "2025-01-01T12:00:05Z",
+            "conditions": [{"type": t, "status": "True", "lastTransitionTime": "2025-01-01T12:00:10Z"}
+                           for t in ("PodScheduled", "Initialized", "ContainersReady", "Ready")],
+            "containerStatuses": [{"name": "main", "ready": True, "restartCount": 0, "image": "registry.example.com/ml/train:2025.01",
+                                   "state": {"running": {"startedAt": "2025-01-01T12:00:09Z"}}}],
+        },
+    }
+
+
+def make_template():
+    return {
+        "apiVersion": "batch/v1",
+        "kind": "Job",
+        "metadata": {"name": "large-template", "labels": {"job-type": "job"}},
+        "spec": {
+            "backoffLimit": 6,
+            "podFailurePolicy": {"rules": [{"action": "FailJob", "onExitCodes": {"operator": "In", "values": [k]}} for k in range(1, 100)]},
+            "template": {"spec": {
+                "restartPolicy": "Never",
+                "volumes": [{"name": f"volume-{k}", "hostPath": {"path": f"/datasets/{k}", "type": "Directory"}} for k in range(200)],
+                "containers": [{
+                    "name": "main",
+                    "image": "registry.example.com/ml/train:2025.01",
+                    "command": ["/bin/bash", "-c"],
+                    "args": ["python train.py " + " ".join(f"--opt{k}={k}" for k in range(100))],
+                    "env": [{"name": f"ENV_{k}", "value": f"/some/long/path/value/{k}"} for k in range(2000)],
+                    "volumeMounts": [{"name": f"volume-{k}", "mountPath": f"/mnt/{k}"} for k in range(200)],
+                }],
+            }},
+        },
+    }
+
+
+def best(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def report(name, baseline, fast, repeat):
+    (t_base, r_base), (t_fast, r_fast) = best(baseline, repeat), best(fast, repeat)
+    same = "identical" if r_base == r_fast else "DIFFERENT"
+    print(f"{name:<34} {t_base * 1000:9.1f} ms {t_fast * 1000:9.1f} ms {t_base / t_fast:7.1f}x  {same}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pods", type=int, default=10000, help="Number of pods in the list payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    pods_json = json.dumps({"apiVersion": "v1", "kind": "List", "items": [make_pod(i) for i in range(args.pods)]}, indent=4)
+    template = make_template()
+    template_yaml = yaml.dump(template, sort_keys=False, default_flow_style=False)
+
+    print(f"libyaml: {'yes' if hasattr(yaml, 'CSafeLoader') else 'no'}, orjson: {'yes' if codec._fast_json() else 'no'}")
+    print(f"Pod list: {len(pods_json) / 1e6:.1f} MB, template: {len(template_yaml) / 1e3:.0f} kB\n")
+    print(f"{'':<34} {'baseline':>12} {'jet.codec':>12} {'speedup':>8}")
+    report(f"json decode {args.pods} pods", lambda: json.loads(pods_json), lambda: codec.json_loads(pods_json), args.repeat)
+    if codec._fast_json():
+        orjson, codec._orjson = codec._orjson, False
+        report(f"json decode {args.pods} pods, no orjson", lambda: json.loads(pods_json), lambda: codec.json_loads(pods_json), args.repeat)
+        codec._orjson = orjson
+    report("yaml load template", lambda: yaml.safe_load(template_yaml), lambda: codec.yaml_load(template_yaml), args.repeat)
+    report("yaml dump template",
+           lambda: yaml.dump(template, sort_keys=False, default_flow_style=False),
+           lambda: codec.yaml_dump(template), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
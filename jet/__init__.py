@@ -1,14 +1,27 @@
-try:
-    from importlib.metadata import version, PackageNotFoundError
-except ImportError:
-    from importlib_metadata import version, PackageNotFoundError
+# Kept import-free: the version lookup and the CLI module are only loaded when accessed,
+# so that `jet` starts fast (see jet.jet.parse_arguments).
 
-# Version of the jet package
-try:
-    __version__ = version("jet-k8s")
-except PackageNotFoundError:
-    __version__ = "unknown"
+__all__ = ["cli", "__version__"]
 
-from .jet import cli
 
-__all__ = ["cli", "__version__"]
+def _find_version():
+    """Version of the installed jet-k8s distribution."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        from importlib_metadata import version, PackageNotFoundError
+    try:
+        return version("jet-k8s")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        # Version of the jet package
+        globals()["__version__"] = _find_version()
+        return globals()["__version__"]
+    if name == "cli":
+        from .jet import cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
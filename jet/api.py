@@ -0,0 +1,469 @@
+"""Python API for building, submitting and tracking jet jobs.
+
+The CLI is built on argparse namespaces and prints its progress; this module exposes the same
+job building and submission as library calls that return objects instead:
+
+    from jet.api import build_job, AsyncClient
+
+    job = build_job("train", template="my-template", image="pytorch/pytorch", gpu=1, env={"LR": "0.1"})
+    async with AsyncClient() as client:
+        await client.submit(job)
+        status = await client.wait("train")
+
+AsyncClient uses a single kr8s API client (and its connection pool) for all calls, so many jobs
+can be submitted, watched and followed concurrently from one event loop. Client is the
+blocking equivalent; its calls run on kr8s' background event loop (see k8s_api.run_sync).
+"""
+import io
+import asyncio
+import logging
+import contextlib
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+
+from .defaults import DEFAULT_BULK_CONCURRENCY, DEFAULT_BULK_QPS
+
+
+# `jet launch job` options that only make sense on the command line
+_CLI_ONLY_OPTIONS = {'follow', 'dry_run', 'verbose', 'save_template', 'from_manifest', 'concurrency',
+                     'qps', 'report', 'max_running'}
+
+# Job phases after which a job does not change anymore
+TERMINAL_PHASES = ('complete', 'failed', 'deleted')
+
+
+@dataclass
+class JobStatus:
+    """Status of a Job as reported by the API server."""
+    name: str
+    namespace: Optional[str] = None
+    phase: str = 'pending'  # 'pending', 'running', 'suspended', 'complete', 'failed' or 'deleted'
+    active: int = 0
+    ready: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    failure_reason: Optional[str] = None
+    failure_message: Optional[str] = None
+    raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def done(self):
+        return self.phase in TERMINAL_PHASES
+
+    @classmethod
+    def from_raw(cls, job):
+        """Status of a raw Job object."""
+        from .utils import _job_status_from_raw
+        from .governor import job_phase
+
+        status = job.get('status', {})
+        summary = _job_status_from_raw(status)
+        phase = job_phase(job)
+        # Clusters without the `ready` field count active pods as running
+        ready = status.get('ready', status.get('active', 0))
+        if phase == 'running' and not ready:
+            phase = 'pending'
+        return cls(
+            name=job['metadata']['name'],
+            namespace=job['metadata'].get('namespace'),
+            phase=phase,
+            active=summary['active'],
+            ready=ready,
+            succeeded=summary['succeeded'],
+            failed=summary['failed'],
+            failure_reason=summary['failure_reason'],
+            failure_message=summary['failure_message'],
+            raw=job,
+        )
+
+    def _key(self):
+        return (self.phase, self.active, self.ready, self.succeeded, self.failed)
+
+
+def _option_value_args(flag, action, value):
+    """Command line arguments for one `jet launch job` option value."""
+    import argparse
+
+    if isinstance(action, argparse._StoreTrueAction):
+        return [flag] if value else []
+    if isinstance(value, dict):
+        value = [f"{k}={v}" for k, v in value.items()]
+    if isinstance(action, argparse._AppendAction):
+        values = list(value) if isinstance(value, (list, tuple)) else [value]
+        if action.nargs == '+':
+            return [flag] + [str(v) for v in values] if values else []
+        return [f"{flag}={v}" for v in values]
+    return [f"{flag}={value}"]
+
+
+def build_job(name, template=None, **options):
+    """
+    Build the JobConfig of a job the same way as `jet launch job`.
+
+    Options are the `jet launch job` options with '_' instead of '-' (e.g. image, command, gpu,
+    cpu='2:4', pyenv, restart_policy, parallelism). Options that can be given several times (env,
+    volume, node_selector, job_labels, pod_labels, ...) take a list, and key=value options also
+    take a dict. Built specs are cached like CLI launches.
+
+    Args:
+        name (str): Job name, or path to a job YAML file.
+        template (str): Name of a saved template or path to a job YAML file.
+        options: `jet launch job` options.
+
+    Returns:
+        JobConfig: The job. Use .to_dict() for the manifest.
+
+    Raises:
+        ValueError: If an option is unknown or invalid.
+    """
+    from .jet import parse_arguments
+    from .process_args import ProcessArguments
+
+    options = {key.replace('-', '_'): value for key, value in options.items() if value is not None}
+    unsupported = sorted(_CLI_ONLY_OPTIONS & set(options))
+    if unsupported:
+        raise ValueError(f"Options not supported by build_job: {', '.join(unsupported)}")
+    if template is not None:
+        options['template'] = template
+
+    parser, _ = parse_arguments(['launch', 'job'])
+    actions = {action.dest: action for action in parser._subparsers_map['launch_job']._actions
+               if action.option_strings}
+    argv = ['launch', 'job', name]
+    for key, value in options.items():
+        if key not in actions or key == 'help':
+            raise ValueError(f"Unknown job option '{key}'")
+        argv += _option_value_args(actions[key].option_strings[0], actions[key], value)
+
+    # argparse reports invalid values on stderr and exits; ProcessArguments prints progress
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            _, args = parse_arguments(argv)
+        except SystemExit:
+            raise ValueError(output.getvalue().strip().splitlines()[-1].split('error: ', 1)[-1]) from None
+        job_config = ProcessArguments(args).process()
+    if output.getvalue():
+        logging.debug(output.getvalue().strip())
+    return job_config
+
+
+def job_dependents(job_config):
+    """
+    Builder of the resources owned by a job: the PodGroup of a gang scheduled job and the
+    headless Service of a distributed job.
+
+    Returns:
+        callable: Called with the applied Job, returns the dependent manifests. None if the job
+            has no dependents.
+    """
+    builders = []
+    if job_config.pod_group:
+        from .gang import build_pod_group
+        builders.append(lambda job: build_pod_group(job, job_config.pod_group))
+    if job_config.distributed:
+        from .distributed import build_headless_service
+        builders.append(lambda job: build_headless_service(job, job_config.distributed))
+    if not builders:
+        return None
+    return lambda job: [build(job) for build in builders]
+
+
+class AsyncClient:
+    """
+    Asyncio client for submitting and tracking jobs over one reused API connection.
+
+    Args:
+        namespace (str): Default namespace. Defaults to the namespace of the current kubeconfig context.
+        api: Optional kr8s async API client. Defaults to the shared client of the running event loop.
+    """
+
+    def __init__(self, namespace=None, api=None):
+        self.namespace = namespace
+        self._api = api
+
+    async def __aenter__(self):
+        await self.api()
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def api(self):
+        """The kr8s API client, created on first use."""
+        if self._api is None:
+            from .k8s_api import get_api
+
+            self._api = await get_api()
+        return self._api
+
+    async def _namespace(self, namespace):
+        return namespace or self.namespace or (await self.api()).namespace
+
+    async def submit(self, job):
+        """
+        Submit a job with server-side apply, together with the resources it owns.
+
+        Args:
+            job: JobConfig (e.g. from build_job) or a Job manifest dict.
+
+        Returns:
+            dict: The applied Job.
+        """
+        from .k8s_api import apply_resource, apply_job_with_dependents
+
+        api = await self.api()
+        build_dependents = None
+        if isinstance(job, dict):
+            manifest = dict(job, metadata=dict(job['metadata']))
+        else:
+            build_dependents = job_dependents(job)
+            manifest = job.to_dict()
+        manifest['metadata']['namespace'] = await self._namespace(manifest['metadata'].get('namespace'))
+
+        if build_dependents:
+            # Gang scheduled pods must not be created before their PodGroup
+            applied, _, _ = await apply_job_with_dependents(manifest, build_dependents,
+                                                            hold_suspended=job.pod_group is not None, api=api)
+        else:
+            applied, _ = await apply_resource(manifest, api=api)
+        return applied
+
+    async def submit_many(self, jobs, concurrency=DEFAULT_BULK_CONCURRENCY, qps=DEFAULT_BULK_QPS):
+        """
+        Submit many jobs concurrently (see bulk.submit_many).
+
+        Args:
+            jobs (list): JobConfigs or Job manifest dicts. Jobs with dependents (gang scheduled or
+                distributed) have to be submitted with submit().
+            concurrency (int): Maximum number of requests in flight.
+            qps (float): Client-side limit on requests per second (None or 0 disables limiting).
+
+        Returns:
+            list[SubmitResult]: One result per job, in input order.
+        """
+        from .bulk import submit_many
+
+        manifests = []
+        for job in jobs:
+            if not isinstance(job, dict):
+                if job_dependents(job):
+                    raise ValueError(f"Job {job.metadata.name} owns other resources; submit it with submit()")
+                job = job.to_dict()
+            metadata = dict(job['metadata'], namespace=await self._namespace(job['metadata'].get('namespace')))
+            manifests.append(dict(job, metadata=metadata))
+        return await submit_many(manifests, concurrency, qps, api=await self.api())
+
+    async def status(self, name, namespace=None):
+        """
+        Current status of a job.
+
+        Raises:
+            ValueError: If the job does not exist.
+        """
+        from .k8s_api import get_resource
+
+        namespace = await self._namespace(namespace)
+        job = await get_resource('Job', name, namespace=namespace, api=await self.api())
+        if job is None:
+            raise ValueError(f"Job {name} not found in namespace {namespace}")
+        return JobStatus.from_raw(job)
+
+    async def watch(self, name, namespace=None):
+        """
+        Yield the status of a job when it changes (phase or pod counts), starting with the current
+        status, until the job completes, fails or is deleted.
+
+        Raises:
+            ValueError: If the job does not exist.
+        """
+        from .k8s_api import ResourceWatch
+
+        namespace = await self._namespace(namespace)
+        watch = ResourceWatch('Job', namespace=namespace, field_selector=f"metadata.name={name}", api=await self.api())
+        jobs = await watch.list()
+        if not jobs:
+            raise ValueError(f"Job {name} not found in namespace {namespace}")
+        status = JobStatus.from_raw(jobs[0])
+        yield status
+
+        async for event, obj in watch.events():
+            new_status = JobStatus.from_raw(obj)
+            if event == 'DELETED':
+                new_status.phase = 'deleted'
+            if new_status._key() != status._key():
+                status = new_status
+                yield status
+            if status.done:
+                return
+
+    async def wait(self, name, namespace=None, until=('complete', 'failed'), timeout=None):
+        """
+        Wait for a job to reach one of the given phases.
+
+        Args:
+            name (str): Job name.
+            namespace (str): Namespace.
+            until (tuple): Phases to wait for, e.g. ('running',). Waiting always ends when the job
+                completes, fails or is deleted.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            JobStatus: The status that ended the wait.
+
+        Raises:
+            asyncio.TimeoutError: If the timeout expires first.
+        """
+        async def wait_for_phase():
+            async for status in self.watch(name, namespace=namespace):
+                if status.phase in until or status.done:
+                    return status
+
+        return await asyncio.wait_for(wait_for_phase(), timeout)
+
+    async def pods(self, name, namespace=None):
+        """Names of the active (not terminating) pods of a job, newest first."""
+        from .k8s_api import list_resources
+
+        pods, _ = await list_resources('Pod', namespace=await self._namespace(namespace),
+                                       label_selector=f"job-name={name}", api=await self.api())
+        pods = [pod for pod in pods if not pod['metadata'].get('deletionTimestamp')]
+        pods.sort(key=lambda pod: pod['metadata']['creationTimestamp'], reverse=True)
+        return [pod['metadata']['name'] for pod in pods]
+
+    async def events(self, name, namespace=None, warnings_only=False):
+        """
+        Events of a job and its pods, oldest first, from the namespace's event informer.
+
+        Args:
+            name (str): Job name.
+            namespace (str): Namespace.
+            warnings_only (bool): Only the Warning events jet reports (e.g. FailedScheduling, FailedMount).
+
+        Returns:
+            list[dict]: Raw Event objects. Events of earlier jobs with the same name are included.
+        """
+        from .event_informer import get_event_informer, event_time
+
+        informer = await get_event_informer(await self._namespace(namespace), api=await self.api())
+        events = informer.events(kind='Job', name=name, warnings_only=warnings_only)
+        for pod in await self.pods(name, namespace=namespace):
+            events += informer.events(kind='Pod', name=pod, warnings_only=warnings_only)
+        return sorted(events, key=event_time)
+
+    async def _first_started_pod(self, name, namespace):
+        """Wait for the first pod of a job that has left the Pending phase and return its name."""
+        from .k8s_api import get_resource, ResourceWatch
+
+        api = await self.api()
+        job = await get_resource('Job', name, namespace=namespace, api=api)
+        if job is None:
+            raise ValueError(f"Job {name} not found in namespace {namespace}")
+        job_uid = job['metadata']['uid']
+
+        def started(pod):
+            # Skip pods of previous jobs with the same name
+            owners = [ref.get('uid') for ref in pod['metadata'].get('ownerReferences', []) if ref.get('kind') == 'Job']
+            return job_uid in owners and pod.get('status', {}).get('phase') not in (None, 'Pending')
+
+        watch = ResourceWatch('Pod', namespace=namespace, label_selector=f"job-name={name}", api=api)
+        pods = await watch.list()
+        for pod in sorted(pods, key=lambda pod: pod['metadata']['creationTimestamp']):
+            if started(pod):
+                return pod['metadata']['name']
+        async for event, pod in watch.events():
+            if event != 'DELETED' and started(pod):
+                return pod['metadata']['name']
+
+    async def logs(self, name, namespace=None, pod=None, follow=True, container=None):
+        """
+        Yield the log lines of a job pod.
+
+        Args:
+            name (str): Job name.
+            namespace (str): Namespace.
+            pod (str): Pod name. Defaults to the first pod of the job that started (waits for it).
+            follow (bool): Keep streaming until the container exits.
+            container (str): Container name, for pods with several containers.
+        """
+        from kr8s.asyncio.objects import Pod
+
+        api = await self.api()
+        namespace = await self._namespace(namespace)
+        pod = pod or await self._first_started_pod(name, namespace)
+        pod_obj = await Pod.get(pod, namespace=namespace, api=api)
+        async for line in pod_obj.logs(container=container, follow=follow):
+            yield line
+
+    async def delete(self, name, namespace=None):
+        """
+        Delete a job and its pods.
+
+        Returns:
+            bool: True if the job was deleted, False if it did not exist.
+        """
+        from .k8s_api import delete_resource
+
+        return await delete_resource('Job', name, namespace=await self._namespace(namespace), api=await self.api())
+
+
+class Client:
+    """
+    Blocking client with the same methods as AsyncClient. Calls run on kr8s' background event
+    loop, so all of them share one API connection.
+
+    Args:
+        namespace (str): Default namespace. Defaults to the namespace of the current kubeconfig context.
+    """
+
+    def __init__(self, namespace=None):
+        self._client = AsyncClient(namespace=namespace)
+
+    @property
+    def namespace(self):
+        return self._client.namespace
+
+    def submit(self, job):
+        """Submit a job (see AsyncClient.submit)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.submit, job)
+
+    def submit_many(self, jobs, concurrency=DEFAULT_BULK_CONCURRENCY, qps=DEFAULT_BULK_QPS):
+        """Submit many jobs concurrently (see AsyncClient.submit_many)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.submit_many, jobs, concurrency=concurrency, qps=qps)
+
+    def status(self, name, namespace=None):
+        """Current status of a job (see AsyncClient.status)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.status, name, namespace=namespace)
+
+    def watch(self, name, namespace=None):
+        """Iterate over the status changes of a job (see AsyncClient.watch)."""
+        from .k8s_api import iterate_sync
+        return iterate_sync(self._client.watch, name, namespace=namespace)
+
+    def wait(self, name, namespace=None, until=('complete', 'failed'), timeout=None):
+        """Wait for a job to reach one of the given phases (see AsyncClient.wait)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.wait, name, namespace=namespace, until=until, timeout=timeout)
+
+    def pods(self, name, namespace=None):
+        """Names of the active pods of a job (see AsyncClient.pods)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.pods, name, namespace=namespace)
+
+    def events(self, name, namespace=None, warnings_only=False):
+        """Events of a job and its pods (see AsyncClient.events)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.events, name, namespace=namespace, warnings_only=warnings_only)
+
+    def logs(self, name, namespace=None, pod=None, follow=True, container=None):
+        """Iterate over the log lines of a job pod (see AsyncClient.logs)."""
+        from .k8s_api import iterate_sync
+        return iterate_sync(self._client.logs, name, namespace=namespace, pod=pod, follow=follow, container=container)
+
+    def delete(self, name, namespace=None):
+        """Delete a job and its pods (see AsyncClient.delete)."""
+        from .k8s_api import run_sync
+        return run_sync(self._client.delete, name, namespace=namespace)
@@ -0,0 +1,288 @@
+"""Bulk job submission: manifest parsing, per-job overrides and concurrent submission."""
+import csv
+import json
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .codec import yaml_load, json_loads
+
+
+# Label put on every job (and its pods) of a manifest batch
+BATCH_LABEL = 'jet-batch'
+
+# Override keys accepted in manifest rows (CLI option names with '_' or '-')
+_OVERRIDE_KEYS = {
+    'name', 'namespace', 'image', 'image_pull_policy', 'command', 'shell', 'working_dir',
+    'env', 'cpu', 'memory', 'gpu', 'gpu_type', 'parallelism', 'completions', 'backoff_limit',
+    'priority', 'scheduler', 'restart_policy', 'node_selector', 'job_labels', 'pod_labels',
+}
+
+
+def load_manifest(path):
+    """
+    Load a manifest of per-job overrides.
+
+    Supported formats (by file extension):
+    - .csv: one job per row, header row holds the override keys
+    - .jsonl / .ndjson: one JSON object per line
+    - .yaml / .yml / .json: a list of mappings, or a mapping with a 'jobs' list
+
+    Returns:
+        list[dict]: One overrides dict per job.
+    """
+    path = Path(path).expanduser()
+    if not path.is_file():
+        raise ValueError(f"Manifest file not found: {path}")
+
+    suffix = path.suffix.lower()
+    if suffix == '.csv':
+        with path.open(newline='') as f:
+            # Drop empty cells so they don't override base values
+            rows = [{k.strip(): v for k, v in row.items() if k and v not in (None, '')} for row in csv.DictReader(f)]
+    elif suffix in ('.jsonl', '.ndjson'):
+        with path.open() as f:
+            rows = [json_loads(line) for line in f if line.strip()]
+    elif suffix in ('.yaml', '.yml', '.json'):
+        with path.open() as f:
+            data = yaml_load(f) or []
+        rows = data.get('jobs', []) if isinstance(data, dict) else data
+    else:
+        raise ValueError(f"Unsupported manifest format '{suffix}'. Use .csv, .jsonl, .yaml or .json")
+
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        raise ValueError(f"Manifest {path} must contain a list of job override mappings")
+    return rows
+
+
+def _parse_key_values(value, separator=','):
+    """Parse 'k=v,k2=v2' strings, lists of 'k=v' or dicts into a dict of strings."""
+    if isinstance(value, dict):
+        return {str(k): str(v) for k, v in value.items()}
+    items = value if isinstance(value, list) else str(value).split(separator)
+    parsed = {}
+    for item in items:
+        item = str(item).strip()
+        if not item:
+            continue
+        if '=' not in item:
+            raise ValueError(f"Invalid key=value pair: {item}")
+        k, v = item.split('=', 1)
+        parsed[k.strip()] = v
+    return parsed
+
+
+def apply_overrides(job_config, overrides):
+    """
+    Apply a manifest row to a JobConfig in place.
+
+    Keys follow the `jet launch job` option names (e.g. image, command, gpu, cpu, env, job_labels).
+    Keys of the form `env.NAME` set a single environment variable.
+
+    Args:
+        job_config: JobConfig object to modify.
+        overrides (dict): Overrides for this job.
+    """
+    container = job_config.spec.template_spec.containers[0]
+    pod_spec = job_config.spec.template_spec
+
+    for raw_key, value in overrides.items():
+        key = raw_key.replace('-', '_')
+
+        if key.startswith('env.'):
+            container.env[raw_key[4:]] = str(value)
+            continue
+        if key not in _OVERRIDE_KEYS:
+            raise ValueError(f"Unknown manifest key '{raw_key}'. Supported keys: {', '.join(sorted(_OVERRIDE_KEYS))} and env.<NAME>")
+
+        if key == 'name':
+            job_config.metadata.name = str(value)
+        elif key == 'namespace':
+            job_config.metadata.namespace = str(value)
+        elif key == 'image':
+            container.image = str(value)
+        elif key == 'image_pull_policy':
+            container.image_pull_policy = str(value)
+        elif key == 'command':
+            container.args = [str(value)]
+        elif key == 'shell':
+            container.command = f"{value} -c"
+        elif key == 'working_dir':
+            container.working_dir = str(value)
+        elif key == 'env':
+            container.env.update(_parse_key_values(value, separator=' ') if isinstance(value, str) else _parse_key_values(value))
+        elif key in ('cpu', 'memory'):
+            value = str(value)
+            req, lim = value.split(':') if ':' in value else (value, None)
+            setattr(container.resources, f'{key}_request', req)
+            setattr(container.resources, f'{key}_limit', lim)
+        elif key == 'gpu':
+            container.resources.gpu_count = int(value)
+        elif key == 'gpu_type':
+            container.resources.gpu_type = str(value)
+            pod_spec.node_selectors['gpu-type'] = str(value)
+        elif key in ('parallelism', 'completions', 'backoff_limit'):
+            setattr(job_config.spec, key, int(value))
+        elif key == 'priority':
+            pod_spec.priority_class_name = str(value)
+        elif key == 'scheduler':
+            pod_spec.scheduler = str(value)
+        elif key == 'restart_policy':
+            pod_spec.restart_policy = str(value)
+        elif key == 'node_selector':
+            pod_spec.node_selectors.update(_parse_key_values(value))
+        elif key == 'job_labels':
+            job_config.metadata.labels.update(_parse_key_values(value))
+        elif key == 'pod_labels':
+            pod_spec.labels.update(_parse_key_values(value))
+
+    return job_config
+
+
+class QPSLimiter:
+    """Async token bucket limiting requests per second (client-side QPS limiting)."""
+
+    def __init__(self, qps, burst=None):
+        self.qps = float(qps) if qps else None
+        self.burst = burst or max(1, int(self.qps or 1))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.qps:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.qps)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.qps)
+
+
+@dataclass
+class SubmitResult:
+    """Outcome of submitting a single resource."""
+    name: str
+    namespace: Optional[str] = None
+    status: str = 'pending'  # 'created', 'configured' or 'failed'
+    uid: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    latency_ms: float = 0.0
+    obj: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def ok(self):
+        return self.status in ('created', 'configured')
+
+
+# HTTP status codes worth retrying (throttling and transient server errors)
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+async def submit_many(resources, concurrency, qps, max_retries=3, api=None):
+    """
+    Submit many resources concurrently over a single API client using server-side apply.
+
+    Args:
+        resources (list[dict]): Resource manifests.
+        concurrency (int): Maximum number of requests in flight.
+        qps (float): Client-side limit on requests per second (None or 0 disables limiting).
+        max_retries (int): Retries for throttled (429) or transient server errors.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        list[SubmitResult]: One result per resource, in input order.
+    """
+    import kr8s
+    from .k8s_api import get_api, apply_resource
+
+    api = api or await get_api()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = QPSLimiter(qps)
+
+    async def submit_one(resource):
+        metadata = resource['metadata']
+        result = SubmitResult(name=metadata['name'], namespace=metadata.get('namespace'))
+        async with semaphore:
+            start = time.monotonic()
+            while True:
+                await limiter.acquire()
+                result.attempts += 1
+                try:
+                    applied, created = await apply_resource(resource, api=api)
+                    result.status = 'created' if created else 'configured'
+                    result.uid = applied.get('metadata', {}).get('uid')
+                    result.obj = applied
+                    break
+                except kr8s.ServerError as e:
+                    code = e.response.status_code if e.response is not None else None
+                    if code in _RETRYABLE_STATUS and result.attempts <= max_retries:
+                        retry_after = e.response.headers.get('Retry-After') if e.response is not None else None
+                        delay = float(retry_after) if retry_after and retry_after.isdigit() else 0.5 * 2 ** (result.attempts - 1)
+                        logging.debug(f"Retrying {result.name} after HTTP {code} in {delay}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    result.status = 'failed'
+                    result.error = str(e)
+                    break
+                except Exception as e:
+                    result.status = 'failed'
+                    result.error = str(e)
+                    break
+            result.latency_ms = (time.monotonic() - start) * 1000
+        return result
+
+    return await asyncio.gather(*(submit_one(r) for r in resources))
+
+
+def print_submit_results(results, elapsed, verbose=False):
+    """Print a per-item summary of a bulk submission."""
+    failed = [r for r in results if not r.ok]
+    created = sum(1 for r in results if r.status == 'created')
+    configured = sum(1 for r in results if r.status == 'configured')
+
+    if verbose:
+        for r in results:
+            if r.ok:
+                print(f"  \x1b[1;32m{r.status:<10}\x1b[0m {r.name} ({r.latency_ms:.0f} ms)")
+
+    for r in failed:
+        print(f"  \x1b[31mfailed\x1b[0m     {r.name}: {r.error}")
+
+    rate = len(results) / elapsed * 60 if elapsed > 0 else 0
+    failed_text = f"\x1b[31m{len(failed)} failed\x1b[0m" if failed else "0 failed"
+    print(f"\nSubmitted {len(results)} job(s) in {elapsed:.1f}s ({rate:.0f} jobs/min): "
+          f"\x1b[1;32m{created} created\x1b[0m, {configured} configured, {failed_text}")
+
+
+def write_submit_report(results, path):
+    """Write per-item results to a CSV or JSONL report (chosen by file extension)."""
+    path = Path(path).expanduser()
+    rows = [{
+        'name': r.name,
+        'namespace': r.namespace,
+        'status': r.status,
+        'uid': r.uid,
+        'attempts': r.attempts,
+        'latency_ms': round(r.latency_ms, 1),
+        'error': r.error,
+    } for r in results]
+
+    if path.suffix.lower() == '.csv':
+        with path.open('w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ['name'])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with path.open('w') as f:
+            for row in rows:
+                f.write(json.dumps(row) + '\n')
+    print(f"Submission report written to {path}")
@@ -0,0 +1,181 @@
+"""Pre-flight capacity check: can any schedulable node fit a job's pods, now or ever?"""
+import re
+import logging
+
+
+# Node selector key jet sets for --gpu-type; also matched against the node GPU product
+_GPU_TYPE_SELECTOR = 'gpu-type'
+
+# kube-state-metrics is local (port-forwarded or NodePort); the check must not slow down submission
+_FIT_CHECK_TIMEOUT = 1.0
+
+# Request key -> prefix of the per-node fields of utils.get_node_resources()
+_NODE_FIELDS = {'cpu': 'cpu', 'memory': 'mem', 'gpu': 'gpu'}
+
+# Number of candidate nodes shown when a request does not fit
+_MAX_CANDIDATES = 3
+
+
+def pod_request(job):
+    """
+    Resources requested by one pod of a Job manifest.
+
+    Container requests are summed; a container without a request uses its limit (as Kubernetes does).
+
+    Returns:
+        dict: {'cpu': cores, 'memory': GB, 'gpu': count}
+    """
+    from .utils import parse_quantity
+
+    request = {'cpu': 0.0, 'memory': 0.0, 'gpu': 0}
+    for container in job['spec']['template']['spec'].get('containers', []):
+        resources = container.get('resources', {})
+        requests, limits = resources.get('requests', {}), resources.get('limits', {})
+        for key, resource in (('cpu', 'cpu'), ('memory', 'memory'), ('gpu', 'nvidia.com/gpu')):
+            value = requests.get(resource, limits.get(resource))
+            if value is None:
+                continue
+            value = parse_quantity(value)
+            if key == 'memory':
+                request[key] += value / 1024**3
+            elif key == 'gpu':
+                request[key] += int(value)
+            else:
+                request[key] += value
+    return request
+
+
+def _label_key(key):
+    """kube-state-metrics label name for a node label (e.g. 'gpu-type' -> 'gpu_type')."""
+    return re.sub(r'[^A-Za-z0-9_]', '_', key)
+
+
+def _matches_selector(node, node_selector, exposed_labels):
+    """
+    Whether a node matches a node selector.
+
+    kube-state-metrics only exposes allowlisted node labels. Selector keys that no node exposes
+    cannot be evaluated and are ignored, except for gpu-type which falls back to the GPU product.
+    """
+    for key, value in node_selector.items():
+        label = _label_key(key)
+        if label in exposed_labels:
+            if node['labels'].get(label) != str(value):
+                return False
+        elif key == _GPU_TYPE_SELECTOR:
+            normalize = lambda text: re.sub(r'[^a-z0-9]', '', str(text).lower())
+            if normalize(value) not in normalize(node['gpu_product']):
+                return False
+    return True
+
+
+def check_fit(job, nodes, pods=1):
+    """
+    Check whether the pods of a Job manifest fit on the cluster nodes.
+
+    Args:
+        job (dict): Job manifest.
+        nodes (dict): Per-node resources as returned by utils.get_node_resources().
+        pods (int): Number of pods that must be placed at the same time (e.g. gang min member).
+
+    Returns:
+        tuple: (verdict, request, candidates) where verdict is 'fits', 'fits_later' (fits on
+            allocatable resources but not on what is free right now) or 'never', request is the
+            per-pod request and candidates is a list of (node name, node data) sorted best first.
+    """
+    request = pod_request(job)
+    node_selector = job['spec']['template']['spec'].get('nodeSelector', {})
+    exposed_labels = {label for node in nodes.values() for label in node['labels']}
+
+    def total(node, key):
+        return node[f'{_NODE_FIELDS[key]}_allocatable']
+
+    def free(node, key):
+        return node[f'{_NODE_FIELDS[key]}_allocatable'] - node[f'{_NODE_FIELDS[key]}_requests']
+
+    def fits_in(node, available):
+        return all(available(node, key) >= request[key] for key in request if request[key])
+
+    eligible = {name: node for name, node in nodes.items()
+                if not node['unschedulable'] and _matches_selector(node, node_selector, exposed_labels)}
+    allocatable = {name: node for name, node in eligible.items() if fits_in(node, total)}
+
+    # Number of pods each node can take right now
+    def capacity_now(node):
+        counts = [int(free(node, key) // request[key]) for key in request if request[key]]
+        return max(min(counts), 0) if counts else pods
+
+    placeable = sum(capacity_now(node) for node in allocatable.values())
+    if not allocatable:
+        verdict = 'never'
+    elif placeable >= pods:
+        verdict = 'fits'
+    else:
+        verdict = 'fits_later'
+
+    # Best candidates: nodes that fit now first, then by free GPUs, CPU and memory
+    ranked = sorted(allocatable.items() or eligible.items(),
+                    key=lambda item: (capacity_now(item[1]) > 0, free(item[1], 'gpu'), free(item[1], 'cpu'), free(item[1], 'memory')),
+                    reverse=True)
+    return verdict, request, ranked[:_MAX_CANDIDATES]
+
+
+def _format_request(request):
+    parts = [f"{request['cpu']:g} CPU", f"{request['memory']:.1f} GB RAM"]
+    if request['gpu']:
+        parts.append(f"{request['gpu']} GPU")
+    return ', '.join(parts)
+
+
+def _format_node(name, node):
+    text = (f"{name}: {node['cpu_allocatable'] - node['cpu_requests']:.1f}/{node['cpu_allocatable']:.1f} CPU, "
+            f"{node['mem_allocatable'] - node['mem_requests']:.1f}/{node['mem_allocatable']:.1f} GB RAM")
+    if node['gpu_allocatable']:
+        text += f", {node['gpu_allocatable'] - node['gpu_requests']}/{node['gpu_allocatable']} GPU ({node['gpu_product']})"
+    return text + " free"
+
+
+def preflight_fit_check(job, pods=1):
+    """
+    Check that a job can be scheduled before submitting it.
+
+    Prints a warning when the pods cannot fit right now (they will stay Pending until resources
+    free up) and raises when they can never fit. The check is skipped when kube-state-metrics
+    is not reachable.
+
+    Args:
+        job (dict): Job manifest.
+        pods (int): Number of pods that must be placed at the same time.
+
+    Raises:
+        ValueError: If no schedulable node can ever fit a pod of the job.
+    """
+    import httpx
+    from .utils import get_node_resources
+
+    try:
+        nodes = get_node_resources(timeout=_FIT_CHECK_TIMEOUT)
+    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+        logging.info(f"Skipping fit check, kube-state-metrics is not reachable: {e}")
+        return
+    if not nodes:
+        return
+
+    verdict, request, candidates = check_fit(job, nodes, pods=pods)
+    logging.info(f"Fit check: {verdict} for {pods} pod(s) requesting {_format_request(request)}")
+    if verdict == 'fits':
+        return
+
+    candidates_text = ''.join(f"\n  {_format_node(name, node)}" for name, node in candidates)
+    if verdict == 'never':
+        raise ValueError(
+            f"No schedulable node can fit a pod requesting {_format_request(request)}"
+            + (f" with node selector {job['spec']['template']['spec']['nodeSelector']}"
+               if job['spec']['template']['spec'].get('nodeSelector') else '')
+            + (f". Closest nodes (free/total):{candidates_text}" if candidates else '')
+            + "\nUse --no-fit-check to submit anyway."
+        )
+
+    pods_text = f"{pods} pods" if pods > 1 else "the job pod"
+    print(f"\x1b[33mWarning:\x1b[0m not enough free resources for {pods_text} ({_format_request(request)} each) right now; "
+          f"pods will stay Pending until resources free up. Best candidate nodes (free/total):{candidates_text}")
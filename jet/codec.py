@@ -0,0 +1,77 @@
+"""
+YAML and JSON encoding/decoding used throughout jet, with the fastest available implementation.
+
+YAML is loaded and dumped with PyYAML's libyaml bindings (CSafeLoader/CSafeDumper) when PyYAML
+is built with them, and JSON is decoded with orjson when it is installed (`pip install
+jet-k8s[fast]`). Both fall back to the pure-Python implementations, which give the same results.
+Only safe YAML is loaded and dumped: jet reads and writes plain Kubernetes manifests.
+"""
+import gc
+import json
+
+
+# orjson module once imported, False if it is not installed
+_orjson = None
+
+# Decoding a large payload (e.g. a list of thousands of pods) allocates millions of containers,
+# which triggers the cyclic garbage collector over and over although none of them can be garbage
+# yet. The collector is paused while decoding payloads larger than this.
+_GC_PAUSE_THRESHOLD = 1 << 20
+
+
+def _fast_json():
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson
+
+
+def yaml_load(stream):
+    """Load a YAML document from a string or file object."""
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def yaml_dump(data, stream=None):
+    """Dump data as block-style YAML, keeping key order. Returns a string if no stream is given."""
+    import yaml
+    return yaml.dump(data, stream, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                     sort_keys=False, default_flow_style=False)
+
+
+def yaml_dump_all(documents, stream=None):
+    """Dump several documents as a multi-document YAML stream (see yaml_dump)."""
+    import yaml
+    return yaml.dump_all(documents, stream, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+                         sort_keys=False, default_flow_style=False)
+
+
+def _json_decode(text):
+    orjson = _fast_json()
+    if orjson:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. integers beyond 64 bits); the standard decoder decides
+            pass
+    return json.loads(text)
+
+
+def json_loads(text):
+    """Decode JSON from a string or bytes (e.g. `kubectl -o json` output)."""
+    if len(text) < _GC_PAUSE_THRESHOLD or not gc.isenabled():
+        return _json_decode(text)
+    gc.disable()
+    try:
+        return _json_decode(text)
+    finally:
+        gc.enable()
+
+
+def json_load(f):
+    """Decode JSON from a file object."""
+    return json_loads(f.read())
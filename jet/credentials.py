@@ -0,0 +1,313 @@
+"""Exec credential cache shared by jet, its kr8s clients and every kubectl process it starts.
+
+Users authenticating through a kubeconfig exec plugin (e.g. SSO login helpers) run the plugin on
+every kubectl invocation, which can take over a second. The CLI calls enable_credential_cache(),
+which generates a copy of the kubeconfig in which each exec plugin is wrapped by
+`python -m jet.credentials <key>`. jet's kr8s clients (k8s_api.get_api) and kubectl child
+processes (kubectl_env) are pointed at the copy explicitly; the process environment is not
+changed. The wrapper returns the cached ExecCredential until it expires and only then runs the
+real plugin, so the plugin runs once per token lifetime across all processes. Clients still see
+the real expirationTimestamp and refresh as usual.
+"""
+import os
+import sys
+import json
+import hashlib
+import logging
+from pathlib import Path
+from datetime import datetime, timezone, timedelta
+
+from .defaults import XDG_CACHE_HOME
+
+
+CACHE_DIR = Path(XDG_CACHE_HOME) / "jet" / "credentials"
+
+# Set to 1 to disable the cache (plugins are then run by kubectl as configured)
+DISABLE_ENV = "JET_NO_CREDENTIAL_CACHE"
+
+# Cached credentials are refreshed when they expire within this many seconds
+_EXPIRY_MARGIN_SECONDS = 60
+
+# Lifetime given to credentials returned without an expirationTimestamp
+_DEFAULT_TTL_SECONDS = 300
+
+_WRAPPER_ARGS = ["-m", "jet.credentials"]
+
+# Bumped when the generated kubeconfig changes format
+_GENERATED_VERSION = 2
+
+# Kubeconfig lists whose entries are merged by name across files (first occurrence wins)
+_NAMED_LISTS = ("clusters", "contexts", "users", "extensions")
+
+# Generated kubeconfig in use, set by enable_credential_cache()
+_kubeconfig = None
+
+# File path fields that kubectl resolves relative to the kubeconfig file they are in
+_PATH_FIELDS = {
+    "clusters": ("cluster", ("certificate-authority",)),
+    "users": ("user", ("client-certificate", "client-key", "tokenFile")),
+}
+
+
+def _write_private(path, data):
+    """Atomically write JSON readable by the current user only (the files hold credentials)."""
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+        json.dump(data, f)
+    tmp_path.replace(path)
+
+
+def _exec_key(exec_config):
+    return hashlib.sha1(json.dumps(exec_config, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _is_wrapped(exec_config):
+    return (exec_config.get("args") or [])[:len(_WRAPPER_ARGS)] == _WRAPPER_ARGS
+
+
+def _absolute_paths(kubeconfig, base_dir):
+    """
+    Copy of the kubeconfig entries with relative file paths made absolute.
+
+    Returns:
+        dict: Updated 'clusters' and 'users' lists, or None if relative paths exist but
+            base_dir is unknown (merged from several files).
+    """
+    updated = {}
+    for section, (key, fields) in _PATH_FIELDS.items():
+        entries = []
+        for entry in kubeconfig.get(section, []):
+            values = entry.get(key) or {}
+            relative = {field: values[field] for field in fields
+                        if isinstance(values.get(field), str) and not os.path.isabs(values[field])}
+            if relative:
+                if base_dir is None:
+                    return None
+                values = dict(values, **{field: str(base_dir / path) for field, path in relative.items()})
+                entry = dict(entry, **{key: values})
+            entries.append(entry)
+        updated[section] = entries
+    return updated
+
+
+def _merge_sources(paths):
+    """
+    Full content of the kubeconfig files, merged like kubectl does.
+
+    Unlike utils.get_kubeconfig, which only keeps what jet reads, every top-level field is kept
+    (preferences, extensions, ...): the generated kubeconfig replaces the original for kubectl.
+    """
+    from .utils import _kubeconfig_file_signature, _load_kubeconfig_file
+
+    merged, seen = {}, {key: set() for key in _NAMED_LISTS}
+    for path in paths:
+        signature = _kubeconfig_file_signature(path)
+        if signature[1] is None:
+            continue
+        for key, value in _load_kubeconfig_file(path, signature).items():
+            if key in _NAMED_LISTS and isinstance(value, list):
+                for entry in value:
+                    if entry.get("name") not in seen[key]:
+                        seen[key].add(entry.get("name"))
+                        merged.setdefault(key, []).append(entry)
+            elif isinstance(value, dict):
+                merged[key] = dict(value, **merged.get(key, {}))
+            elif value and not merged.get(key):
+                merged[key] = value
+    return merged
+
+
+def kubeconfig_path():
+    """Generated kubeconfig in use, or None if the credential cache is not enabled."""
+    return _kubeconfig
+
+
+def kubectl_env():
+    """Environment for kubectl child processes: the generated kubeconfig if in use, else None (inherit)."""
+    if _kubeconfig is None:
+        return None
+    return dict(os.environ, KUBECONFIG=_kubeconfig)
+
+
+def enable_credential_cache():
+    """
+    Route exec plugin credentials of the current kubeconfig through the shared cache.
+
+    Only the CLI enables the cache. The generated kubeconfig is used by jet's kr8s clients and
+    passed to kubectl child processes (see kubeconfig_path and kubectl_env); $KUBECONFIG of the
+    process itself is left unchanged. Does nothing when no user has an exec plugin or the cache
+    is disabled.
+
+    Returns:
+        str: Path of the generated kubeconfig, or None.
+    """
+    from .utils import get_kubeconfig, _kubeconfig_file_signature
+
+    global _kubeconfig
+    if os.environ.get(DISABLE_ENV) == "1":
+        return None
+    try:
+        kubeconfig = get_kubeconfig()
+        exec_users = [user for user in kubeconfig.get("users", [])
+                      if isinstance(user.get("user", {}).get("exec"), dict) and not _is_wrapped(user["user"]["exec"])]
+        if not exec_users:
+            return None
+
+        source = os.environ.get("KUBECONFIG", "")
+        sources = source.split(";" if os.name == "nt" else ":") if source else [str(Path.home() / ".kube" / "config")]
+        paths = [Path(p.strip()).expanduser() for p in sources if p.strip()]
+        signatures = [_kubeconfig_file_signature(path) for path in paths]
+        key_data = [_GENERATED_VERSION, sys.executable, signatures]
+        generated = CACHE_DIR / f"kubeconfig-{hashlib.sha1(json.dumps(key_data).encode()).hexdigest()[:16]}.json"
+
+        keys = [_exec_key(user["user"]["exec"]) for user in exec_users]
+        if not generated.exists() or not all((CACHE_DIR / f"{key}.exec.json").exists() for key in keys):
+            existing = [Path(path) for path, mtime, _ in signatures if mtime is not None]
+            base_dir = existing[0].resolve().parent if len(existing) == 1 else None
+            source_config = _merge_sources(paths)
+            resolved = _absolute_paths(source_config, base_dir)
+            if resolved is None:
+                logging.debug("Exec credential cache disabled: relative paths in a kubeconfig merged from several files")
+                return None
+            users = []
+            for user in resolved["users"]:
+                exec_config = user.get("user", {}).get("exec")
+                if isinstance(exec_config, dict) and not _is_wrapped(exec_config):
+                    key = _exec_key(exec_config)
+                    # Commands with a relative path are relative to the kubeconfig file, like the other paths
+                    command = exec_config.get("command", "")
+                    if os.sep in command and not os.path.isabs(command) and base_dir is not None:
+                        exec_config = dict(exec_config, command=str(base_dir / command))
+                    _write_private(CACHE_DIR / f"{key}.exec.json", exec_config)
+                    wrapper = {k: v for k, v in exec_config.items() if k not in ("command", "args", "env")}
+                    wrapper.update({"command": sys.executable, "args": _WRAPPER_ARGS + [key]})
+                    user = dict(user, user=dict(user["user"], exec=wrapper))
+                users.append(user)
+            config = dict(source_config, clusters=resolved["clusters"], users=users)
+            config.setdefault("apiVersion", "v1")
+            config.setdefault("kind", "Config")
+            _write_private(generated, config)
+
+        _kubeconfig = str(generated)
+        logging.debug(f"Using exec credential cache kubeconfig {generated}")
+        return _kubeconfig
+    except Exception as e:
+        # Never block a command on the cache; kubectl then runs the plugins itself
+        logging.debug(f"Exec credential cache disabled: {e}")
+        return None
+
+
+def _expiry(status):
+    """Expiry of an ExecCredential status as a UTC datetime."""
+    timestamp = status.get("expirationTimestamp")
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        # Older Pythons do not parse fractional seconds other than 3 or 6 digits; RFC 3339 times from plugins are UTC
+        return datetime.strptime(timestamp[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+
+
+def _run_plugin(exec_config, exec_info):
+    """Run the original exec plugin and return its ExecCredential status."""
+    import subprocess
+
+    env = dict(os.environ)
+    env.update({e["name"]: e["value"] for e in exec_config.get("env") or []})
+    if exec_info:
+        env["KUBERNETES_EXEC_INFO"] = exec_info
+    # stdin and stderr stay attached so interactive logins keep working
+    result = subprocess.run([exec_config["command"]] + list(exec_config.get("args") or []),
+                            env=env, stdout=subprocess.PIPE, check=True)
+    return json.loads(result.stdout)["status"]
+
+
+def get_credential(key, exec_info=None):
+    """
+    Return a valid ExecCredential status for a wrapped exec plugin, running the plugin if needed.
+
+    Concurrent callers wait on a file lock, so the plugin runs only once when the cached
+    credential expires.
+
+    Args:
+        key (str): Key of the wrapped exec plugin config.
+        exec_info (str): KUBERNETES_EXEC_INFO passed by the client (includes cluster info when
+            provideClusterInfo is set).
+
+    Returns:
+        dict: ExecCredential status (token or client certificate data, expirationTimestamp).
+    """
+    with open(CACHE_DIR / f"{key}.exec.json") as f:
+        exec_config = json.load(f)
+
+    cluster = json.loads(exec_info).get("spec", {}).get("cluster", {}).get("server") if exec_info else None
+    cache_path = CACHE_DIR / f"{key}-{hashlib.sha1(str(cluster).encode()).hexdigest()[:8]}.json"
+
+    def cached():
+        try:
+            with open(cache_path) as f:
+                status = json.load(f)
+        except (OSError, ValueError):
+            return None
+        expiry = _expiry(status)
+        if expiry and expiry - datetime.now(timezone.utc) > timedelta(seconds=_EXPIRY_MARGIN_SECONDS):
+            return status
+        return None
+
+    status = cached()
+    if status:
+        return status
+
+    lock_file = open(CACHE_DIR / f"{key}.lock", "w")
+    try:
+        try:
+            import fcntl
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        except ImportError:
+            pass
+        # Another process may have refreshed the credential while we waited for the lock
+        status = cached()
+        if status:
+            return status
+
+        status = _run_plugin(exec_config, exec_info)
+        if not status.get("expirationTimestamp"):
+            expiry = datetime.now(timezone.utc) + timedelta(seconds=_DEFAULT_TTL_SECONDS)
+            status["expirationTimestamp"] = expiry.strftime("%Y-%m-%dT%H:%M:%SZ")
+        _write_private(cache_path, status)
+        return status
+    finally:
+        lock_file.close()
+
+
+def main(argv=None):
+    """Exec plugin entry point: print the cached (or refreshed) ExecCredential for a key."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("Usage: python -m jet.credentials <key>", file=sys.stderr)
+        return 1
+
+    exec_info = os.environ.get("KUBERNETES_EXEC_INFO")
+    try:
+        status = get_credential(argv[0], exec_info)
+        if exec_info:
+            api_version = json.loads(exec_info).get("apiVersion")
+        else:
+            with open(CACHE_DIR / f"{argv[0]}.exec.json") as f:
+                api_version = json.load(f).get("apiVersion")
+    except Exception as e:
+        print(f"jet: could not get exec credential: {e}", file=sys.stderr)
+        return 1
+
+    print(json.dumps({
+        "apiVersion": api_version or "client.authentication.k8s.io/v1",
+        "kind": "ExecCredential",
+        "status": status,
+    }))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
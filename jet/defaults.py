@@ -15,6 +15,10 @@ DEFAULT_DEBUG_JOB_DURATION_SECONDS = 21600  # 6 hours
 # Timeout when waiting for job pods to start when `--follow` is used or when waiting for jupyter or debug pods to start
 DEFAULT_JOB_POD_WAITING_TIMEOUT = 300  # 5 minutes
 
+# Bulk submission (`--from-manifest`): requests in flight and client-side requests per second
+DEFAULT_BULK_CONCURRENCY = 32
+DEFAULT_BULK_QPS = 50
+
 DEFAULT_SHELL = '/bin/bash'
 DEFAULT_PATH = '/usr/local/cuda/bin:/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin'
 
@@ -23,5 +27,11 @@ JET_HOME = Path(XDG_DATA_HOME) / "jet"
 
 XDG_CACHE_HOME = os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")
 
+# Shared template registry (e.g. a team directory on NFS/BeeGFS) used instead of JET_HOME/templates.
+# Lookups go through a local cache under XDG_CACHE_HOME, which is trusted for this many seconds
+# before the registry is checked for changes.
+JET_TEMPLATE_REGISTRY = os.getenv("JET_TEMPLATE_REGISTRY")
+DEFAULT_TEMPLATE_REGISTRY_CACHE_SECONDS = 30
+
 KUBE_STATE_METRICS_URL = "http://localhost:30080/metrics"
 PROMETHEUS_URL = None
\ No newline at end of file
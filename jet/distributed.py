@@ -0,0 +1,147 @@
+"""Distributed training: multi-node torchrun jobs on Indexed Jobs with a headless Service for pod DNS."""
+import logging
+
+
+DISTRIBUTED_LAUNCHERS = ['torchrun']
+
+# Indexed Job pods carry their completion index in this annotation
+_COMPLETION_INDEX_FIELD = "metadata.annotations['batch.kubernetes.io/job-completion-index']"
+
+# /dev/shm when --shm-size is not given: half of the container memory, or per GPU without a memory setting
+_DEFAULT_SHM_PER_GPU = 8 * 1024**3
+
+
+def _torchrun_command(command):
+    """Prefix a `python ...` command with torchrun and the rendezvous arguments taken from the pod env."""
+    parts = command.strip().split(None, 1)
+    if not parts or parts[0] not in ('python', 'python3'):
+        return command
+    rest = parts[1] if len(parts) > 1 else ''
+    return (
+        "torchrun --nnodes=$NNODES --nproc-per-node=$NPROC_PER_NODE --node-rank=$NODE_RANK "
+        f"--master-addr=$MASTER_ADDR --master-port=$MASTER_PORT {rest}"
+    ).rstrip()
+
+
+def _default_shm_size(container, gpus_per_node):
+    """Size of /dev/shm for data loader workers, as a Kubernetes quantity."""
+    from .utils import parse_quantity
+
+    memory = container.resources.memory_limit or container.resources.memory_request
+    shm_bytes = parse_quantity(memory) // 2 if memory else _DEFAULT_SHM_PER_GPU * max(gpus_per_node, 1)
+    if shm_bytes % 1024**3 == 0:
+        return f"{int(shm_bytes // 1024**3)}Gi"
+    return f"{int(shm_bytes // 1024**2)}Mi"
+
+
+def configure_distributed(job_config, launcher, nodes, gpus_per_node=None, master_port=29500):
+    """
+    Turn a JobConfig into a multi-node distributed training job.
+
+    The job becomes an Indexed job with one pod per node. Pods are reachable as
+    <job>-<index>.<job> through a headless Service (created on submission) and get
+    MASTER_ADDR, MASTER_PORT, NNODES, NPROC_PER_NODE, WORLD_SIZE and NODE_RANK (the
+    completion index) in their environment. `python ...` commands are run with torchrun.
+
+    Args:
+        job_config: JobConfig object to modify.
+        launcher (str): Distributed launcher ('torchrun').
+        nodes (int): Number of nodes (pods).
+        gpus_per_node (int): GPUs (and processes) per node. Defaults to the container GPU count.
+        master_port (int): Rendezvous port on the rank 0 pod.
+    """
+    from .job_config import VolumeSpec
+
+    if launcher not in DISTRIBUTED_LAUNCHERS:
+        raise ValueError(f"Unsupported distributed launcher '{launcher}'. Supported: {', '.join(DISTRIBUTED_LAUNCHERS)}")
+    if nodes is None or nodes < 1:
+        raise ValueError("--distributed requires --nodes >= 1")
+
+    spec = job_config.spec
+    pod_spec = spec.template_spec
+    container = pod_spec.containers[0]
+    name = job_config.metadata.name
+
+    for option, value in (('parallelism', spec.parallelism), ('completions', spec.completions)):
+        if value is not None and value != nodes:
+            raise ValueError(f"--{option} ({value}) conflicts with --nodes ({nodes}) for distributed jobs")
+    if spec.completion_mode == 'NonIndexed':
+        raise ValueError("Distributed jobs require Indexed completion mode")
+
+    if gpus_per_node is not None and container.resources.gpu_count and gpus_per_node != container.resources.gpu_count:
+        raise ValueError(f"--gpus-per-node ({gpus_per_node}) conflicts with --gpu ({container.resources.gpu_count})")
+    gpus_per_node = gpus_per_node or container.resources.gpu_count or 0
+    if gpus_per_node:
+        container.resources.gpu_count = gpus_per_node
+    nproc_per_node = gpus_per_node or 1
+
+    spec.parallelism = nodes
+    spec.completions = nodes
+    spec.completion_mode = 'Indexed'
+    # Pod hostnames of Indexed jobs are <job>-<index>; the subdomain makes them resolvable through the Service
+    pod_spec.subdomain = name
+
+    container.env.update({
+        'MASTER_ADDR': f"{name}-0.{name}",
+        'MASTER_PORT': str(master_port),
+        'NNODES': str(nodes),
+        'NPROC_PER_NODE': str(nproc_per_node),
+        'WORLD_SIZE': str(nodes * nproc_per_node),
+        'NODE_RANK': {'fieldRef': {'fieldPath': _COMPLETION_INDEX_FIELD}},
+    })
+
+    if container.args:
+        command = _torchrun_command(container.args[0])
+        if command == container.args[0] and not command.lstrip().startswith('torchrun'):
+            logging.warning("Command does not start with python or torchrun. Rendezvous settings are only provided as environment variables.")
+        container.args = [command] + container.args[1:]
+
+    # NCCL and data loader workers need a large /dev/shm; the container default is 64Mi
+    if not any(vol.mount_path == '/dev/shm' for vol in pod_spec.volumes):
+        shm_size = _default_shm_size(container, gpus_per_node)
+        pod_spec.volumes.append(VolumeSpec(name='shm-volume', volume_type='emptyDir',
+                                           details={'medium': 'Memory', 'sizeLimit': shm_size}, mount_path='/dev/shm'))
+        container.volume_mounts['shm-volume'] = '/dev/shm'
+
+    job_config.distributed = {
+        'launcher': launcher,
+        'nodes': nodes,
+        'nproc_per_node': nproc_per_node,
+        'master_port': master_port,
+    }
+    return job_config
+
+
+def build_headless_service(job, distributed):
+    """
+    Build the headless Service giving the pods of a distributed Job stable DNS names.
+
+    Args:
+        job (dict): Job manifest. If it has a uid (as returned by the API server), the Service
+            is owned by the Job and garbage collected with it.
+        distributed (dict): JobConfig.distributed.
+
+    Returns:
+        dict: Service manifest.
+    """
+    metadata = job['metadata']
+
+    svc_metadata = {'name': metadata['name']}
+    if metadata.get('namespace'):
+        svc_metadata['namespace'] = metadata['namespace']
+    if metadata.get('uid'):
+        from .k8s_api import owner_reference
+        svc_metadata['ownerReferences'] = [owner_reference(job)]
+
+    return {
+        'apiVersion': 'v1',
+        'kind': 'Service',
+        'metadata': svc_metadata,
+        'spec': {
+            'clusterIP': 'None',
+            'selector': {'job-name': metadata['name']},
+            # Rank 0 must be resolvable before it is ready, the other ranks connect to it at startup
+            'publishNotReadyAddresses': True,
+            'ports': [{'name': 'rendezvous', 'port': distributed['master_port'], 'targetPort': distributed['master_port']}],
+        },
+    }
@@ -0,0 +1,171 @@
+"""
+Namespace-wide event informer: one list + watch of Events per namespace, indexed by involved object.
+
+Looking up the events of an object used to list the events of the namespace with a field
+selector per object, per check, and new pods were checked again after a fixed delay because
+their events may not be recorded yet. The informer lists the events once, keeps them up to date
+with a resumable watch (k8s_api.ResourceWatch) and indexes them by the UID of the involved
+object, so lookups are in-memory and events recorded later are delivered to subscribers as
+they arrive.
+"""
+import asyncio
+import logging
+
+from .k8s_events import K8S_EVENTS
+
+
+# Informers per (event loop, namespace); they are bound to the loop their watch task runs on
+_informers = {}
+
+
+def _involved_key(event):
+    """UID of the involved object, or kind/name for events recorded without one."""
+    involved = event.get('involvedObject', {})
+    return involved.get('uid') or f"{involved.get('kind')}/{involved.get('name')}"
+
+
+def event_time(event):
+    """Time an event was last seen (ISO timestamp string), for sorting and display."""
+    return (event.get('lastTimestamp') or event.get('series', {}).get('lastObservedTime')
+            or event.get('eventTime') or event.get('firstTimestamp')
+            or event['metadata'].get('creationTimestamp') or '')
+
+
+def is_warning(event):
+    """Whether an event is a Warning with one of the reasons jet reports (K8S_EVENTS)."""
+    return event.get('type') == 'Warning' and event.get('reason') in K8S_EVENTS
+
+
+class EventInformer:
+    """
+    Events of a namespace, kept in memory and indexed by involved object.
+
+    Use get_event_informer() to share one informer per namespace.
+
+    Attributes:
+        namespace (str): Namespace of the events.
+        synced (bool): Whether the initial list completed and the watch is running.
+    """
+
+    def __init__(self, namespace, api=None):
+        self.namespace = namespace
+        self.synced = False
+        self._api = api
+        self._watch = None
+        self._task = None
+        self._lock = None
+        self._by_object = {}  # involved object UID -> {event name: event}
+        self._uids_by_name = {}  # (kind, name) -> involved object UIDs
+        self._subscribers = set()
+
+    async def start(self):
+        """List the events of the namespace and start watching them (no-op if already started)."""
+        from .k8s_api import get_api, ResourceWatch
+
+        # Concurrent callers wait for the first one's list instead of listing again
+        self._lock = self._lock or asyncio.Lock()
+        async with self._lock:
+            if self._task is not None:
+                return
+            self._api = self._api or await get_api()
+            self._watch = ResourceWatch('Event', namespace=self.namespace, api=self._api)
+            for event in await self._watch.list():
+                self._apply('ADDED', event)
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self.synced = True
+
+    async def _run(self):
+        try:
+            async for event_type, event in self._watch.events():
+                self._apply(event_type, event)
+                for queue in self._subscribers:
+                    queue.put_nowait(('Event', event_type, event))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Lookups keep answering from the last known state
+            logging.warning(f"Stopped watching events in namespace {self.namespace}: {e}")
+        finally:
+            self.synced = False
+
+    def _apply(self, event_type, event):
+        key = _involved_key(event)
+        name = event['metadata']['name']
+        if event_type == 'DELETED':
+            events = self._by_object.get(key, {})
+            events.pop(name, None)
+            if not events:
+                self._by_object.pop(key, None)
+                involved = event.get('involvedObject', {})
+                self._uids_by_name.get((involved.get('kind'), involved.get('name')), set()).discard(key)
+            return
+        self._by_object.setdefault(key, {})[name] = event
+        involved = event.get('involvedObject', {})
+        self._uids_by_name.setdefault((involved.get('kind'), involved.get('name')), set()).add(key)
+
+    def events(self, uid=None, kind=None, name=None, warnings_only=False):
+        """
+        Events of an object, oldest first.
+
+        Args:
+            uid (str): UID of the involved object.
+            kind (str): Kind of the involved object, to look it up by name instead of UID.
+            name (str): Name of the involved object. Matches all objects that had this kind and name.
+            warnings_only (bool): Only Warning events with a reason listed in K8S_EVENTS.
+
+        Returns:
+            list[dict]: Raw Event objects.
+        """
+        keys = [uid] if uid else self._uids_by_name.get((kind, name), ())
+        events = [event for key in keys for event in self._by_object.get(key, {}).values()]
+        if warnings_only:
+            events = [event for event in events if is_warning(event)]
+        return sorted(events, key=event_time)
+
+    def warnings(self, uid=None, kind=None, name=None):
+        """Warning events of an object (see events)."""
+        return self.events(uid=uid, kind=kind, name=name, warnings_only=True)
+
+    def subscribe(self, queue):
+        """Put ('Event', event type, raw event) on an asyncio queue for every event change from now on."""
+        self._subscribers.add(queue)
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+
+    def stats(self):
+        """Index size and watch counters, for diagnostics."""
+        return {'objects': len(self._by_object), 'events': sum(len(events) for events in self._by_object.values()),
+                'subscribers': len(self._subscribers), **(self._watch.stats() if self._watch else {})}
+
+    async def close(self):
+        """Stop watching. The indexed events stay available."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+async def get_event_informer(namespace, api=None):
+    """
+    Started event informer of a namespace, shared by all callers on the running event loop.
+
+    The informer keeps watching after the caller is done, so later waits and views in the same
+    process answer from memory. An informer whose watch stopped is replaced.
+
+    Args:
+        namespace (str): Kubernetes namespace.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        EventInformer: The informer, listed and watching.
+    """
+    key = (id(asyncio.get_running_loop()), namespace)
+    informer = _informers.get(key)
+    if informer is None or (informer._task is not None and informer._task.done()):
+        informer = _informers[key] = EventInformer(namespace, api=api)
+    try:
+        await informer.start()
+    except Exception:
+        _informers.pop(key, None)
+        raise
+    return informer
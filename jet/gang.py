@@ -0,0 +1,109 @@
+"""Gang scheduling: PodGroup objects for KAI-scheduler and Volcano."""
+import logging
+
+
+# Gang scheduling provider -> PodGroup API and how pods reference their group
+GANG_PROVIDERS = {
+    'kai': {
+        'api_version': 'scheduling.run.ai/v2alpha2',
+        'group_annotation': 'pod-group-name',
+        'queue_label': 'kai.scheduler/queue',
+    },
+    'volcano': {
+        'api_version': 'scheduling.volcano.sh/v1beta1',
+        'group_annotation': 'scheduling.k8s.io/group-name',
+        'queue_label': None,
+    },
+}
+
+# Scheduler name -> gang scheduling provider
+GANG_SCHEDULERS = {
+    'kai-scheduler': 'kai',
+    'volcano': 'volcano',
+}
+
+
+def gang_provider(scheduler):
+    """Return the gang scheduling provider for a scheduler name, or raise if it has no gang support."""
+    provider = GANG_SCHEDULERS.get(scheduler)
+    if provider is None:
+        raise ValueError(
+            f"Gang scheduling requires a gang scheduler. Use --scheduler with one of: {', '.join(GANG_SCHEDULERS)}"
+        )
+    return provider
+
+
+def configure_gang(job_config, min_member=None, queue=None):
+    """
+    Enable gang scheduling on a JobConfig: pods are annotated with their PodGroup and
+    job_config.pod_group describes the PodGroup to create on submission.
+
+    Args:
+        job_config: JobConfig object to modify.
+        min_member (int): Minimum number of pods to schedule together. Defaults to parallelism.
+        queue (str): Optional scheduler queue.
+    """
+    pod_spec = job_config.spec.template_spec
+    provider = gang_provider(pod_spec.scheduler)
+    parallelism = job_config.spec.parallelism or 1
+    min_member = min_member or parallelism
+
+    if min_member > parallelism:
+        raise ValueError(f"Gang min member ({min_member}) cannot exceed parallelism ({parallelism})")
+    if parallelism == 1:
+        logging.warning("Gang scheduling a job with parallelism 1 has no effect. Set --parallelism for multi-pod jobs.")
+
+    provider_info = GANG_PROVIDERS[provider]
+    pod_spec.annotations[provider_info['group_annotation']] = job_config.metadata.name
+
+    queue_label = provider_info['queue_label']
+    if queue_label:
+        # KAI-scheduler reads the queue from a pod label; a template may already set it
+        if queue:
+            pod_spec.labels[queue_label] = queue
+        queue = pod_spec.labels.get(queue_label)
+        if not queue:
+            logging.warning(f"No queue set for gang scheduling. Use --queue or set the '{queue_label}' pod label.")
+
+    job_config.pod_group = {
+        'provider': provider,
+        'min_member': min_member,
+        'queue': queue,
+    }
+    return job_config
+
+
+def build_pod_group(job, pod_group):
+    """
+    Build the PodGroup manifest for a Job.
+
+    Args:
+        job (dict): Job manifest. If it has a uid (as returned by the API server), the PodGroup
+            is owned by the Job and garbage collected with it.
+        pod_group (dict): JobConfig.pod_group.
+
+    Returns:
+        dict: PodGroup manifest.
+    """
+    metadata = job['metadata']
+    pod_spec = job['spec']['template']['spec']
+
+    spec = {'minMember': pod_group['min_member']}
+    if pod_group.get('queue'):
+        spec['queue'] = pod_group['queue']
+    if pod_spec.get('priorityClassName'):
+        spec['priorityClassName'] = pod_spec['priorityClassName']
+
+    pg_metadata = {'name': metadata['name']}
+    if metadata.get('namespace'):
+        pg_metadata['namespace'] = metadata['namespace']
+    if metadata.get('uid'):
+        from .k8s_api import owner_reference
+        pg_metadata['ownerReferences'] = [owner_reference(job)]
+
+    return {
+        'apiVersion': GANG_PROVIDERS[pod_group['provider']]['api_version'],
+        'kind': 'PodGroup',
+        'metadata': pg_metadata,
+        'spec': spec,
+    }
@@ -0,0 +1,168 @@
+"""Client-side concurrency governor: jobs are submitted suspended and resumed as running jobs finish."""
+import asyncio
+import logging
+
+
+def job_phase(job):
+    """
+    Phase of a raw Job for the governor.
+
+    Returns:
+        str: 'complete', 'failed', 'suspended' or 'running'
+    """
+    for cond in job.get('status', {}).get('conditions', []):
+        if cond.get('status') != 'True':
+            continue
+        if cond.get('type') == 'Complete':
+            return 'complete'
+        if cond.get('type') == 'Failed':
+            return 'failed'
+    if job.get('spec', {}).get('suspend'):
+        return 'suspended'
+    return 'running'
+
+
+async def set_jobs_suspended(names, suspend, namespace=None, label_selector=None, api=None):
+    """
+    Suspend or resume jobs by name and/or label selector.
+
+    Args:
+        names (list[str]): Job names.
+        suspend (bool): True to suspend, False to resume.
+        namespace (str): Kubernetes namespace.
+        label_selector (str): Optional label selector; matching jobs are added to `names`.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        list[tuple]: (job name, error message or None) per job.
+    """
+    from .k8s_api import get_api, list_resources, patch_resource
+
+    api = api or await get_api()
+    names = list(names or [])
+    if label_selector:
+        jobs, _ = await list_resources('Job', namespace=namespace, label_selector=label_selector, api=api)
+        names += [job['metadata']['name'] for job in jobs
+                  if job['metadata']['name'] not in names and job_phase(job) not in ('complete', 'failed')]
+
+    async def patch_one(name):
+        try:
+            await patch_resource('Job', name, {'spec': {'suspend': suspend}}, namespace=namespace, api=api)
+            return name, None
+        except Exception as e:
+            return name, str(e)
+
+    return await asyncio.gather(*(patch_one(name) for name in names))
+
+
+async def suspend_new_jobs(resources, namespace, api=None):
+    """
+    Mark the jobs of a governed batch that do not exist yet as suspended, for the governor to resume.
+
+    Jobs that already exist (e.g. when a manifest is submitted again) keep their current suspend
+    state: suspending a running job would delete its pods.
+
+    Args:
+        resources (list[dict]): Job manifests, updated in place.
+        namespace (str): Kubernetes namespace of all the jobs.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        int: Number of jobs that already exist.
+    """
+    from .k8s_api import get_api, list_resources
+
+    api = api or await get_api()
+    jobs, _ = await list_resources('Job', namespace=namespace, api=api)
+    existing = {job['metadata']['name']: job for job in jobs}
+    for resource in resources:
+        job = existing.get(resource['metadata']['name'])
+        suspend = bool(job['spec'].get('suspend')) if job is not None else True
+        resource['spec'] = dict(resource['spec'], suspend=suspend)
+    return sum(1 for resource in resources if resource['metadata']['name'] in existing)
+
+
+async def govern(names, namespace, label_selector, max_running, api=None):
+    """
+    Keep at most `max_running` of the given (suspended) jobs unsuspended until all of them finish.
+
+    Jobs are resumed in the given order. Job status is followed with a single list + watch on the
+    label selector, in the same way as the TUI watcher. Jobs resumed by someone else count as running.
+
+    Args:
+        names (list[str]): Job names, in the order they should run.
+        namespace (str): Kubernetes namespace.
+        label_selector (str): Label selector matching (at least) all jobs in `names`.
+        max_running (int): Maximum number of unsuspended, unfinished jobs.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        dict: Number of jobs per final state ('complete', 'failed', 'deleted').
+    """
+    from .k8s_api import get_api, patch_resource, ResourceWatch
+
+    api = api or await get_api()
+    total = len(names)
+    order = {name: i for i, name in enumerate(names)}
+    phases = {}
+
+    watch = ResourceWatch('Job', namespace=namespace, label_selector=label_selector, api=api)
+    for job in await watch.list():
+        if job['metadata']['name'] in order:
+            phases[job['metadata']['name']] = job_phase(job)
+
+    queue = [name for name in names if phases.get(name) == 'suspended']
+    running = {name for name in names if phases.get(name) == 'running'}
+    results = {'complete': 0, 'failed': 0, 'deleted': 0}
+    for name in names:
+        if phases.get(name) in ('complete', 'failed'):
+            results[phases[name]] += 1
+        elif name not in phases:
+            results['deleted'] += 1
+
+    def finished():
+        return sum(results.values())
+
+    async def fill():
+        while len(running) < max_running and queue:
+            name = queue.pop(0)
+            try:
+                await patch_resource('Job', name, {'spec': {'suspend': False}}, namespace=namespace, api=api)
+                running.add(name)
+                logging.info(f"Resumed job {name}")
+            except Exception as e:
+                print(f"Error resuming job {name}: {e}")
+                results['failed'] += 1
+        print(f"\rRunning: {len(running)}, queued: {len(queue)}, finished: {finished()}/{total}", end='', flush=True)
+
+    await fill()
+    if finished() >= total:
+        print()
+        return results
+
+    async for event, job in watch.events():
+        name = job['metadata']['name']
+        if name not in order or (name not in running and name not in queue):
+            continue
+
+        phase = 'deleted' if event == 'DELETED' else job_phase(job)
+        if phase in ('complete', 'failed', 'deleted'):
+            running.discard(name)
+            if name in queue:
+                queue.remove(name)
+            results[phase] += 1
+            if phase == 'failed':
+                print(f"\nJob {name} failed")
+        elif phase == 'running' and name in queue:
+            # Resumed outside the governor
+            queue.remove(name)
+            running.add(name)
+        else:
+            continue
+
+        await fill()
+        if finished() >= total:
+            break
+
+    print()
+    return results
@@ -1,17 +1,63 @@
 # Main file to get user cli arguments, submit job, print job status and underlying pods, capture other commands such as get, describe, exec, logs, delete, etc.
 # and call relevant functions from other modules
 
+import os
 import sys
 import time
 import argparse
-import subprocess
 import signal
-from .defaults import JET_HOME, DEFAULT_JOB_POD_WAITING_TIMEOUT
-from . import __version__
+from .defaults import DEFAULT_JOB_POD_WAITING_TIMEOUT, XDG_CACHE_HOME
+
+
+class VersionAction(argparse.Action):
+    """--version action that only looks up the package version when it is requested."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # importlib.metadata is only imported here, not on every start
+        from . import _find_version
+        print(f'jet {_find_version()}')
+        parser.exit()
+
+
+def _kubectl_help_cache_dir():
+    """
+    Cache directory for kubectl help output of the installed kubectl binary.
+
+    The directory is keyed by the resolved kubectl path, size and modification time, which change
+    whenever kubectl is upgraded, so the kubectl version is tracked without running kubectl.
+    """
+    import shutil
+    import hashlib
+    from pathlib import Path
+
+    kubectl = shutil.which('kubectl')
+    if not kubectl:
+        return None
+    kubectl = os.path.realpath(kubectl)
+    stat = os.stat(kubectl)
+    key = hashlib.sha1(f"{kubectl}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:16]
+    return Path(XDG_CACHE_HOME) / "jet" / "kubectl-help" / key
 
 
 def get_kubectl_help(command):
-    """Fetch kubectl help output for a given command."""
+    """Fetch kubectl help output for a given command (cached on disk per kubectl binary)."""
+    try:
+        cache_dir = _kubectl_help_cache_dir()
+    except OSError:
+        cache_dir = None
+    if cache_dir is None:
+        return None
+
+    cache_file = cache_dir / f"{command}.txt"
+    try:
+        return cache_file.read_text()
+    except OSError:
+        pass
+
+    import subprocess
     try:
         result = subprocess.run(
             ['kubectl', command, '--help'],
@@ -19,9 +65,20 @@ def get_kubectl_help(command):
             text=True,
             timeout=5
         )
-        return result.stdout
     except Exception:
         return None
+    if result.returncode != 0 or not result.stdout:
+        return result.stdout or None
+
+    # Write atomically so concurrent jet processes never read a partial file
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(result.stdout)
+        tmp_file.replace(cache_file)
+    except OSError:
+        pass
+    return result.stdout
 
 
 def make_kubectl_help_formatter(kubectl_command):
@@ -42,18 +99,8 @@ def make_kubectl_help_formatter(kubectl_command):
     return KubectlHelpFormatter
 
 
-def parse_arguments():
-
-    # Note: No default values are set here for any arguments, as defaults are handled in process_args.py based on template or default values.
-    parser = argparse.ArgumentParser(description="Jet CLI")
-    parser.add_argument('--version', action='version', version=f'jet {__version__}')
-    subparsers = parser.add_subparsers(dest='jet_command')
-
-    # Store parser references for printing help when needed
-    parser._subparsers_map = {}
-
-    # Launch command
-    launch_parser = subparsers.add_parser('launch', help='Launch a job or jupyter server')
+def _add_launch_arguments(parser, launch_parser):
+    """Add the `jet launch` arguments."""
     launch_subparsers = launch_parser.add_subparsers(dest='launch_type')
     parser._subparsers_map['launch'] = launch_parser
 
@@ -75,6 +122,12 @@ def parse_arguments():
     job_parser.add_argument('--backoff-limit', type=int, help='Number of retries before marking job as failed')
     job_parser.add_argument('--parallelism', type=int, help='Number of pods that will run in parallel. Defaults to 1 if not set.')
     job_parser.add_argument('--completions', type=int, help='Number of successful pod completions needed to mark the job as complete. Defaults to 1 if not set.')
+    job_parser.add_argument('--indexed', action='store_true', help='Use Indexed completion mode: each pod gets a completion index 0..completions-1 in the JOB_COMPLETION_INDEX env variable. Requires --completions.')
+    job_parser.add_argument('--backoff-limit-per-index', type=int, help='Number of retries per index of an Indexed job before the index is marked as failed')
+    job_parser.add_argument('--max-failed-indexes', type=int, help='Maximum number of failed indexes before an Indexed job is marked as failed. Requires --backoff-limit-per-index.')
+    job_parser.add_argument('--fail-on-exit-codes', help='Fail the job without retries when a container exits with one of these codes (comma separated, e.g. 1,2). Requires restart policy Never.')
+    job_parser.add_argument('--ignore-disruptions', action='store_true', help='Do not count pod disruptions (preemption, eviction, node drain) towards the backoff limit. Requires restart policy Never.')
+    job_parser.add_argument('--pod-failure-rule', action='append', help='Pod failure policy rule, evaluated in order. Format: <Action>:exit-codes=<codes>[@<container>], <Action>:exit-codes!=<codes> or <Action>:condition=<type>. Actions: FailJob, FailIndex, Ignore, Count.')
     job_parser.add_argument('--volume', '-v', action='append', nargs='+', help='Volumes to mount. Format: [<volume_name>:]<host_path>[:<mount_path>][:Type]')
     job_parser.add_argument('--working-dir', help='Working directory inside the container')
     job_parser.add_argument('--shm-size', help='Size of /dev/shm shared memory')
@@ -88,9 +141,100 @@ def parse_arguments():
     job_parser.add_argument('--pod-labels', action='append', nargs='+', help='Pod labels in key=value format')
     job_parser.add_argument('--mount-home', action='store_true', help='If provided, user home directory will be mounted inside the container at the same path')
     job_parser.add_argument('--follow', '-f', action='store_true', help='Follow job logs')
+    job_parser.add_argument('--no-fit-check', action='store_true', help='Skip the pre-flight check that a node can fit the requested CPU, memory and GPUs')
     job_parser.add_argument('--dry-run', action='store_true', help='If provided, job yaml will be printed but not submitted')
     job_parser.add_argument('--verbose', action='store_true', help='If provided, YAML and other debug info will be printed')
     job_parser.add_argument('--save-template', '-st', action='store_true', help='If provided, job yaml will be saved to ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/')
+    job_parser.add_argument('--from-manifest', help='Submit one job per entry of a manifest of per-job overrides (CSV, JSONL or YAML) on top of the template/CLI options. Job name is used as a prefix for entries without a name.')
+    job_parser.add_argument('--concurrency', type=int, help='Maximum number of concurrent submissions with --from-manifest (default: 32)')
+    job_parser.add_argument('--qps', type=float, help='Client-side limit on API requests per second with --from-manifest (default: 50, 0 disables)')
+    job_parser.add_argument('--report', help='Write a per-job submission report (CSV or JSONL by extension) with --from-manifest')
+    job_parser.add_argument('--max-running', type=int, help='With --from-manifest, submit all jobs suspended and keep at most this many running, resuming queued jobs as running jobs finish. jet keeps running until all jobs finish.')
+    job_parser.add_argument('--suspend', action='store_true', help='Create the job suspended. Resume it with `jet resume <name>`.')
+    job_parser.add_argument('--gang', action='store_true', help='Gang schedule the job pods (all-or-nothing placement) with a PodGroup. Requires --scheduler kai-scheduler or volcano.')
+    job_parser.add_argument('--gang-min-member', type=int, help='Minimum number of pods that must be scheduled together with --gang (default: parallelism)')
+    job_parser.add_argument('--queue', help='Scheduler queue for the job PodGroup with --gang')
+    job_parser.add_argument('--distributed', choices=['torchrun'], help='Launch a multi-node distributed training job. Creates an Indexed job with one pod per node and a headless Service for rendezvous.')
+    job_parser.add_argument('--nodes', type=int, help='Number of nodes (pods) for --distributed')
+    job_parser.add_argument('--gpus-per-node', type=int, help='GPUs (and worker processes) per node for --distributed (default: --gpu)')
+    job_parser.add_argument('--master-port', type=int, default=29500, help='Rendezvous port for --distributed (default: 29500)')
+
+    # Launch Sweep (one job per trial of a hyperparameter search)
+    sweep_parser = launch_subparsers.add_parser('sweep', help='Launch a hyperparameter sweep (one job per trial)')
+    sweep_parser.add_argument('name', nargs='?', help='Name of the sweep. Trial jobs are named <name>-<index>')
+    parser._subparsers_map['launch_sweep'] = sweep_parser
+    sweep_parser.add_argument('--template', help='Name of the job template to use. A template name saved by jet at ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/ or a full path to a job yaml file.')
+    sweep_parser.add_argument('--grid', action='append', help='Grid parameter, expanded into the cartesian product with other grid parameters. Format: <key>=<v1>,<v2>,... Can be specified multiple times.')
+    sweep_parser.add_argument('--random', action='append', help='Randomly sampled parameter. Format: <key>=uniform:<low>:<high>, loguniform:<low>:<high>, int:<low>:<high> or choice:<v1>,<v2>,... Can be specified multiple times.')
+    sweep_parser.add_argument('--trials', type=int, help='Number of random samples (per grid point when combined with --grid)')
+    sweep_parser.add_argument('--seed', type=int, default=0, help='Random seed for --random parameters (default: 0)')
+    sweep_parser.add_argument('--params-file', help='File with an explicit list of trial parameters (CSV, JSONL or YAML)')
+    sweep_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
+    sweep_parser.add_argument('--image', help='Container image name')
+    sweep_parser.add_argument('--image-pull-policy', choices=['IfNotPresent', 'Always', 'Never'], help='Image pull policy')
+    sweep_parser.add_argument('--image-pull-secrets', action='append', nargs='+', help='Image pull secrets')
+    sweep_parser.add_argument('--command', help='Command to run in the container. {key} placeholders are replaced with trial parameter values')
+    sweep_parser.add_argument('--shell', help='Shell to use for the command')
+    sweep_parser.add_argument('--pyenv', help='Path to Python environment. Supported envs: conda, and uv.')
+    sweep_parser.add_argument('--scheduler', help='Scheduler name')
+    sweep_parser.add_argument('--priority', help='Job priority')
+    sweep_parser.add_argument('--restart-policy', choices=['Never', 'OnFailure', 'Always'], help='Pod restart policy')
+    sweep_parser.add_argument('--backoff-limit', type=int, help='Number of retries before marking a trial as failed')
+    sweep_parser.add_argument('--fail-on-exit-codes', help='Fail a trial without retries when a container exits with one of these codes (comma separated, e.g. 1,2). Requires restart policy Never.')
+    sweep_parser.add_argument('--ignore-disruptions', action='store_true', help='Do not count pod disruptions (preemption, eviction, node drain) towards the backoff limit. Requires restart policy Never.')
+    sweep_parser.add_argument('--pod-failure-rule', action='append', help='Pod failure policy rule, evaluated in order. Format: <Action>:exit-codes=<codes>[@<container>], <Action>:exit-codes!=<codes> or <Action>:condition=<type>. Actions: FailJob, Ignore, Count.')
+    sweep_parser.add_argument('--volume', '-v', action='append', nargs='+', help='Volumes to mount. Format: [<volume_name>:]<host_path>[:<mount_path>][:Type]')
+    sweep_parser.add_argument('--working-dir', help='Working directory inside the container')
+    sweep_parser.add_argument('--shm-size', help='Size of /dev/shm shared memory')
+    sweep_parser.add_argument('--env', nargs='+', action='append', help='Environment variables or env file')
+    sweep_parser.add_argument('--cpu', help='CPU request and limit. Format: [request]:[limit]')
+    sweep_parser.add_argument('--memory', '--mem', help='Memory request and limit. Format: [request]:[limit]')
+    sweep_parser.add_argument('--gpu', help='Number of GPUs to request')
+    sweep_parser.add_argument('--gpu-type', help='Type of GPU to request')
+    sweep_parser.add_argument('--node-selector', action='append', nargs='+', help='Node selector labels in key=value format')
+    sweep_parser.add_argument('--job-labels', action='append', nargs='+', help='Job labels in key=value format')
+    sweep_parser.add_argument('--pod-labels', action='append', nargs='+', help='Pod labels in key=value format')
+    sweep_parser.add_argument('--mount-home', action='store_true', help='If provided, user home directory will be mounted inside the container at the same path')
+    sweep_parser.add_argument('--concurrency', type=int, help='Maximum number of concurrent submissions (default: 32)')
+    sweep_parser.add_argument('--qps', type=float, help='Client-side limit on API requests per second (default: 50, 0 disables)')
+    sweep_parser.add_argument('--report', help='Write a per-trial submission report (CSV or JSONL by extension)')
+    sweep_parser.add_argument('--max-running', type=int, help='Submit all trials suspended and keep at most this many running, resuming queued trials as running trials finish. jet keeps running until all trials finish.')
+    sweep_parser.add_argument('--dry-run', action='store_true', help='If provided, trial yamls will be printed but not submitted')
+    sweep_parser.add_argument('--verbose', action='store_true', help='If provided, YAML and other debug info will be printed')
+
+    # Launch Pipeline (DAG of jobs, each stage submitted when its dependencies complete)
+    pipeline_parser = launch_subparsers.add_parser('pipeline', help='Run a pipeline of dependent jobs from a pipeline file')
+    pipeline_parser.add_argument('pipeline_file', nargs='?', help='Pipeline file (YAML or JSON) with the stages and their dependencies')
+    parser._subparsers_map['launch_pipeline'] = pipeline_parser
+    pipeline_parser.add_argument('--name', help='Name of the pipeline (default: name in the pipeline file, or the file name). Stage jobs are named <name>-<stage>')
+    pipeline_parser.add_argument('--template', help='Name of the job template to use for all stages. A template name saved by jet at ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/ or a full path to a job yaml file.')
+    pipeline_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
+    pipeline_parser.add_argument('--image', help='Container image name')
+    pipeline_parser.add_argument('--image-pull-policy', choices=['IfNotPresent', 'Always', 'Never'], help='Image pull policy')
+    pipeline_parser.add_argument('--image-pull-secrets', action='append', nargs='+', help='Image pull secrets')
+    pipeline_parser.add_argument('--command', help='Command to run in the container (stages usually set their own)')
+    pipeline_parser.add_argument('--shell', help='Shell to use for the command')
+    pipeline_parser.add_argument('--pyenv', help='Path to Python environment. Supported envs: conda, and uv.')
+    pipeline_parser.add_argument('--scheduler', help='Scheduler name')
+    pipeline_parser.add_argument('--priority', help='Job priority')
+    pipeline_parser.add_argument('--restart-policy', choices=['Never', 'OnFailure', 'Always'], help='Pod restart policy')
+    pipeline_parser.add_argument('--backoff-limit', type=int, help='Number of retries before marking a stage as failed')
+    pipeline_parser.add_argument('--fail-on-exit-codes', help='Fail a stage without retries when a container exits with one of these codes (comma separated, e.g. 1,2). Requires restart policy Never.')
+    pipeline_parser.add_argument('--ignore-disruptions', action='store_true', help='Do not count pod disruptions (preemption, eviction, node drain) towards the backoff limit. Requires restart policy Never.')
+    pipeline_parser.add_argument('--volume', '-v', action='append', nargs='+', help='Volumes to mount in every stage, in addition to the pipeline file volumes. Format: [<volume_name>:]<host_path>[:<mount_path>][:Type]')
+    pipeline_parser.add_argument('--working-dir', help='Working directory inside the container')
+    pipeline_parser.add_argument('--shm-size', help='Size of /dev/shm shared memory')
+    pipeline_parser.add_argument('--env', nargs='+', action='append', help='Environment variables or env file')
+    pipeline_parser.add_argument('--cpu', help='CPU request and limit. Format: [request]:[limit]')
+    pipeline_parser.add_argument('--memory', '--mem', help='Memory request and limit. Format: [request]:[limit]')
+    pipeline_parser.add_argument('--gpu', help='Number of GPUs to request')
+    pipeline_parser.add_argument('--gpu-type', help='Type of GPU to request')
+    pipeline_parser.add_argument('--node-selector', action='append', nargs='+', help='Node selector labels in key=value format')
+    pipeline_parser.add_argument('--job-labels', action='append', nargs='+', help='Job labels in key=value format')
+    pipeline_parser.add_argument('--pod-labels', action='append', nargs='+', help='Pod labels in key=value format')
+    pipeline_parser.add_argument('--mount-home', action='store_true', help='If provided, user home directory will be mounted inside the container at the same path')
+    pipeline_parser.add_argument('--dry-run', action='store_true', help='If provided, stage job yamls will be printed but not submitted')
+    pipeline_parser.add_argument('--verbose', action='store_true', help='If provided, YAML and other debug info will be printed')
 
     # Launch Jupyter
     jupyter_parser = launch_subparsers.add_parser('jupyter', help='Launch a Jupyter Notebook server')
@@ -119,6 +263,7 @@ def parse_arguments():
     jupyter_parser.add_argument('--mount-home', action='store_true', help='If provided, user home directory will be mounted inside the container at the same path')
     jupyter_parser.add_argument('--token', help='Jupyter Notebook token')
     jupyter_parser.add_argument('--follow', '-f', action='store_true', help='Follow job logs')
+    jupyter_parser.add_argument('--no-fit-check', action='store_true', help='Skip the pre-flight check that a node can fit the requested CPU, memory and GPUs')
     jupyter_parser.add_argument('--dry-run', action='store_true', help='If provided, job yaml will be printed but not submitted')
     jupyter_parser.add_argument('--verbose', action='store_true', help='If provided, YAML and other debug info will be printed')
     jupyter_parser.add_argument('--save-template', '-st', action='store_true', help='If provided, job yaml will be saved to ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/')
@@ -150,6 +295,7 @@ def parse_arguments():
     debug_parser.add_argument('--pod-labels', action='append', nargs='+', help='Pod labels in key=value format')
     debug_parser.add_argument('--mount-home', action='store_true', help='If provided, user home directory will be mounted inside the container at the same path')
     debug_parser.add_argument('--follow', '-f', action='store_true', help='Follow job logs')
+    debug_parser.add_argument('--no-fit-check', action='store_true', help='Skip the pre-flight check that a node can fit the requested CPU, memory and GPUs')
     debug_parser.add_argument('--dry-run', action='store_true', help='If provided, job yaml will be printed but not submitted')
     debug_parser.add_argument('--verbose', action='store_true', help='If provided, YAML and other debug info will be printed')
     debug_parser.add_argument('--save-template', '-st', action='store_true', help='If provided, job yaml will be saved to ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/')
@@ -164,8 +310,9 @@ def parse_arguments():
     service_parser.add_argument('--dry-run', action='store_true', help='If provided, YAML will be printed but not submitted')
     service_parser.add_argument('--verbose', action='store_true', help='If provided, YAML and service details will be printed')
 
-    # List command
-    list_parser = subparsers.add_parser('list', help='List resources (templates, jobs, or pods). Defaults to listing jobs if no subcommand is provided.')
+
+def _add_list_arguments(parser, list_parser):
+    """Add the `jet list` arguments."""
     list_parser.add_argument('--namespace', '-n', help='Kubernetes namespace (used when listing jobs or pods)')
     list_subparsers = list_parser.add_subparsers(dest='list_type')
 
@@ -180,45 +327,142 @@ def parse_arguments():
     # List jobs
     list_jobs_parser = list_subparsers.add_parser('jobs', aliases=['job', 'jo', 'j'], help='List Kubernetes jobs')
     list_jobs_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
+    list_jobs_parser.add_argument('--selector', '-l', help='Label selector to filter jobs (e.g. jet-sweep=my-sweep)')
 
     # List pods
     list_pods_parser = list_subparsers.add_parser('pods', aliases=['pod', 'po', 'p'], help='List Kubernetes pods')
     list_pods_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
 
-    # Logs command
-    # jet logs <job_name> (defaults to job) or jet logs pod <pod_name>
-    logs_parser = subparsers.add_parser('logs', help='Get logs from a job or pod. If no resource type is provided (Examples: `jet logs my-job`), defaults to job.',
-                                        formatter_class=make_kubectl_help_formatter('logs'))
+
+def _add_templates_arguments(parser, templates_parser):
+    """Add the `jet templates` arguments."""
+    parser._subparsers_map['templates'] = templates_parser
+    templates_subparsers = templates_parser.add_subparsers(dest='templates_action')
+
+    prune_parser = templates_subparsers.add_parser('prune', help='Remove old template versions, keeping the newest versions of every template')
+    prune_parser.add_argument('--keep', type=int, default=1, help='Number of newest versions to keep per template (default: 1)')
+    prune_parser.add_argument('--older-than', help='Only remove versions older than this (e.g. 12h, 30d, 2w)')
+    prune_parser.add_argument('--name', help='Only prune versions of this template')
+    prune_parser.add_argument('--type', choices=['job', 'jupyter', 'debug'], help='Only prune templates of this type')
+    prune_parser.add_argument('--dry-run', action='store_true', help='Print the versions that would be removed without removing them')
+
+    delete_parser = templates_subparsers.add_parser('delete', aliases=['rm'], help='Delete all versions of a template')
+    delete_parser.add_argument('name', help='Template name')
+    delete_parser.add_argument('--type', choices=['job', 'jupyter', 'debug'], help='Only delete the template of this type')
+    delete_parser.add_argument('--dry-run', action='store_true', help='Print the versions that would be removed without removing them')
+
+    clear_parser = templates_subparsers.add_parser('clear', help='Delete all templates')
+    clear_parser.add_argument('--type', choices=['job', 'jupyter', 'debug'], help='Only delete templates of this type')
+    clear_parser.add_argument('--dry-run', action='store_true', help='Print the versions that would be removed without removing them')
+
+
+def _add_pyenv_arguments(parser, pyenv_parser):
+    """Add the `jet pyenv` arguments."""
+    parser._subparsers_map['pyenv'] = pyenv_parser
+    pyenv_subparsers = pyenv_parser.add_subparsers(dest='pyenv_action')
+
+    inspect_parser = pyenv_subparsers.add_parser('inspect', help='Show how a --pyenv env is resolved into volumes and env variables')
+    inspect_parser.add_argument('path', help='Path to the conda or uv env')
+    inspect_parser.add_argument('--refresh', action='store_true', help='Resolve the env again instead of using the cached resolution')
+
+
+def _add_logs_arguments(parser, logs_parser):
+    """Add the `jet logs` arguments."""
     logs_parser.add_argument('logs_args', nargs=argparse.REMAINDER, metavar='ARG', help='[resource_type] <name> [kubectl_options]. Examples: "my-job", "job my-job", "pod my-pod -f".')
     parser._subparsers_map['logs'] = logs_parser
 
-    # Describe command
-    # Just passing through to kubectl, Pass all args after 'describe' to kubectl
-    describe_parser = subparsers.add_parser('describe', help='Describe a job or pod',
-                                            formatter_class=make_kubectl_help_formatter('describe'))
+
+def _add_describe_arguments(parser, describe_parser):
+    """Add the `jet describe` arguments."""
     describe_parser.add_argument('describe_args', nargs=argparse.REMAINDER, help='<resource_type> <name> [options]. Examples: "job my-job", "pod my-pod -n namespace".')
     parser._subparsers_map['describe'] = describe_parser
 
-    # Connect command
-    # jet connect <job_name> (defaults to job) or jet connect pod <pod_name>
-    connect_parser = subparsers.add_parser('connect', help='Execute into a debug session. If no resource type is provided (Examples: `jet connect my-job`), defaults to job.')
+
+def _add_connect_arguments(parser, connect_parser):
+    """Add the `jet connect` arguments."""
     connect_parser.add_argument('connect_args', nargs='*', metavar='ARG', help='[resource_type] <name>. Examples: "my-job", "job my-job", "pod my-pod".')
     connect_parser.add_argument('--shell', '-s', help='Shell to use for exec into the pod. If not provided, shell will be auto-detected from the container command.')
     connect_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
     parser._subparsers_map['connect'] = connect_parser
 
-    # Delete command
-    # jet delete <job_name> (defaults to job) or jet delete pod <pod_name>
-    delete_parser = subparsers.add_parser('delete', help='Delete a job or pod. If no resource type is provided (Examples: `jet delete my-job`), defaults to job.',
-                                          formatter_class=make_kubectl_help_formatter('delete'))
+
+def _add_delete_arguments(parser, delete_parser):
+    """Add the `jet delete` arguments."""
     delete_parser.add_argument('delete_args', nargs=argparse.REMAINDER, metavar='ARG', help='[resource_type] <name> [kubectl_options]. Examples: "my-job", "job my-job", "pod my-pod --force".')
     parser._subparsers_map['delete'] = delete_parser
 
-    # Resources command
-    resources_parser = subparsers.add_parser('resources', aliases=['res', 'r'], help='Show cluster resource availability (CPU, memory, GPU per node)')
+
+def _add_suspend_arguments(parser, suspend_parser):
+    """Add the `jet suspend` arguments."""
+    suspend_parser.add_argument('names', nargs='*', metavar='NAME', help='Names of the jobs to suspend')
+    suspend_parser.add_argument('--selector', '-l', help='Suspend all unfinished jobs matching a label selector (e.g. jet-sweep=my-sweep)')
+    suspend_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
+    parser._subparsers_map['suspend'] = suspend_parser
+
+
+def _add_resume_arguments(parser, resume_parser):
+    """Add the `jet resume` arguments."""
+    resume_parser.add_argument('names', nargs='*', metavar='NAME', help='Names of the jobs to resume')
+    resume_parser.add_argument('--selector', '-l', help='Resume all unfinished jobs matching a label selector (e.g. jet-sweep=my-sweep)')
+    resume_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
+    parser._subparsers_map['resume'] = resume_parser
+
+
+def _add_wait_arguments(parser, wait_parser):
+    """Add the `jet wait` arguments."""
+    wait_parser.add_argument('names', nargs='*', metavar='NAME', help='Names of the jobs to wait for')
+    wait_parser.add_argument('--selector', '-l', help='Wait for all jobs matching a label selector (e.g. jet-sweep=my-sweep)')
+    wait_parser.add_argument('--for', dest='condition', choices=['complete', 'failed', 'running'], default='complete',
+                             help='Condition to wait for (default: complete). Jobs that reach another final state fail the wait.')
+    wait_parser.add_argument('--timeout', type=float, help='Maximum time to wait in seconds (default: wait indefinitely)')
+    wait_parser.add_argument('--namespace', '-n', help='Kubernetes namespace')
+    parser._subparsers_map['wait'] = wait_parser
+
+
+def _add_resources_arguments(parser, resources_parser):
+    """Add the `jet resources` arguments."""
     parser._subparsers_map['resources'] = resources_parser
 
-    return parser, parser.parse_args()
+
+# Top-level commands in help order: name -> (aliases, help, kubectl command whose help is appended, argument builder)
+_COMMANDS = {
+    'launch': ([], 'Launch a job or jupyter server', None, _add_launch_arguments),
+    'list': ([], 'List resources (templates, jobs, or pods). Defaults to listing jobs if no subcommand is provided.', None, _add_list_arguments),
+    'templates': ([], 'Manage saved job templates (prune, delete, clear)', None, _add_templates_arguments),
+    'pyenv': ([], 'Inspect --pyenv environments', None, _add_pyenv_arguments),
+    'logs': ([], 'Get logs from a job or pod. If no resource type is provided (Examples: `jet logs my-job`), defaults to job.', 'logs', _add_logs_arguments),
+    'describe': ([], 'Describe a job or pod', 'describe', _add_describe_arguments),
+    'connect': ([], 'Execute into a debug session. If no resource type is provided (Examples: `jet connect my-job`), defaults to job.', None, _add_connect_arguments),
+    'delete': ([], 'Delete a job or pod. If no resource type is provided (Examples: `jet delete my-job`), defaults to job.', 'delete', _add_delete_arguments),
+    'suspend': ([], 'Suspend jobs. Running pods are terminated and no new pods are created until the job is resumed.', None, _add_suspend_arguments),
+    'resume': ([], 'Resume suspended jobs', None, _add_resume_arguments),
+    'wait': ([], 'Wait for jobs to complete, fail or run. Exits with 0 if all jobs meet the condition, 1 if any cannot, 2 on timeout.', None, _add_wait_arguments),
+    'resources': (['res', 'r'], 'Show cluster resource availability (CPU, memory, GPU per node)', None, _add_resources_arguments),
+}
+
+
+def parse_arguments(argv=None):
+
+    # Note: No default values are set here for any arguments, as defaults are handled in process_args.py based on template or default values.
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="Jet CLI")
+    parser.add_argument('--version', action=VersionAction, help="show program's version number and exit")
+    subparsers = parser.add_subparsers(dest='jet_command')
+
+    # Store parser references for printing help when needed
+    parser._subparsers_map = {}
+
+    # Only the invoked command gets its arguments. Other commands are added with their name and help,
+    # which is all the top-level help and usage errors need, so startup does not pay for every subparser.
+    invoked = next((arg for arg in argv if not arg.startswith('-')), None)
+    for name, (aliases, help_text, kubectl_command, add_arguments) in _COMMANDS.items():
+        if invoked != name and invoked not in aliases:
+            subparsers.add_parser(name, aliases=aliases, help=help_text)
+            continue
+        kwargs = {'formatter_class': make_kubectl_help_formatter(kubectl_command)} if kubectl_command else {}
+        add_arguments(parser, subparsers.add_parser(name, aliases=aliases, help=help_text, **kwargs))
+
+    return parser, parser.parse_args(argv)
 
 
 def print_help_and_exit(parser, subparser_key=None):
@@ -235,7 +479,7 @@ class Jet():
         from .utils import TemplateManager, get_kubeconfig, get_current_namespace
 
         self.processed_args = processed_args
-        self.template_manager = TemplateManager(templates_dir=JET_HOME / "templates")
+        self.template_manager = TemplateManager()
         
         # Load kubeconfig and namespace once at initialization
         self.kubeconfig = get_kubeconfig()
@@ -251,6 +495,7 @@ class Jet():
 
     def launch_job(self):
         from .utils import submit_job, wait_for_job_pods_ready, get_logs
+        from .timeline import LaunchTimeline
 
         job_config_obj = self.processed_args
         
@@ -266,12 +511,38 @@ class Jet():
             )
             return
 
+        # Refuse requests no node can ever fit, warn about requests that cannot fit right now
+        if job_config_obj.fit_check and not job_config_obj.dry_run:
+            from .capacity import preflight_fit_check
+            if job_config_obj.pod_group:
+                pods = job_config_obj.pod_group['min_member']
+            elif job_config_obj.distributed:
+                pods = job_config_obj.distributed['nodes']
+            else:
+                pods = 1
+            preflight_fit_check(job_config_obj.to_dict(), pods=pods)
+
+        # Resources owned by the job: PodGroup when gang scheduled, headless Service for distributed jobs
+        from .api import job_dependents
+        build_dependents = job_dependents(job_config_obj)
+
         # Submit the job
-        submit_job(
-            job_config=job_config_obj.to_dict(),
-            dry_run=job_config_obj.dry_run,
-            verbose=job_config_obj.verbose
-        )
+        if build_dependents:
+            from .utils import submit_job_with_dependents
+            submitted_job = submit_job_with_dependents(
+                job_config=job_config_obj.to_dict(),
+                build_dependents=build_dependents,
+                # Gang scheduled pods must not be created before their PodGroup
+                hold_suspended=job_config_obj.pod_group is not None,
+                dry_run=job_config_obj.dry_run,
+                verbose=job_config_obj.verbose
+            )
+        else:
+            submitted_job = submit_job(
+                job_config=job_config_obj.to_dict(),
+                dry_run=job_config_obj.dry_run,
+                verbose=job_config_obj.verbose
+            )
 
         # Return if dry run
         if job_config_obj.dry_run:
@@ -280,13 +551,19 @@ class Jet():
         if job_config_obj.follow:
             namespace = self.set_namespace
             
-            # Wait for job pods to be running
-            print("Waiting for job pods to be ready...")
+            # Wait for job pods to be running (the whole gang for gang scheduled jobs)
+            min_running = job_config_obj.pod_group['min_member'] if job_config_obj.pod_group else 1
+            print("Waiting for job pods to be ready..." if min_running == 1 else f"Waiting for {min_running} gang pods to be running...")
+            timeline = LaunchTimeline(job_config_obj.metadata.name, namespace, job=submitted_job, launch_type='job')
             pod_name = wait_for_job_pods_ready(
                             job_name=job_config_obj.metadata.name,
                             namespace=namespace,
-                            timeout=DEFAULT_JOB_POD_WAITING_TIMEOUT
+                            timeout=DEFAULT_JOB_POD_WAITING_TIMEOUT,
+                            job=submitted_job,
+                            min_running=min_running,
+                            timeline=timeline
                         )
+            timeline.report(pod_name)
             
             if not pod_name:
                 print("\nNo running pods found for the job")
@@ -304,8 +581,122 @@ class Jet():
                 timeout=None
             )
 
+    def launch_jobs(self):
+        """Submit a batch of jobs (from a manifest) concurrently over a single API connection."""
+        batch = self.processed_args
+        job_configs = batch['jobs']
+        for job_config_obj in job_configs:
+            if not job_config_obj.metadata.namespace:
+                job_config_obj.metadata.namespace = self.set_namespace
+        self._submit_batch([job_config_obj.to_dict() for job_config_obj in job_configs], batch)
+
+    def launch_sweep(self):
+        """Submit all trials of a sweep concurrently."""
+        batch = self.processed_args
+        resources = batch['trials']
+        for resource in resources:
+            resource['metadata'].setdefault('namespace', self.set_namespace)
+
+        print(f"Sweep {batch['sweep']}: {len(resources)} trial(s)")
+        self._submit_batch(resources, batch)
+
+        if not batch['dry_run']:
+            print(f"List the sweep with: jet list jobs -n {self.set_namespace} -l {batch['selector']}")
+
+    def _submit_batch(self, resources, batch):
+        """Print and/or submit a list of job manifests and report per-job results."""
+        from .utils import print_job_yaml
+        from .bulk import submit_many, print_submit_results, write_submit_report
+        from .k8s_api import run_sync
+        from .codec import yaml_dump_all
+
+        # Governed batches are submitted suspended and resumed by the governor
+        if batch.get('max_running'):
+            other_namespaces = sorted({resource['metadata']['namespace'] for resource in resources} - {self.set_namespace})
+            if other_namespaces:
+                raise ValueError(f"--max-running requires all jobs in namespace {self.set_namespace}; "
+                                 f"the manifest also sets namespace(s) {', '.join(other_namespaces)}")
+            if batch['dry_run']:
+                for resource in resources:
+                    resource['spec'] = dict(resource['spec'], suspend=True)
+            else:
+                from .governor import suspend_new_jobs
+                existing = run_sync(suspend_new_jobs, resources, self.set_namespace)
+                if existing:
+                    print(f"{existing} job(s) already exist and keep their current suspend state")
+
+        if batch['dry_run'] or batch['verbose']:
+            print_job_yaml(yaml_dump_all(resources),
+                           dry_run=batch['dry_run'], verbose=batch['verbose'])
+        if batch['dry_run']:
+            return
+
+        print(f"Submitting {len(resources)} job(s) with concurrency {batch['concurrency']} and QPS limit {batch['qps'] or 'none'}...")
+        start = time.time()
+        results = run_sync(submit_many, resources, concurrency=batch['concurrency'], qps=batch['qps'])
+        print_submit_results(results, time.time() - start, verbose=batch['verbose'])
+
+        if batch['report']:
+            write_submit_report(results, batch['report'])
+
+        if batch.get('max_running'):
+            self._govern_batch([r.name for r in results if r.ok], batch)
+
+        if any(not r.ok for r in results):
+            sys.exit(1)
+
+    def _govern_batch(self, names, batch):
+        """Resume suspended jobs of a batch, keeping at most max_running of them running."""
+        from .governor import govern
+        from .k8s_api import run_sync
+
+        print(f"Keeping at most {batch['max_running']} job(s) running. Press Ctrl+C to stop (queued jobs stay suspended).")
+        try:
+            counts = run_sync(govern, names, self.set_namespace, batch['selector'], batch['max_running'])
+        except KeyboardInterrupt:
+            print(f"\nStopped. Queued jobs stay suspended; resume them with: jet resume -n {self.set_namespace} -l {batch['selector']}")
+            sys.exit(130)
+        print(f"All jobs finished: {counts['complete']} complete, {counts['failed']} failed, {counts['deleted']} deleted")
+
+    def launch_pipeline(self):
+        """Run a pipeline: submit each stage as soon as its dependencies complete."""
+        from .utils import print_job_yaml
+        from .pipeline import run_pipeline
+        from .k8s_api import run_sync
+        from .defaults import DEFAULT_BULK_CONCURRENCY, DEFAULT_BULK_QPS
+        from .codec import yaml_dump_all
+
+        pipeline = self.processed_args
+        jobs = {}
+        for stage, job_config_obj in pipeline['jobs'].items():
+            if not job_config_obj.metadata.namespace:
+                job_config_obj.metadata.namespace = self.set_namespace
+            jobs[stage] = job_config_obj.to_dict()
+
+        if pipeline['dry_run'] or pipeline['verbose']:
+            print_job_yaml(yaml_dump_all(list(jobs.values())),
+                           dry_run=pipeline['dry_run'], verbose=pipeline['verbose'])
+        if pipeline['dry_run']:
+            return
+
+        print(f"Pipeline {pipeline['pipeline']}: {len(jobs)} stage(s). Press Ctrl+C to stop (submitted stages keep running).")
+        try:
+            states = run_sync(run_pipeline, jobs, pipeline['dependencies'], self.set_namespace, pipeline['selector'],
+                              concurrency=DEFAULT_BULK_CONCURRENCY, qps=DEFAULT_BULK_QPS)
+        except KeyboardInterrupt:
+            print("\nStopped. Re-run the pipeline to continue; completed stages are not run again.")
+            sys.exit(130)
+
+        counts = {state: sum(1 for s in states.values() if s == state) for state in ('complete', 'failed', 'skipped', 'deleted')}
+        print(f"Pipeline finished: {counts['complete']} complete, {counts['failed']} failed, "
+              f"{counts['skipped']} skipped, {counts['deleted']} deleted")
+        print(f"List the pipeline jobs with: jet list jobs -n {self.set_namespace} -l {pipeline['selector']}")
+        if counts['complete'] != len(states):
+            sys.exit(1)
+
     def launch_jupyter(self):
         from .utils import submit_job, wait_for_job_pods_ready, get_logs, init_pod_object, delete_resource
+        from .timeline import LaunchTimeline
 
         job_config_obj = self.processed_args
         
@@ -324,8 +715,12 @@ class Jet():
             )
             return
 
+        if job_config_obj.fit_check and not job_config_obj.dry_run:
+            from .capacity import preflight_fit_check
+            preflight_fit_check(job_config_obj.to_dict())
+
         # Submit the job
-        submit_job(
+        submitted_job = submit_job(
             job_config=job_config_obj.to_dict(),
             dry_run=job_config_obj.dry_run,
             verbose=job_config_obj.verbose
@@ -345,11 +740,15 @@ class Jet():
             
             # Wait for Jupyter pod to be running
             print("Waiting for Jupyter pod to be ready...")
+            timeline = LaunchTimeline(job_config_obj.metadata.name, namespace, job=submitted_job, launch_type='jupyter')
             jupyter_pod_name = wait_for_job_pods_ready(
                                 job_name=job_config_obj.metadata.name,
                                 namespace=namespace,
-                                timeout=DEFAULT_JOB_POD_WAITING_TIMEOUT
+                                timeout=DEFAULT_JOB_POD_WAITING_TIMEOUT,
+                                job=submitted_job,
+                                timeline=timeline
                             )
+            timeline.report(jupyter_pod_name)
 
             if not jupyter_pod_name:
                 raise Exception("No running pods found for the job")
@@ -421,6 +820,7 @@ class Jet():
 
     def launch_debug(self):
         from .utils import submit_job, wait_for_job_pods_ready, exec_into_pod, delete_resource
+        from .timeline import LaunchTimeline
 
         job_config_obj = self.processed_args
 
@@ -436,8 +836,12 @@ class Jet():
             )
             return
 
+        if job_config_obj.fit_check and not job_config_obj.dry_run:
+            from .capacity import preflight_fit_check
+            preflight_fit_check(job_config_obj.to_dict())
+
         # Submit the job
-        submit_job(
+        submitted_job = submit_job(
             job_config=job_config_obj.to_dict(),
             dry_run=job_config_obj.dry_run,
             verbose=job_config_obj.verbose
@@ -454,11 +858,15 @@ class Jet():
         try:
             # Wait for debug pod to be running
             print("Waiting for debug pod to be ready...")
+            timeline = LaunchTimeline(job_config_obj.metadata.name, namespace, job=submitted_job, launch_type='debug')
             debug_pod_name = wait_for_job_pods_ready(
                                 job_name=job_config_obj.metadata.name,
                                 namespace=namespace,
-                                timeout=DEFAULT_JOB_POD_WAITING_TIMEOUT
+                                timeout=DEFAULT_JOB_POD_WAITING_TIMEOUT,
+                                job=submitted_job,
+                                timeline=timeline
                             )
+            timeline.report(debug_pod_name)
             
             if not debug_pod_name:
                 raise Exception("No running pods found for the job")
@@ -550,10 +958,36 @@ class Jet():
             sort_by=self.processed_args['sort_by']
         )
 
+    def manage_templates(self):
+        action = self.processed_args['action']
+        if action == 'prune':
+            self.template_manager.prune_templates(
+                keep=self.processed_args['keep'],
+                older_than=self.processed_args['older_than'],
+                job_name=self.processed_args['name'],
+                job_type=self.processed_args['job_type'],
+                dry_run=self.processed_args['dry_run']
+            )
+        elif action in ['delete', 'rm']:
+            self.template_manager.delete_template(
+                self.processed_args['name'],
+                job_type=self.processed_args['job_type'],
+                dry_run=self.processed_args['dry_run']
+            )
+        elif action == 'clear':
+            self.template_manager.clear_templates(
+                job_type=self.processed_args['job_type'],
+                dry_run=self.processed_args['dry_run']
+            )
+
+    def inspect_pyenv(self):
+        from .pyenv import inspect_pyenv
+        inspect_pyenv(self.processed_args['path'], refresh=self.processed_args['refresh'])
+
     def list_jobs(self):
         """Launch TUI to list and browse jobs."""
         from .tui.app import run_tui
-        result = run_tui(mode="jobs", namespace=self.set_namespace, mouse=False)
+        result = run_tui(mode="jobs", namespace=self.set_namespace, mouse=False, label_selector=self.processed_args.get('selector'))
 
     def list_pods(self):
         """Launch TUI to list and browse pods."""
@@ -566,6 +1000,9 @@ class Jet():
         name = self.processed_args.get('name')
         kubectl_args = self.processed_args.get('kubectl_args', [])
         
+        import subprocess
+        from .credentials import kubectl_env
+
         # Build kubectl logs command
         if resource_type == 'job':
             cmd = ['kubectl', 'logs', f'job/{name}', '-n', self.set_namespace] + kubectl_args
@@ -573,7 +1010,7 @@ class Jet():
             cmd = ['kubectl', 'logs', name, '-n', self.set_namespace] + kubectl_args
         
         try:
-            subprocess.run(cmd, check=False)
+            subprocess.run(cmd, check=False, env=kubectl_env())
         except Exception as e:
             print(f"Error getting logs: {e}")
 
@@ -584,11 +1021,14 @@ class Jet():
         namespace = self.processed_args.get('namespace') or self.set_namespace
         kubectl_args = self.processed_args.get('kubectl_args', [])
         
+        import subprocess
+        from .credentials import kubectl_env
+
         # Build kubectl describe command
         cmd = ['kubectl', 'describe', resource_type, name, '-n', namespace] + kubectl_args
         
         try:
-            subprocess.run(cmd, check=False)
+            subprocess.run(cmd, check=False, env=kubectl_env())
         except Exception as e:
             print(f"Error executing describe: {e}")
 
@@ -639,6 +1079,41 @@ class Jet():
         
         delete_resource(name=name, resource_type=resource_type, namespace=self.set_namespace, kubectl_args=kubectl_args)
 
+    def set_suspended(self):
+        """Suspend or resume jobs."""
+        from .governor import set_jobs_suspended
+        from .k8s_api import run_sync
+
+        suspend = self.processed_args['suspend']
+        action = 'suspended' if suspend else 'resumed'
+        results = run_sync(set_jobs_suspended, self.processed_args['names'], suspend,
+                           namespace=self.set_namespace, label_selector=self.processed_args['selector'])
+        if not results:
+            print(f"No unfinished jobs found matching {self.processed_args['selector']}")
+        for name, error in results:
+            if error:
+                print(f"\x1b[31mError:\x1b[0m job {name} could not be {action}: {error}")
+            else:
+                print(f"job.batch/{name} {action}")
+        if any(error for _, error in results):
+            sys.exit(1)
+
+    def wait_jobs(self):
+        """Wait for jobs to meet a condition and exit with the aggregated status."""
+        from .wait import wait_for_jobs
+        from .k8s_api import run_sync
+
+        args = self.processed_args
+        outcomes = run_sync(wait_for_jobs, args['names'], args['condition'], namespace=self.set_namespace,
+                            label_selector=args['selector'], timeout=args['timeout'])
+        if not outcomes:
+            print(f"No jobs found matching {args['selector']}")
+            sys.exit(1)
+        if any(outcome not in ('met', 'timeout') for outcome in outcomes.values()):
+            sys.exit(1)
+        if any(outcome == 'timeout' for outcome in outcomes.values()):
+            sys.exit(2)
+
     def show_resources(self):
         """Show cluster resource availability from kube-state-metrics."""
         from .utils import get_cluster_resources
@@ -652,7 +1127,14 @@ def run(args, command, subcommand=None):
     # Execute commands
     if command == 'launch':
         if subcommand == 'job':
-            jet.launch_job()
+            if isinstance(args, dict):
+                jet.launch_jobs()
+            else:
+                jet.launch_job()
+        elif subcommand == 'sweep':
+            jet.launch_sweep()
+        elif subcommand == 'pipeline':
+            jet.launch_pipeline()
         elif subcommand == 'jupyter':
             jet.launch_jupyter()
         elif subcommand == 'debug':
@@ -668,6 +1150,10 @@ def run(args, command, subcommand=None):
             jet.list_pods()
         else:
             jet.list_jobs()  # Default to listing jobs
+    elif command == 'templates':
+        jet.manage_templates()
+    elif command == 'pyenv':
+        jet.inspect_pyenv()
     elif command == 'get':
         jet.get_status()
     elif command == 'logs':
@@ -678,6 +1164,10 @@ def run(args, command, subcommand=None):
         jet.connect()
     elif command == 'delete':
         jet.delete()
+    elif command in ['suspend', 'resume']:
+        jet.set_suspended()
+    elif command == 'wait':
+        jet.wait_jobs()
     elif command in ['resources', 'res', 'r']:
         jet.show_resources()
 
@@ -694,16 +1184,28 @@ def cli():
         if args.jet_command == 'launch' and (not hasattr(args, 'launch_type') or args.launch_type is None):
             return print_help_and_exit(parser, 'launch')
 
-        # Handle case when 'launch job/jupyter/debug' is provided but no name
-        if args.jet_command == 'launch' and args.launch_type in ['job', 'jupyter', 'debug']:
-            if not hasattr(args, 'name') or args.name is None:
+        # Handle case when 'launch job/jupyter/debug/sweep' is provided but no name (bulk submissions can take names from the manifest)
+        if args.jet_command == 'launch' and args.launch_type in ['job', 'jupyter', 'debug', 'sweep']:
+            if (not hasattr(args, 'name') or args.name is None) and not getattr(args, 'from_manifest', None):
                 return print_help_and_exit(parser, f'launch_{args.launch_type}')
 
+        # Handle case when 'launch pipeline' is provided but no pipeline file
+        if args.jet_command == 'launch' and args.launch_type == 'pipeline' and not args.pipeline_file:
+            return print_help_and_exit(parser, 'launch_pipeline')
+
         # Handle case when 'launch service/svc' is provided but no name
         if args.jet_command == 'launch' and args.launch_type in ['service', 'svc']:
             if not hasattr(args, 'name') or args.name is None:
                 return print_help_and_exit(parser, 'launch_service')
 
+        # Handle case when 'templates' is provided but no action
+        if args.jet_command == 'templates' and args.templates_action is None:
+            return print_help_and_exit(parser, 'templates')
+
+        # Handle case when 'pyenv' is provided but no action
+        if args.jet_command == 'pyenv' and args.pyenv_action is None:
+            return print_help_and_exit(parser, 'pyenv')
+
         # Handle case when 'logs' is provided but no arguments
         if args.jet_command == 'logs' and (not hasattr(args, 'logs_args') or not args.logs_args):
             return print_help_and_exit(parser, 'logs')
@@ -716,6 +1218,14 @@ def cli():
         if args.jet_command == 'delete' and (not hasattr(args, 'delete_args') or not args.delete_args):
             return print_help_and_exit(parser, 'delete')
 
+        # Handle case when 'suspend'/'resume' is provided without job names or selector
+        if args.jet_command in ['suspend', 'resume'] and not args.names and not args.selector:
+            return print_help_and_exit(parser, args.jet_command)
+
+        # Handle case when 'wait' is provided without job names or selector
+        if args.jet_command == 'wait' and not args.names and not args.selector:
+            return print_help_and_exit(parser, 'wait')
+
         # Handle case when 'describe' is provided but insufficient arguments (need resource_type and name)
         if args.jet_command == 'describe':
             describe_args = args.describe_args if hasattr(args, 'describe_args') else []
@@ -736,6 +1246,10 @@ def cli():
             if len(positional_args) < 2:
                 return print_help_and_exit(parser, 'describe')
 
+        # Run kubeconfig exec plugins through the shared credential cache (for kr8s and kubectl child processes)
+        from .credentials import enable_credential_cache
+        enable_credential_cache()
+
         # Process arguments
         from .process_args import ProcessArguments
         processor = ProcessArguments(args)
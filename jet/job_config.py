@@ -50,7 +50,7 @@ class ContainerSpec:
     image_pull_policy: Optional[str] = None
     command: Optional[str] = None
     args: Optional[List[str]] = None
-    env: Dict[str, str] = field(default_factory=dict)
+    env: Dict[str, Any] = field(default_factory=dict)  # Values are strings, or valueFrom dicts
     working_dir: Optional[str] = None
     volume_mounts: Dict[str, str] = field(default_factory=dict)
     resources: ResourceSpec = field(default_factory=ResourceSpec)
@@ -74,6 +74,8 @@ class PodSpec:
     security_context: Dict[str, Any] = field(default_factory=dict)
     image_pull_secrets: List[str] = field(default_factory=list)
     labels: Dict[str, str] = field(default_factory=dict)  # Pod template metadata labels
+    annotations: Dict[str, str] = field(default_factory=dict)  # Pod template metadata annotations
+    subdomain: Optional[str] = None  # Headless Service name for pod DNS (<hostname>.<subdomain>)
 
     def validate(self):
         valid_policies = ['Always', 'OnFailure', 'Never']
@@ -87,14 +89,22 @@ class PodSpec:
             container.validate()
 
 
-# TODO: completionMode, backoffLimitPerIndex, activeDeadlineSeconds, podFailurePolicy
-# TODO: suspend (pause/resume the job), Others: podReplacementPolicy, manualSelector, selector, templateGeneration, revisionHistoryLimit, successPolicy
+POD_FAILURE_POLICY_ACTIONS = ['FailJob', 'FailIndex', 'Ignore', 'Count']
+
+
+# TODO: activeDeadlineSeconds
+# TODO: Others: podReplacementPolicy, manualSelector, selector, templateGeneration, revisionHistoryLimit, successPolicy
 @dataclass
 class JobSpec:
     parallelism: Optional[int] = None
     completions: Optional[int] = None
     backoff_limit: Optional[int] = None
     ttl_seconds_after_finished: Optional[int] = None
+    completion_mode: Optional[str] = None  # 'NonIndexed' (K8s default) or 'Indexed'
+    backoff_limit_per_index: Optional[int] = None  # Indexed jobs only
+    max_failed_indexes: Optional[int] = None  # Indexed jobs only, requires backoff_limit_per_index
+    pod_failure_policy: List[Dict[str, Any]] = field(default_factory=list)  # podFailurePolicy rules, evaluated in order
+    suspend: Optional[bool] = None  # Create the job suspended (no pods until resumed)
     template_spec: PodSpec = field(default_factory=PodSpec)
 
     def validate(self):
@@ -104,6 +114,30 @@ class JobSpec:
             raise ValueError("'completions' must be an integer >= 1")
         if self.backoff_limit is not None and self.backoff_limit < 0:
             raise ValueError("'backoff_limit' must be an integer >= 0")
+        if self.completion_mode is not None and self.completion_mode not in ('NonIndexed', 'Indexed'):
+            raise ValueError("'completion_mode' must be one of ['NonIndexed', 'Indexed']")
+        if self.completion_mode == 'Indexed' and self.completions is None:
+            raise ValueError("'completions' is required for Indexed jobs")
+        if self.backoff_limit_per_index is not None:
+            if self.completion_mode != 'Indexed':
+                raise ValueError("'backoff_limit_per_index' is only supported for Indexed jobs")
+            if self.backoff_limit_per_index < 0:
+                raise ValueError("'backoff_limit_per_index' must be an integer >= 0")
+        if self.max_failed_indexes is not None:
+            if self.backoff_limit_per_index is None:
+                raise ValueError("'max_failed_indexes' requires 'backoff_limit_per_index'")
+            if self.max_failed_indexes < 0 or self.max_failed_indexes > self.completions:
+                raise ValueError("'max_failed_indexes' must be an integer between 0 and 'completions'")
+        if self.pod_failure_policy:
+            if self.template_spec.restart_policy != 'Never':
+                raise ValueError("Pod failure policy requires restart policy 'Never'")
+            for rule in self.pod_failure_policy:
+                if rule.get('action') not in POD_FAILURE_POLICY_ACTIONS:
+                    raise ValueError(f"Pod failure policy action must be one of {POD_FAILURE_POLICY_ACTIONS}")
+                if ('onExitCodes' in rule) == ('onPodConditions' in rule):
+                    raise ValueError("Each pod failure policy rule needs exactly one of 'onExitCodes' or 'onPodConditions'")
+                if rule['action'] == 'FailIndex' and self.backoff_limit_per_index is None:
+                    raise ValueError("Pod failure policy action 'FailIndex' requires 'backoff_limit_per_index'")
         self.template_spec.validate()
 
 @dataclass
@@ -120,10 +154,13 @@ class JobConfig:
     
     # Extra fields for CLI control
     ports: List[Dict[str, Any]] = field(default_factory=list)
+    pod_group: Optional[Dict[str, Any]] = None  # Gang scheduling: {'provider', 'min_member', 'queue'}
+    distributed: Optional[Dict[str, Any]] = None  # Distributed training: {'launcher', 'nodes', 'nproc_per_node', 'master_port'}
     follow: bool = False
     dry_run: bool = False
     verbose: bool = False
     save_template: bool = False
+    fit_check: bool = True
 
     def validate(self):
         self.spec.validate()
@@ -191,7 +228,7 @@ class JobConfig:
             )
 
             # Env
-            env = {e['name']: str(e['value']) for e in cont.get('env', [])}
+            env = {e['name']: e['valueFrom'] if 'valueFrom' in e else str(e.get('value', '')) for e in cont.get('env', [])}
 
             # Volume Mounts
             vol_mounts = {vm['name']: vm['mountPath'] for vm in cont.get('volumeMounts', [])}
@@ -227,7 +264,9 @@ class JobConfig:
             containers=containers,
             security_context=template_spec_data.get('securityContext', {}),
             image_pull_secrets=image_pull_secrets,
-            labels=template_metadata.get('labels', {})
+            labels=template_metadata.get('labels', {}),
+            annotations=template_metadata.get('annotations', {}),
+            subdomain=template_spec_data.get('subdomain')
         )
 
         job_spec = JobSpec(
@@ -235,11 +274,27 @@ class JobConfig:
             completions=spec_data.get('completions'),
             backoff_limit=spec_data.get('backoffLimit'),
             ttl_seconds_after_finished=spec_data.get('ttlSecondsAfterFinished'),
+            completion_mode=spec_data.get('completionMode'),
+            backoff_limit_per_index=spec_data.get('backoffLimitPerIndex'),
+            max_failed_indexes=spec_data.get('maxFailedIndexes'),
+            pod_failure_policy=spec_data.get('podFailurePolicy', {}).get('rules', []),
+            suspend=spec_data.get('suspend'),
             template_spec=pod_spec
         )
 
         return cls(metadata=metadata, spec=job_spec)
 
+    @classmethod
+    def from_fields(cls, data: Dict[str, Any]) -> 'JobConfig':
+        """Rebuild a JobConfig from dataclasses.asdict() output (lossless, unlike to_dict/from_dict)."""
+        spec = dict(data['spec'])
+        pod_spec = dict(spec['template_spec'])
+        pod_spec['volumes'] = [VolumeSpec(**v) for v in pod_spec['volumes']]
+        pod_spec['containers'] = [ContainerSpec(**dict(c, resources=ResourceSpec(**c['resources'])))
+                                  for c in pod_spec['containers']]
+        spec['template_spec'] = PodSpec(**pod_spec)
+        return cls(**dict(data, metadata=JobMetadata(**data['metadata']), spec=JobSpec(**spec)))
+
     def to_dict(self) -> Dict[str, Any]:
         # Validate before converting
         self.validate()
@@ -262,7 +317,8 @@ class JobConfig:
             if cont.working_dir:
                 c_dict['workingDir'] = cont.working_dir
             if cont.env:
-                c_dict['env'] = [{'name': k, 'value': str(v)} for k, v in cont.env.items()]
+                c_dict['env'] = [{'name': k, 'valueFrom': v} if isinstance(v, dict) else {'name': k, 'value': str(v)}
+                                 for k, v in cont.env.items()]
             if cont.volume_mounts:
                 c_dict['volumeMounts'] = [{'name': k, 'mountPath': v} for k, v in cont.volume_mounts.items()]
             if cont.security_context:
@@ -312,6 +368,8 @@ class JobConfig:
             pod_spec_dict['activeDeadlineSeconds'] = self.spec.template_spec.active_deadline_seconds
         if self.spec.template_spec.security_context:
             pod_spec_dict['securityContext'] = self.spec.template_spec.security_context
+        if self.spec.template_spec.subdomain:
+            pod_spec_dict['subdomain'] = self.spec.template_spec.subdomain
         if self.spec.template_spec.image_pull_secrets:
             pod_spec_dict['imagePullSecrets'] = [{'name': s} for s in self.spec.template_spec.image_pull_secrets]
         if k8s_volumes:
@@ -328,11 +386,26 @@ class JobConfig:
             job_spec_dict['backoffLimit'] = self.spec.backoff_limit
         if self.spec.ttl_seconds_after_finished is not None:
             job_spec_dict['ttlSecondsAfterFinished'] = self.spec.ttl_seconds_after_finished
+        if self.spec.completion_mode:
+            job_spec_dict['completionMode'] = self.spec.completion_mode
+        if self.spec.backoff_limit_per_index is not None:
+            job_spec_dict['backoffLimitPerIndex'] = self.spec.backoff_limit_per_index
+        if self.spec.max_failed_indexes is not None:
+            job_spec_dict['maxFailedIndexes'] = self.spec.max_failed_indexes
+        if self.spec.pod_failure_policy:
+            job_spec_dict['podFailurePolicy'] = {'rules': self.spec.pod_failure_policy}
+        if self.spec.suspend is not None:
+            job_spec_dict['suspend'] = self.spec.suspend
 
         # Build template with pod spec and metadata (for pod labels)
         template_dict = {'spec': pod_spec_dict}
+        template_metadata = {}
         if self.spec.template_spec.labels:
-            template_dict['metadata'] = {'labels': self.spec.template_spec.labels}
+            template_metadata['labels'] = self.spec.template_spec.labels
+        if self.spec.template_spec.annotations:
+            template_metadata['annotations'] = self.spec.template_spec.annotations
+        if template_metadata:
+            template_dict['metadata'] = template_metadata
         job_spec_dict['template'] = template_dict
 
         # Metadata
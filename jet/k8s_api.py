@@ -0,0 +1,488 @@
+"""Direct Kubernetes API access through a shared, pooled kr8s client.
+
+Coroutines executed with run_sync() run on kr8s' background event loop thread, so the
+kr8s API object (and its httpx connection pool) is created once per process and reused
+by every call instead of spawning a kubectl process per request.
+"""
+import json
+import time
+import asyncio
+import logging
+from functools import partial
+
+FIELD_MANAGER = 'jet'
+
+# Kind -> (API version, plural endpoint, namespaced) for the resources jet works with.
+# Kinds not listed here are resolved through API discovery (cached by kr8s).
+_RESOURCE_ENDPOINTS = {
+    'Job': ('batch/v1', 'jobs', True),
+    'Pod': ('v1', 'pods', True),
+    'Service': ('v1', 'services', True),
+    'ConfigMap': ('v1', 'configmaps', True),
+    'Event': ('v1', 'events', True),
+}
+
+
+# Seconds to wait for kr8s' event loop thread to start
+_PORTAL_START_TIMEOUT_SECONDS = 10
+
+# Blocking portal of kr8s' event loop thread, once started
+_blocking_portal = None
+
+
+def _portal():
+    """
+    Blocking portal of kr8s' background event loop thread.
+
+    kr8s.Portal is private API (the kr8s versions it is known to work with are pinned in
+    pyproject.toml). On first use its thread has to start the loop; if it does not within
+    _PORTAL_START_TIMEOUT_SECONDS, or the thread died, a RuntimeError is raised instead of
+    waiting forever.
+    """
+    global _blocking_portal
+    if _blocking_portal is not None:
+        return _blocking_portal
+
+    try:
+        from kr8s._async_utils import Portal
+        portal = Portal()
+    except (ImportError, AttributeError, TypeError) as e:
+        raise RuntimeError(f"Unsupported kr8s version: cannot use its event loop thread ({e})") from e
+
+    deadline = time.monotonic() + _PORTAL_START_TIMEOUT_SECONDS
+    delay = 0.001
+    while getattr(portal, '_portal', None) is None:
+        thread = getattr(portal, 'thread', None)
+        if thread is not None and not thread.is_alive():
+            raise RuntimeError("kr8s' event loop thread exited before it started")
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"kr8s' event loop thread did not start within {_PORTAL_START_TIMEOUT_SECONDS}s "
+                               "(unsupported kr8s version?)")
+        time.sleep(delay)
+        delay = min(delay * 2, 0.05)
+    _blocking_portal = portal._portal
+    return _blocking_portal
+
+
+def run_sync(coro_fn, *args, **kwargs):
+    """
+    Run a coroutine function on kr8s' shared event loop thread and block until it finishes.
+
+    Using kr8s' loop (rather than asyncio.run) keeps a single API client alive for the whole
+    process. A KeyboardInterrupt cancels the running coroutine before being re-raised.
+    """
+    future = _portal().start_task_soon(partial(coro_fn, *args, **kwargs))
+    try:
+        return future.result()
+    except KeyboardInterrupt:
+        future.cancel()
+        raise
+
+
+def iterate_sync(agen_fn, *args, **kwargs):
+    """
+    Iterate an async generator function on kr8s' shared event loop thread (see run_sync).
+
+    Items are handed over through a queue as they are produced. Closing the iterator early
+    (or a KeyboardInterrupt) cancels the async generator.
+    """
+    import queue
+
+    items = queue.Queue()
+    end = object()
+
+    async def pump():
+        error = None
+        try:
+            async for item in agen_fn(*args, **kwargs):
+                items.put((item, None))
+        except Exception as e:
+            error = e
+        finally:
+            items.put((end, error))
+
+    future = _portal().start_task_soon(pump)
+    try:
+        while True:
+            item, error = items.get()
+            if item is end:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        future.cancel()
+
+
+async def get_api():
+    """
+    Get the process-wide async kr8s API client (created on first use).
+
+    Uses the generated kubeconfig of the exec credential cache when the CLI enabled it.
+    """
+    import kr8s.asyncio
+    from .credentials import kubeconfig_path
+
+    kubeconfig = kubeconfig_path()
+    return await (kr8s.asyncio.api(kubeconfig=kubeconfig) if kubeconfig else kr8s.asyncio.api())
+
+
+async def _resource_endpoint(api, kind):
+    """Return (API version, plural, namespaced) for a resource kind."""
+    if kind in _RESOURCE_ENDPOINTS:
+        return _RESOURCE_ENDPOINTS[kind]
+    # kr8s returns '<singular>.<group>/<version>' or '<singular>/v1' for core kinds
+    qualified_kind, plural, namespaced = await api.async_lookup_kind(kind)
+    version = qualified_kind.split('.', 1)[1] if '.' in qualified_kind else qualified_kind.split('/', 1)[1]
+    _RESOURCE_ENDPOINTS[kind] = (version, plural, namespaced)
+    return _RESOURCE_ENDPOINTS[kind]
+
+
+async def apply_resource(resource, api=None, field_manager=FIELD_MANAGER, force=True):
+    """
+    Create or update a resource using server-side apply in a single API request.
+
+    Args:
+        resource (dict): Full resource manifest (apiVersion, kind, metadata, spec).
+        api: Optional kr8s async API client. Defaults to the shared client.
+        field_manager (str): Field manager name recorded by the API server.
+        force (bool): Take ownership of fields managed by other managers (e.g. kubectl).
+
+    Returns:
+        tuple: (applied object as returned by the API server, True if it was created)
+    """
+    api = api or await get_api()
+    metadata = resource['metadata']
+    _, plural, namespaced = await _resource_endpoint(api, resource['kind'])
+    namespace = (metadata.get('namespace') or api.namespace) if namespaced else None
+
+    params = {'fieldManager': field_manager}
+    if force:
+        params['force'] = 'true'
+
+    logging.debug(f"Applying {resource['kind']} {metadata['name']} (namespace: {namespace})")
+    async with api.call_api(
+        'PATCH',
+        version=resource['apiVersion'],
+        namespace=namespace,
+        url=f"{plural}/{metadata['name']}",
+        params=params,
+        # JSON is valid YAML, so the manifest can be sent as an apply patch as-is
+        content=json.dumps(resource),
+        headers={'Content-Type': 'application/apply-patch+yaml'},
+    ) as response:
+        return response.json(), response.status_code == 201
+
+
+async def list_resources(kind, namespace=None, label_selector=None, api=None, field_selector=None):
+    """
+    List resources in a single request.
+
+    Args:
+        kind (str): Resource kind (e.g. 'Job').
+        namespace (str): Namespace. Defaults to the client's namespace.
+        label_selector (str): Optional label selector.
+        api: Optional kr8s async API client. Defaults to the shared client.
+        field_selector (str): Optional field selector.
+
+    Returns:
+        tuple: (list of raw resource dicts, list resourceVersion to start a watch from)
+    """
+    api = api or await get_api()
+    version, plural, namespaced = await _resource_endpoint(api, kind)
+    params = {}
+    if label_selector:
+        params['labelSelector'] = label_selector
+    if field_selector:
+        params['fieldSelector'] = field_selector
+
+    async with api.call_api(
+        'GET',
+        version=version,
+        namespace=(namespace or api.namespace) if namespaced else None,
+        url=plural,
+        params=params or None,
+    ) as response:
+        data = response.json()
+    return data.get('items', []), data.get('metadata', {}).get('resourceVersion')
+
+
+class ResourceWatch:
+    """
+    List + watch of a resource kind that survives connection drops without relisting.
+
+    The watch requests bookmarks, so the last seen resourceVersion stays current even when no
+    matching object changes, and every reconnect (connection errors, watches ended by the API
+    server) resumes from it. Objects are only listed again when the API server no longer has
+    that resourceVersion (410 Gone); objects that disappeared in the meantime are then
+    reported as DELETED, so callers keeping state never miss a deletion.
+
+    Attributes:
+        resource_version (str): Last seen resourceVersion.
+        reconnects (int): Watch connections re-established after an error.
+        relists (int): Lists done because the resourceVersion expired.
+        bookmarks (int): Bookmark events received.
+    """
+
+    # Watches are ended by the API server after this many seconds and resumed by the client
+    TIMEOUT_SECONDS = 300
+
+    # Delay before reconnecting after an error, doubled per consecutive error
+    RECONNECT_DELAY_SECONDS = 1
+    MAX_RECONNECT_DELAY_SECONDS = 30
+
+    def __init__(self, kind, namespace=None, label_selector=None, field_selector=None, api=None):
+        self.kind = kind
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.resource_version = None
+        self.reconnects = 0
+        self.relists = 0
+        self.bookmarks = 0
+        self._api = api
+        self._known = {}  # (namespace, name) -> last seen object
+
+    def stats(self):
+        """Watch counters, for diagnostics."""
+        return {'resource_version': self.resource_version, 'reconnects': self.reconnects,
+                'relists': self.relists, 'bookmarks': self.bookmarks}
+
+    @staticmethod
+    def _key(obj):
+        return obj['metadata'].get('namespace'), obj['metadata']['name']
+
+    async def list(self):
+        """
+        List the objects and remember the resourceVersion to watch from.
+
+        Returns:
+            list[dict]: Raw objects.
+        """
+        self._api = self._api or await get_api()
+        items, self.resource_version = await list_resources(
+            self.kind, namespace=self.namespace, label_selector=self.label_selector,
+            field_selector=self.field_selector, api=self._api)
+        self._known = {self._key(item): item for item in items}
+        return items
+
+    async def _relist(self):
+        """List again after the resourceVersion expired; yields the differences as watch events."""
+        previous = self._known
+        self.relists += 1
+        logging.debug(f"{self.kind} watch resourceVersion expired, listing again ({self.relists} relists)")
+        for item in await self.list():
+            old = previous.pop(self._key(item), None)
+            if old is None:
+                yield 'ADDED', item
+            elif old['metadata'].get('resourceVersion') != item['metadata'].get('resourceVersion'):
+                yield 'MODIFIED', item
+        for item in previous.values():
+            yield 'DELETED', item
+
+    async def _watch_once(self):
+        """Stream watch events from the current resourceVersion until the API server ends the watch."""
+        from .codec import json_loads
+
+        version, plural, namespaced = await _resource_endpoint(self._api, self.kind)
+        params = {'watch': 'true', 'allowWatchBookmarks': 'true', 'resourceVersion': self.resource_version,
+                  'timeoutSeconds': str(self.TIMEOUT_SECONDS)}
+        if self.label_selector:
+            params['labelSelector'] = self.label_selector
+        if self.field_selector:
+            params['fieldSelector'] = self.field_selector
+
+        async with self._api.call_api(
+            'GET',
+            version=version,
+            namespace=(self.namespace or self._api.namespace) if namespaced else None,
+            url=plural,
+            params=params,
+            stream=True,
+            # The API server ends the watch first; this only catches dead connections
+            timeout=self.TIMEOUT_SECONDS + 30,
+        ) as response:
+            async for line in response.aiter_lines():
+                if line.strip():
+                    yield json_loads(line)
+
+    async def events(self):
+        """
+        Yield (event type, raw object) for every change, reconnecting as needed. Objects that
+        exist when the watch starts are yielded as ADDED unless list() was called first.
+        """
+        import httpx
+        import kr8s
+
+        if self.resource_version is None:
+            for item in await self.list():
+                yield 'ADDED', item
+
+        errors = 0
+        while True:
+            expired = False
+            try:
+                async for event in self._watch_once():
+                    event_type, obj = event.get('type'), event.get('object', {})
+                    if event_type == 'ERROR':
+                        # Status object, e.g. 410 when the resourceVersion is too old
+                        if obj.get('code') == 410:
+                            expired = True
+                        else:
+                            errors += 1
+                            logging.debug(f"{self.kind} watch error: {obj.get('message')}")
+                        break
+                    self.resource_version = obj.get('metadata', {}).get('resourceVersion', self.resource_version)
+                    errors = 0
+                    if event_type == 'BOOKMARK':
+                        self.bookmarks += 1
+                        continue
+                    if event_type == 'DELETED':
+                        self._known.pop(self._key(obj), None)
+                    else:
+                        self._known[self._key(obj)] = obj
+                    yield event_type, obj
+            except kr8s.ServerError as e:
+                code = e.response.status_code if e.response is not None else None
+                if code == 410:
+                    expired = True
+                elif code is not None and code < 500 and code != 429:
+                    raise
+                else:
+                    errors += 1
+                    logging.debug(f"{self.kind} watch server error: {e}")
+            except (httpx.HTTPError, kr8s._exceptions.ConnectionClosedError, kr8s._exceptions.APITimeoutError) as e:
+                # kr8s raises read/connect timeouts of the stream (dead connections) as APITimeoutError
+                errors += 1
+                logging.debug(f"{self.kind} watch connection error: {e}")
+
+            if expired:
+                async for item in self._relist():
+                    yield item
+            elif errors:
+                self.reconnects += 1
+                delay = min(self.RECONNECT_DELAY_SECONDS * 2 ** (errors - 1), self.MAX_RECONNECT_DELAY_SECONDS)
+                logging.warning(f"{self.kind} watch connection lost. Resuming in {delay}s ({self.reconnects} reconnects)")
+                await asyncio.sleep(delay)
+
+
+async def get_resource(kind, name, namespace=None, api=None):
+    """
+    Get a single resource.
+
+    Returns:
+        dict: Raw resource, or None if it does not exist.
+    """
+    import kr8s
+
+    api = api or await get_api()
+    version, plural, namespaced = await _resource_endpoint(api, kind)
+    try:
+        async with api.call_api(
+            'GET',
+            version=version,
+            namespace=(namespace or api.namespace) if namespaced else None,
+            url=f"{plural}/{name}",
+        ) as response:
+            return response.json()
+    except kr8s.ServerError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return None
+        raise
+
+
+async def delete_resource(kind, name, namespace=None, api=None, propagation_policy='Background'):
+    """
+    Delete a resource. Dependents (e.g. the pods of a Job) are garbage collected per the propagation policy.
+
+    Returns:
+        bool: True if the resource was deleted, False if it did not exist.
+    """
+    import kr8s
+
+    api = api or await get_api()
+    version, plural, namespaced = await _resource_endpoint(api, kind)
+    try:
+        async with api.call_api(
+            'DELETE',
+            version=version,
+            namespace=(namespace or api.namespace) if namespaced else None,
+            url=f"{plural}/{name}",
+            content=json.dumps({'propagationPolicy': propagation_policy}),
+        ):
+            return True
+    except kr8s.ServerError as e:
+        if e.response is not None and e.response.status_code == 404:
+            return False
+        raise
+
+
+async def patch_resource(kind, name, patch, namespace=None, api=None, field_manager=FIELD_MANAGER):
+    """
+    Apply a JSON merge patch to a resource.
+
+    Returns:
+        dict: Patched object as returned by the API server.
+    """
+    api = api or await get_api()
+    version, plural, namespaced = await _resource_endpoint(api, kind)
+
+    async with api.call_api(
+        'PATCH',
+        version=version,
+        namespace=(namespace or api.namespace) if namespaced else None,
+        url=f"{plural}/{name}",
+        params={'fieldManager': field_manager},
+        content=json.dumps(patch),
+        headers={'Content-Type': 'application/merge-patch+json'},
+    ) as response:
+        return response.json()
+
+
+def owner_reference(obj, controller=False):
+    """ownerReference to an applied object, so that dependent resources are garbage collected with it."""
+    return {
+        'apiVersion': obj['apiVersion'],
+        'kind': obj['kind'],
+        'name': obj['metadata']['name'],
+        'uid': obj['metadata']['uid'],
+        'controller': controller,
+        'blockOwnerDeletion': True,
+    }
+
+
+async def apply_job_with_dependents(job, build_dependents, hold_suspended=False, api=None):
+    """
+    Apply a Job and resources that belong to it (PodGroup, headless Service, ...).
+
+    Args:
+        job (dict): Job manifest.
+        build_dependents (callable): Called with the applied Job; returns the dependent manifests.
+        hold_suspended (bool): Create the Job suspended and only resume it once its dependents
+            exist, so that no pod is created before them (unless the Job was requested suspended).
+            A Job that already exists is applied unchanged: suspending it would delete its running pods.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        tuple: (applied Job, list of applied dependents, True if the Job was created)
+    """
+    api = api or await get_api()
+    keep_suspended = job['spec'].get('suspend', False)
+
+    if hold_suspended:
+        existing = await get_resource('Job', job['metadata']['name'],
+                                      namespace=job['metadata'].get('namespace'), api=api)
+        hold_suspended = existing is None
+    if hold_suspended:
+        job = dict(job, spec=dict(job['spec'], suspend=True))
+    applied_job, created = await apply_resource(job, api=api)
+
+    applied_dependents = []
+    for dependent in build_dependents(applied_job):
+        applied, _ = await apply_resource(dependent, api=api)
+        applied_dependents.append(applied)
+
+    if hold_suspended and not keep_suspended:
+        applied_job = await patch_resource('Job', job['metadata']['name'], {'spec': {'suspend': False}},
+                                           namespace=applied_job['metadata']['namespace'], api=api)
+    return applied_job, applied_dependents, created
@@ -1,6 +1,6 @@
 # List of event names from https://github.com/kubernetes/kubernetes/blob/master/pkg/kubelet/events/event.go
 
-K8S_EVENTS = [
+K8S_EVENTS = frozenset([
     # Container events
     "Created",
     "Started",
@@ -95,8 +95,4 @@ K8S_EVENTS = [
     # Controller events
     "FailedCreate",
     "FailedDelete",
-    "SuccessfulCreate",
-    "SuccessfulDelete",
-
-
-]
\ No newline at end of file
+])
@@ -0,0 +1,254 @@
+"""Job pipelines: a DAG of stages, each submitted as soon as the stages it depends on complete."""
+import copy
+import time
+import logging
+from pathlib import Path
+
+
+# Labels put on every stage job (and its pods) so a pipeline can be listed/watched as one group
+PIPELINE_LABEL = 'jet-pipeline'
+STAGE_LABEL = 'jet-pipeline-stage'
+
+# Kubernetes object names (and label values) are limited to 63 characters
+_MAX_NAME_LENGTH = 63
+
+# Stage keys handled here; all other keys are manifest overrides (see bulk.apply_overrides)
+_STAGE_KEYS = {'name', 'depends_on', 'depends-on'}
+
+
+def load_pipeline(path):
+    """
+    Load a pipeline file.
+
+    Format (YAML or JSON)::
+
+        name: my-pipeline          # optional, defaults to the file name
+        volumes:                   # shared volumes mounted in every stage (same format as --volume)
+          - /data/runs/my-pipeline:/workspace/shared
+        defaults:                  # overrides applied to every stage
+          image: my-image
+        stages:
+          - name: preprocess
+            command: python preprocess.py --out /workspace/shared/data
+          - name: train
+            depends_on: preprocess
+            gpu: 4
+            command: python train.py --data /workspace/shared/data
+
+    Returns:
+        dict: 'name', 'volumes', 'defaults' and 'stages' (list of dicts with 'name', 'depends_on'
+            and 'overrides').
+    """
+    from .codec import yaml_load
+
+    path = Path(path).expanduser()
+    if not path.is_file():
+        raise ValueError(f"Pipeline file not found: {path}")
+    with path.open() as f:
+        data = yaml_load(f) or {}
+
+    if isinstance(data, list):
+        data = {'stages': data}
+    if not isinstance(data, dict) or not isinstance(data.get('stages'), list) or not data['stages']:
+        raise ValueError(f"Pipeline {path} must contain a non-empty 'stages' list")
+
+    stages = []
+    for i, stage in enumerate(data['stages']):
+        if not isinstance(stage, dict) or not stage.get('name'):
+            raise ValueError(f"Stage {i} of pipeline {path} must be a mapping with a 'name'")
+        depends_on = stage.get('depends_on', stage.get('depends-on')) or []
+        if isinstance(depends_on, str):
+            depends_on = [d.strip() for d in depends_on.split(',') if d.strip()]
+        stages.append({
+            'name': str(stage['name']),
+            'depends_on': [str(d) for d in depends_on],
+            'overrides': {k: v for k, v in stage.items() if k not in _STAGE_KEYS},
+        })
+
+    volumes = data.get('volumes') or []
+    if isinstance(volumes, str):
+        volumes = [volumes]
+
+    return {
+        'name': str(data['name']) if data.get('name') else path.stem.replace('_', '-').lower(),
+        'volumes': [str(v) for v in volumes],
+        'defaults': data.get('defaults') or {},
+        'stages': stages,
+    }
+
+
+def topological_order(stages):
+    """
+    Validate the stage graph and return stage names in dependency order.
+
+    Raises:
+        ValueError: On duplicate stage names, unknown dependencies or dependency cycles.
+    """
+    dependencies = {}
+    for stage in stages:
+        if stage['name'] in dependencies:
+            raise ValueError(f"Duplicate stage name '{stage['name']}'")
+        dependencies[stage['name']] = stage['depends_on']
+
+    for name, deps in dependencies.items():
+        for dep in deps:
+            if dep not in dependencies:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dep}'")
+            if dep == name:
+                raise ValueError(f"Stage '{name}' depends on itself")
+
+    # Kahn's algorithm, keeping file order among stages that are ready at the same time
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    order = []
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between stages: {', '.join(sorted(remaining))}")
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return order
+
+
+def stage_job_name(pipeline_name, stage_name):
+    """Job name of a pipeline stage (e.g. my-pipeline-train)."""
+    name = f"{pipeline_name}-{stage_name}"
+    if len(name) > _MAX_NAME_LENGTH:
+        raise ValueError(f"Stage job name '{name}' exceeds {_MAX_NAME_LENGTH} characters. Use shorter pipeline or stage names")
+    return name
+
+
+def build_stage_jobs(base_config, pipeline):
+    """
+    Derive one JobConfig per stage from the base config.
+
+    Pipeline defaults and then stage overrides are applied on top of the base config. Stage
+    jobs are labelled with the pipeline and stage names and get them in JET_PIPELINE and
+    JET_PIPELINE_STAGE env variables.
+
+    Args:
+        base_config: JobConfig resolved from the template and CLI options.
+        pipeline (dict): Pipeline as returned by load_pipeline().
+
+    Returns:
+        dict: Stage name -> JobConfig, in dependency order.
+    """
+    from .bulk import apply_overrides
+
+    order = topological_order(pipeline['stages'])
+    stages = {stage['name']: stage for stage in pipeline['stages']}
+    pipeline_name = pipeline['name']
+
+    if pipeline['defaults']:
+        apply_overrides(base_config, pipeline['defaults'])
+
+    jobs = {}
+    for stage_name in order:
+        job_config = copy.deepcopy(base_config)
+        apply_overrides(job_config, stages[stage_name]['overrides'])
+        job_config.metadata.name = stage_job_name(pipeline_name, stage_name)
+
+        labels = {PIPELINE_LABEL: pipeline_name, STAGE_LABEL: stage_name}
+        job_config.metadata.labels.update(labels)
+        job_config.spec.template_spec.labels.update(labels)
+        container = job_config.spec.template_spec.containers[0]
+        container.env.update({'JET_PIPELINE': pipeline_name, 'JET_PIPELINE_STAGE': stage_name})
+        jobs[stage_name] = job_config
+    return jobs
+
+
+async def run_pipeline(jobs, dependencies, namespace, label_selector, concurrency=32, qps=None, api=None):
+    """
+    Execute a pipeline: submit each stage as soon as all of its dependencies complete.
+
+    Stage state is followed with a single list + watch on the pipeline label, so a stage is
+    submitted in the same watch event that reports its last dependency as complete. Stages
+    depending on a failed (or deleted) stage are skipped; independent branches keep running.
+    Stage jobs that already exist (e.g. when re-running a pipeline) are picked up in their
+    current state, so completed stages are not run again.
+
+    Args:
+        jobs (dict): Stage name -> Job manifest, in dependency order.
+        dependencies (dict): Stage name -> list of stage names it depends on.
+        namespace (str): Kubernetes namespace.
+        label_selector (str): Label selector matching all stage jobs of the pipeline.
+        concurrency (int): Maximum number of concurrent submissions.
+        qps (float): Client-side limit on API requests per second.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        dict: Stage name -> final state ('complete', 'failed', 'skipped' or 'deleted').
+    """
+    from .bulk import submit_many
+    from .governor import job_phase
+    from .k8s_api import get_api, ResourceWatch
+
+    api = api or await get_api()
+    start = time.monotonic()
+    job_stages = {job['metadata']['name']: stage for stage, job in jobs.items()}
+    states = {stage: 'pending' for stage in jobs}
+
+    def report(stage, state):
+        print(f"[{time.monotonic() - start:7.1f}s] {stage}: {state}")
+
+    watch = ResourceWatch('Job', namespace=namespace, label_selector=label_selector, api=api)
+    for job in await watch.list():
+        stage = job_stages.get(job['metadata']['name'])
+        if stage:
+            phase = job_phase(job)
+            states[stage] = 'running' if phase == 'suspended' else phase
+            report(stage, f"{states[stage]} (existing job)")
+
+    async def advance():
+        """Skip stages with a failed dependency and submit stages whose dependencies are all complete."""
+        changed = True
+        while changed:
+            changed = False
+            for stage in jobs:
+                if states[stage] == 'pending' and any(states[d] in ('failed', 'skipped', 'deleted') for d in dependencies[stage]):
+                    states[stage] = 'skipped'
+                    report(stage, 'skipped')
+                    changed = True
+
+        ready = [stage for stage in jobs
+                 if states[stage] == 'pending' and all(states[d] == 'complete' for d in dependencies[stage])]
+        if not ready:
+            return
+        for stage in ready:
+            states[stage] = 'running'
+        results = await submit_many([jobs[stage] for stage in ready], concurrency=concurrency, qps=qps, api=api)
+        for stage, result in zip(ready, results):
+            if result.ok:
+                report(stage, f"submitted job {result.name}")
+            else:
+                states[stage] = 'failed'
+                report(stage, f"submission failed: {result.error}")
+        if any(not r.ok for r in results):
+            await advance()
+
+    def done():
+        return all(state not in ('pending', 'running') for state in states.values())
+
+    await advance()
+
+    if done():
+        return states
+    async for event, job in watch.events():
+        stage = job_stages.get(job['metadata']['name'])
+        if not stage or states[stage] != 'running':
+            continue
+
+        phase = 'deleted' if event == 'DELETED' else job_phase(job)
+        if phase not in ('complete', 'failed', 'deleted'):
+            continue
+        states[stage] = phase
+        report(stage, phase)
+        logging.debug(f"Stage {stage} finished with state {phase}")
+
+        await advance()
+        if done():
+            break
+
+    return states
@@ -1,10 +1,7 @@
 import os
 import pwd
-import subprocess
 import logging
-import configparser
 from pathlib import Path
-import yaml
 from .utils import TemplateManager
 from .defaults import *
 
@@ -12,12 +9,16 @@ from .defaults import *
 class ProcessArguments:
     def __init__(self, args):
         self.args = args
-        self.template_manager = TemplateManager(templates_dir=JET_HOME / "templates")
+        self.template_manager = TemplateManager()
         
     def process(self):
         if self.args.jet_command == 'launch':
             if self.args.launch_type == 'job':
                 return self._process_launch_job()
+            elif self.args.launch_type == 'sweep':
+                return self._process_launch_sweep()
+            elif self.args.launch_type == 'pipeline':
+                return self._process_launch_pipeline()
             elif self.args.launch_type == 'jupyter':
                 return self._process_launch_jupyter()
             elif self.args.launch_type == 'debug':
@@ -33,6 +34,10 @@ class ProcessArguments:
                 return self._process_list_pods()
             else:
                 return self._process_list_jobs()  # Default to listing jobs
+        elif self.args.jet_command == 'templates':
+            return self._process_templates()
+        elif self.args.jet_command == 'pyenv':
+            return self._process_pyenv()
         elif self.args.jet_command == 'get':
             return self._process_get()
         elif self.args.jet_command == 'logs':
@@ -43,17 +48,173 @@ class ProcessArguments:
             return self._process_connect()
         elif self.args.jet_command == 'delete':
             return self._process_delete()
+        elif self.args.jet_command in ['suspend', 'resume']:
+            return self._process_suspend_resume()
+        elif self.args.jet_command == 'wait':
+            return self._process_wait()
         elif self.args.jet_command in ['resources', 'res', 'r']:
             return self._process_resources()
         
     def _process_launch_job(self):
 
-        return self._generate_specs(
+        if getattr(self.args, 'from_manifest', None):
+            return self._process_launch_job_manifest()
+        if self.args.max_running is not None:
+            raise ValueError("--max-running requires --from-manifest")
+
+        job_config = self._generate_specs(
             job_type='job',
-            backoff_limit=self.args.backoff_limit if hasattr(self.args, 'backoff_limit') and self.args.backoff_limit is not None else DEFAULT_BACKOFF_LIMIT,
+            backoff_limit=self._job_backoff_limit(),
             ttl_seconds_after_finished=DEFAULT_JOB_TTL_SECONDS_AFTER_FINISHED # Argument currently not implemented, defaulted to 15 days
         )
+
+        if self.args.distributed:
+            from .distributed import configure_distributed
+            configure_distributed(job_config, self.args.distributed, self.args.nodes,
+                                  gpus_per_node=self.args.gpus_per_node, master_port=self.args.master_port)
+        elif self.args.nodes is not None or self.args.gpus_per_node is not None:
+            raise ValueError("--nodes and --gpus-per-node require --distributed")
+
+        if self.args.gang:
+            from .gang import configure_gang
+            configure_gang(job_config, min_member=self.args.gang_min_member, queue=self.args.queue)
+        elif self.args.gang_min_member is not None or self.args.queue:
+            raise ValueError("--gang-min-member and --queue require --gang")
+
+        return job_config
     
+    def _job_backoff_limit(self):
+        """Job-wide backoff limit. With per-index retries it is only set when explicitly requested."""
+        if self.args.backoff_limit is not None:
+            return self.args.backoff_limit
+        # Sweeps and pipelines have no per-index retries
+        if getattr(self.args, 'backoff_limit_per_index', None) is not None:
+            return None
+        return DEFAULT_BACKOFF_LIMIT
+
+    def _process_launch_job_manifest(self):
+        """Build one JobConfig per manifest entry on top of a single base config."""
+        import copy
+        from .bulk import load_manifest, apply_overrides, BATCH_LABEL
+
+        if self.args.max_running is not None and self.args.max_running < 1:
+            raise ValueError("--max-running must be an integer >= 1")
+
+        rows = load_manifest(self.args.from_manifest)
+        if not rows:
+            raise ValueError(f"Manifest {self.args.from_manifest} has no entries")
+
+        # Job name (or manifest file name) is the prefix for entries without an explicit name
+        if not self.args.name:
+            self.args.name = Path(self.args.from_manifest).stem.replace('_', '-').lower()
+
+        # Template/CLI options are resolved once and shared by all entries
+        base_config = self._generate_specs(
+            job_type='job',
+            backoff_limit=self._job_backoff_limit(),
+            ttl_seconds_after_finished=DEFAULT_JOB_TTL_SECONDS_AFTER_FINISHED
+        )
+        prefix = base_config.metadata.name
+
+        # Label all jobs of the batch so they can be listed, resumed and governed as a group
+        base_config.metadata.labels[BATCH_LABEL] = prefix
+        base_config.spec.template_spec.labels[BATCH_LABEL] = prefix
+
+        job_configs = []
+        seen_names = set()
+        for i, overrides in enumerate(rows):
+            job_config = copy.deepcopy(base_config)
+            job_config.metadata.name = f"{prefix}-{i}"
+            apply_overrides(job_config, overrides)
+            if job_config.metadata.name in seen_names:
+                raise ValueError(f"Duplicate job name '{job_config.metadata.name}' in manifest {self.args.from_manifest}")
+            seen_names.add(job_config.metadata.name)
+            job_configs.append(job_config)
+
+        return {
+            'jobs': job_configs,
+            'selector': f"{BATCH_LABEL}={prefix}",
+            'max_running': self.args.max_running,
+            'namespace': self.args.namespace,
+            'concurrency': self.args.concurrency or DEFAULT_BULK_CONCURRENCY,
+            'qps': self.args.qps if self.args.qps is not None else DEFAULT_BULK_QPS,
+            'report': self.args.report,
+            'dry_run': base_config.dry_run,
+            'verbose': base_config.verbose,
+        }
+
+    def _process_launch_sweep(self):
+        """Expand the sweep parameter space and derive one Job manifest per trial from a single base spec."""
+        from .sweep import expand_space, build_trials, SWEEP_LABEL
+
+        if self.args.max_running is not None and self.args.max_running < 1:
+            raise ValueError("--max-running must be an integer >= 1")
+
+        trial_list = None
+        if self.args.params_file:
+            from .bulk import load_manifest
+            trial_list = load_manifest(self.args.params_file)
+
+        trial_params = expand_space(
+            grid=self.args.grid,
+            random_params=self.args.random,
+            trials=self.args.trials,
+            seed=self.args.seed,
+            trial_list=trial_list
+        )
+
+        # Template and CLI options are resolved once; trials only differ in names, labels, env and command
+        base_config = self._generate_specs(
+            job_type='job',
+            backoff_limit=self._job_backoff_limit(),
+            ttl_seconds_after_finished=DEFAULT_JOB_TTL_SECONDS_AFTER_FINISHED
+        )
+        sweep_name = base_config.metadata.name
+
+        return {
+            'sweep': sweep_name,
+            'selector': f"{SWEEP_LABEL}={sweep_name}",
+            'trials': build_trials(base_config.to_dict(), sweep_name, trial_params),
+            'max_running': self.args.max_running,
+            'namespace': self.args.namespace,
+            'concurrency': self.args.concurrency or DEFAULT_BULK_CONCURRENCY,
+            'qps': self.args.qps if self.args.qps is not None else DEFAULT_BULK_QPS,
+            'report': self.args.report,
+            'dry_run': base_config.dry_run,
+            'verbose': base_config.verbose,
+        }
+
+    def _process_launch_pipeline(self):
+        """Load the pipeline file and derive one JobConfig per stage from a single base spec."""
+        from .pipeline import load_pipeline, build_stage_jobs, PIPELINE_LABEL
+
+        pipeline = load_pipeline(self.args.pipeline_file)
+        if self.args.name:
+            pipeline['name'] = self.args.name
+        # The base spec is named after the pipeline; stage jobs are renamed to <pipeline>-<stage>
+        self.args.name = pipeline['name']
+
+        # Shared volumes (e.g. for passing outputs between stages) are mounted in every stage
+        if pipeline['volumes']:
+            self.args.volume = (self.args.volume or []) + [pipeline['volumes']]
+
+        base_config = self._generate_specs(
+            job_type='job',
+            backoff_limit=self._job_backoff_limit(),
+            ttl_seconds_after_finished=DEFAULT_JOB_TTL_SECONDS_AFTER_FINISHED
+        )
+        stage_jobs = build_stage_jobs(base_config, pipeline)
+
+        return {
+            'pipeline': pipeline['name'],
+            'selector': f"{PIPELINE_LABEL}={pipeline['name']}",
+            'jobs': stage_jobs,
+            'dependencies': {stage['name']: stage['depends_on'] for stage in pipeline['stages']},
+            'namespace': self.args.namespace,
+            'dry_run': base_config.dry_run,
+            'verbose': base_config.verbose,
+        }
+
     def _process_launch_jupyter(self):
         
         # Parse jupyter specific volumes, ports, command
@@ -191,10 +352,36 @@ class ProcessArguments:
             'sort_by': sort_by
         }
     
+    def _process_templates(self):
+        from .utils import parse_duration
+
+        action = self.args.templates_action
+        keep = getattr(self.args, 'keep', 0)
+        if keep < 0:
+            raise ValueError("--keep must be 0 or more")
+        older_than = getattr(self.args, 'older_than', None)
+        return {
+            'action': action,
+            'name': getattr(self.args, 'name', None),
+            'job_type': self.args.type,
+            'keep': keep,
+            'older_than': parse_duration(older_than) if older_than else None,
+            'dry_run': self.args.dry_run
+        }
+
+    def _process_pyenv(self):
+        return {
+            'action': self.args.pyenv_action,
+            'path': self.args.path,
+            'refresh': self.args.refresh
+        }
+
     def _process_list_jobs(self):
         namespace = self.args.namespace if hasattr(self.args, 'namespace') and self.args.namespace else None
+        selector = self.args.selector if hasattr(self.args, 'selector') and self.args.selector else None
         return {
-            'namespace': namespace
+            'namespace': namespace,
+            'selector': selector
         }
 
     def _process_list_pods(self):
@@ -428,6 +615,23 @@ class ProcessArguments:
             'kubectl_args': kubectl_args
         }
 
+    def _process_suspend_resume(self):
+        return {
+            'names': self.args.names,
+            'selector': self.args.selector,
+            'namespace': self.args.namespace,
+            'suspend': self.args.jet_command == 'suspend'
+        }
+
+    def _process_wait(self):
+        return {
+            'names': self.args.names,
+            'selector': self.args.selector,
+            'namespace': self.args.namespace,
+            'condition': self.args.condition,
+            'timeout': self.args.timeout
+        }
+
     def _process_resources(self):
         """Process resources command arguments."""
         return {}
@@ -491,17 +695,69 @@ class ProcessArguments:
         return new_vol
 
     def _generate_specs(self, job_type, backoff_limit, ttl_seconds_after_finished, additional_volumes=[], additional_envs={}, additional_ports=[], command_override=None, working_dir_override=None, active_deadline_seconds=None):
+        """
+        Build the JobConfig of a launch from the base config (template, job file or defaults) and the CLI arguments.
+
+        Built specs are cached, keyed by the CLI arguments and the content or signature of every file
+        read while building them, so relaunching with the same template and options skips template
+        parsing, pyenv inspection and group lookups.
+        """
+        from .spec_cache import load_spec, store_spec
+
+        params = dict(backoff_limit=backoff_limit, ttl_seconds_after_finished=ttl_seconds_after_finished,
+                      additional_volumes=additional_volumes, additional_envs=additional_envs,
+                      additional_ports=additional_ports, command_override=command_override,
+                      working_dir_override=working_dir_override, active_deadline_seconds=active_deadline_seconds)
+
+        # 1. Locate Base Config
+        base_config_path = None
+        if self.args.template:
+            base_config_path = self.template_manager.resolve_template_path(self.args.template, job_type)
+            print(f"Using template file: {base_config_path} for launching the job")
+        elif os.path.isfile(os.path.abspath(self.args.name)):
+            logging.info(f"Job file provided: {self.args.name}. Loading job configuration from the file.")
+            base_config_path = os.path.abspath(self.args.name)
+
+        key = self._spec_cache_key(job_type, base_config_path, params)
+        job_config = load_spec(key)
+        if job_config is not None:
+            logging.info("Using cached launch spec")
+            return job_config
+
+        job_config = self._build_specs(job_type, base_config_path, **params)
+        store_spec(key, job_config)
+        return job_config
+
+    def _spec_cache_key(self, job_type, base_config_path, params):
+        """Launch spec cache key: everything _build_specs reads, with files identified by content or signature."""
+        from .spec_cache import spec_cache_key, content_hash, file_signature
+
+        files = []
+        for env_list in getattr(self.args, 'env', None) or []:
+            files.extend(file_signature(os.path.abspath(env)) for env in env_list if os.path.isfile(env))
+        pyenv = getattr(self.args, 'pyenv', None)
+        if pyenv:
+            files.extend(file_signature(os.path.join(pyenv, name)) for name in ('pyvenv.cfg', 'conda-meta'))
+
+        return spec_cache_key(
+            job_type,
+            params,
+            sorted(vars(self.args).items()),
+            content_hash(base_config_path) if base_config_path else None,
+            files,
+            # User context: security context, home mounts, paths relative to the working directory and
+            # the uv cache directory. Supplemental groups are not looked up here, so warm launches skip
+            # the passwd/group lookups; membership changes are picked up when the entry expires.
+            os.getuid(), os.getgid(), os.path.expanduser("~"), os.getcwd(),
+            os.environ.get('UV_CACHE_DIR'), str(XDG_CACHE_HOME),
+        )
+
+    def _build_specs(self, job_type, base_config_path, backoff_limit, ttl_seconds_after_finished, additional_volumes=[], additional_envs={}, additional_ports=[], command_override=None, working_dir_override=None, active_deadline_seconds=None):
         from .job_config import JobConfig, JobMetadata, JobSpec, PodSpec, ContainerSpec, VolumeSpec, ResourceSpec
         
         # 1. Load Base Config
-        if self.args.template:
-            template_path = self.template_manager.resolve_template_path(self.args.template, job_type)
-            if template_path:
-                print(f"Using template file: {template_path} for launching the job")
-                job_config = self._load_job_config(template_path)
-        elif os.path.isfile(os.path.abspath(self.args.name)):
-             logging.info(f"Job file provided: {self.args.name}. Loading job configuration from the file.")
-             job_config = self._load_job_config(os.path.abspath(self.args.name))
+        if base_config_path:
+            job_config = self._load_job_config(base_config_path)
         else:
             # Create default config
             job_config = JobConfig(
@@ -540,6 +796,26 @@ class ProcessArguments:
             job_config.spec.parallelism = self.args.parallelism
         if hasattr(self.args, 'completions') and self.args.completions is not None:
             job_config.spec.completions = self.args.completions
+        if hasattr(self.args, 'indexed') and self.args.indexed:
+            job_config.spec.completion_mode = 'Indexed'
+        if hasattr(self.args, 'backoff_limit_per_index') and self.args.backoff_limit_per_index is not None:
+            job_config.spec.backoff_limit_per_index = self.args.backoff_limit_per_index
+        if hasattr(self.args, 'max_failed_indexes') and self.args.max_failed_indexes is not None:
+            job_config.spec.max_failed_indexes = self.args.max_failed_indexes
+        if hasattr(self.args, 'suspend') and self.args.suspend:
+            job_config.spec.suspend = True
+
+        # Pod failure policy - CLI rules are appended to template rules (rules are evaluated in order)
+        cli_rules = []
+        if hasattr(self.args, 'ignore_disruptions') and self.args.ignore_disruptions:
+            cli_rules.append({'action': 'Ignore', 'onPodConditions': [{'type': 'DisruptionTarget'}]})
+        if hasattr(self.args, 'fail_on_exit_codes') and self.args.fail_on_exit_codes:
+            cli_rules.append(self._parse_pod_failure_rule(f"FailJob:exit-codes={self.args.fail_on_exit_codes}"))
+        if hasattr(self.args, 'pod_failure_rule') and self.args.pod_failure_rule:
+            cli_rules.extend(self._parse_pod_failure_rule(rule) for rule in self.args.pod_failure_rule)
+        for rule in cli_rules:
+            if rule not in job_config.spec.pod_failure_policy:
+                job_config.spec.pod_failure_policy.append(rule)
 
         if backoff_limit is not None:
              job_config.spec.backoff_limit = backoff_limit
@@ -722,19 +998,56 @@ class ProcessArguments:
         job_config.dry_run = self.args.dry_run if hasattr(self.args, 'dry_run') else False
         job_config.verbose = self.args.verbose if hasattr(self.args, 'verbose') else False
         job_config.save_template = self.args.save_template if hasattr(self.args, 'save_template') else False
+        job_config.fit_check = not self.args.no_fit_check if hasattr(self.args, 'no_fit_check') else True
 
         return job_config
 
     def _get_user_groups(self, username=None):
-        username = username or os.getlogin()
-        pw = pwd.getpwnam(username)
-        return os.getgrouplist(username, pw.pw_gid)
+        # os.getlogin() needs a controlling terminal; the passwd entry of the uid works everywhere
+        pw = pwd.getpwnam(username) if username else pwd.getpwuid(os.getuid())
+        return os.getgrouplist(pw.pw_name, pw.pw_gid)
+
+    def _parse_pod_failure_rule(self, rule):
+        """
+        Parse a pod failure policy rule.
+
+        Format: <Action>:exit-codes=<c1>,<c2>[@<container>] | <Action>:exit-codes!=<c1>,<c2>[@<container>] | <Action>:condition=<PodConditionType>
+        Actions: FailJob, FailIndex, Ignore, Count
+        """
+        from .job_config import POD_FAILURE_POLICY_ACTIONS
+
+        action, sep, match = rule.partition(':')
+        if not sep or action not in POD_FAILURE_POLICY_ACTIONS:
+            raise ValueError(f"Invalid pod failure rule '{rule}'. Format: <Action>:exit-codes=<codes> or <Action>:condition=<type> with Action one of {POD_FAILURE_POLICY_ACTIONS}")
+
+        if match.startswith('condition='):
+            return {'action': action, 'onPodConditions': [{'type': match.split('=', 1)[1]}]}
+
+        if match.startswith('exit-codes!='):
+            operator, codes = 'NotIn', match.split('!=', 1)[1]
+        elif match.startswith('exit-codes='):
+            operator, codes = 'In', match.split('=', 1)[1]
+        else:
+            raise ValueError(f"Invalid pod failure rule '{rule}'. Match must be exit-codes=<codes>, exit-codes!=<codes> or condition=<type>")
+
+        codes, _, container = codes.partition('@')
+        try:
+            values = sorted({int(c) for c in codes.split(',') if c.strip()})
+        except ValueError:
+            raise ValueError(f"Invalid exit codes in pod failure rule '{rule}'")
+        if not values:
+            raise ValueError(f"No exit codes in pod failure rule '{rule}'")
+
+        on_exit_codes = {'operator': operator, 'values': values}
+        if container:
+            on_exit_codes = {'containerName': container, **on_exit_codes}
+        return {'action': action, 'onExitCodes': on_exit_codes}
 
     def _parse_shm_size_arg(self, shm_size):
         volume_name = 'shm-volume'
         mount_path = '/dev/shm'
         volume_type = 'emptyDir'
-        volume_details = {'name': volume_name, 'volume_type': volume_type, 'mount_path': mount_path, 'details': {'sizeLimit': shm_size}}
+        volume_details = {'name': volume_name, 'volume_type': volume_type, 'mount_path': mount_path, 'details': {'medium': 'Memory', 'sizeLimit': shm_size}}
         return volume_details
 
     def _parse_volume_arg(self, volume_args, identifier="volume"):
@@ -798,109 +1111,15 @@ class ProcessArguments:
         return env_vars
     
     def _parse_pyenv_arg(self, pyenv_arg):
-        """
-        Mount the provided pyenv path to the same path inside the container
-        If conda env is provided, set CONDA_PREFIX env variable to the pyenv path. Python executable is automatically picked from conda env.
-        If uv env is provided, set VIRTUAL_ENV env variable to the pyenv path. Python executable base path is automatically picked 
-        from uv env pyvenv.cfg and mounted as a volume. 
-        Set PATH env variable to include the pyenv bin directory
-        """
-        pyenv_volume_details = []
-
-        volume_name = 'pyenv-volume'
-        host_path = pyenv_arg
-        mount_path = pyenv_arg
-        volume_type = 'Directory'
-        pyenv_volume_details.append({'name': volume_name, 'volume_type': 'hostPath', 'mount_path': mount_path, 'details': {'path': host_path, 'type': volume_type}})
-
-        # Check if the pyenv directory is present
-        if not os.path.isdir(pyenv_arg):
-            raise ValueError(f"The provided --pyenv path '{pyenv_arg}' is invalid or does not exist")
-
-        # Env vars and additional volume for uv env base path if detected
-        files_in_pyenv = os.listdir(pyenv_arg)
-        pyenv_env_vars = {}
-        if 'conda-meta' in files_in_pyenv:
-            pyenv_env_vars['CONDA_PREFIX'] = pyenv_arg
-            pyenv_env_vars['PATH'] = f"{pyenv_arg}/bin:{DEFAULT_PATH}"
-            
-        elif 'pyvenv.cfg' in files_in_pyenv:
-            # Read pyvenv.cfg to get python executable base path for mounting
-            with open(os.path.join(pyenv_arg, 'pyvenv.cfg'), 'r') as f:
-                pyvenv = f.read()
-
-            config_parser = configparser.ConfigParser()
-            config_parser.read_string("[header]\n" + pyvenv)
-
-            # Validate it's a uv environment
-            if 'uv' not in config_parser["header"]:
-                raise ValueError(
-                    "Unsupported pyenv type. Only conda and uv environments are supported. "
-                    "Detected a standard venv (pyvenv.cfg without 'uv' key)."
-                )
-
-            # Get home path (required for uv envs)
-            if 'home' not in config_parser["header"]:
-                raise ValueError(
-                    f"Invalid uv pyvenv.cfg format: 'home' key not found in {pyenv_arg}/pyvenv.cfg"
-                )
-            
-            home_path = config_parser["header"]["home"]
-            # python_dir is "$UV_HOME/uv/python"
-            python_dir = str(Path(home_path).parents[1]) if home_path else None
-
-            pyenv_volume_details.append({'name': 'pyenv-base-volume', 'volume_type': 'hostPath',
-                                        'mount_path': python_dir, "read_only": True, 
-                                        'details': {'path': python_dir, 'type': 'Directory'}})
-            
-            # TODO: Set UV_HOME, UV_PYTHON_INSTALL_DIR, UV_TOOL_DIR, UV_TOOL_BIN_DIR and update PATH with UV_TOOL_BIN_DIR
-            # Set UV_CACHE_DIR and mount if exists
-            uv_cache_dir = None
-            if 'UV_CACHE_DIR' in os.environ:
-                uv_cache_dir = os.environ['UV_CACHE_DIR']
-            else:
-                try:
-                    result = subprocess.run(
-                        ['uv', 'cache', 'dir'], 
-                        capture_output=True, 
-                        text=True, 
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        uv_cache_dir = result.stdout.strip()
-                except (FileNotFoundError, subprocess.TimeoutExpired):
-                    pass
-            if not uv_cache_dir:
-                uv_cache_dir = str(Path(XDG_CACHE_HOME) / "uv")
-
-            if os.path.exists(uv_cache_dir):
-                uv_cache_volume_name = 'uv-cache-volume'
-                pyenv_volume_details.append({'name': uv_cache_volume_name, 'volume_type': 'hostPath',
-                                            'mount_path': uv_cache_dir,
-                                            'details': {'path': uv_cache_dir, 'type': 'Directory'}})
-            else:
-                raise ValueError(f"UV cache directory '{uv_cache_dir}' does not exist. Please create it or set UV_CACHE_DIR environment variable.")
+        """Volumes and env variables for a --pyenv env (see pyenv.resolve_pyenv, cached per env)."""
+        from .pyenv import resolve_pyenv
 
-            pyenv_env_vars['UV_CACHE_DIR'] = uv_cache_dir
-            pyenv_env_vars['VIRTUAL_ENV'] = pyenv_arg
-            pyenv_env_vars['PATH'] = f"{pyenv_arg}/bin:{DEFAULT_PATH}"
-
-            # Unset PYTHONHOME to avoid conflicts
-            pyenv_env_vars['PYTHONHOME'] = ''
-
-        else:
-            raise ValueError("Unsupported pyenv type. Supported envs are: conda, and uv. detected by presence of conda-meta or pyvenv.cfg (with 'uv' key) in the provided path.")
-
-        # Set PS1 to indicate pyenv is active in the container shell
-        # ps1 = f"({os.path.basename(pyenv_arg)}) \\u@\\h:\\w$ "
-        # pyenv_env_vars.update({'PS1': ps1})
-        # pyenv_env_vars.update({'PROMPT_COMMAND': f'export PS1="{ps1}"'}) 
-        # pyenv_env_vars.update({'PYTHONUNBUFFERED': '1'}) # To ensure python output is unbuffered in logs
-        
+        pyenv_volume_details, pyenv_env_vars, _ = resolve_pyenv(pyenv_arg)
         return pyenv_volume_details, pyenv_env_vars
 
     def _load_job_config(self, path):
+        from .codec import yaml_load
         from .job_config import JobConfig
         with open(path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = yaml_load(f)
         return JobConfig.from_dict(data)
\ No newline at end of file
@@ -0,0 +1,200 @@
+"""Resolution of --pyenv environments (conda or uv) into volumes and env variables, cached per env."""
+import os
+import json
+import logging
+import hashlib
+import configparser
+from pathlib import Path
+
+from .defaults import XDG_CACHE_HOME, DEFAULT_PATH
+
+
+CACHE_DIR = Path(XDG_CACHE_HOME) / "jet" / "pyenv"
+
+# Bumped when the cached format changes
+_CACHE_VERSION = 1
+
+# Files whose presence identifies the env type; their mtimes change when the env is recreated
+_MARKERS = ('conda-meta', 'pyvenv.cfg')
+
+
+def _signature(pyenv_path):
+    """Mtimes of the env markers and the UV_CACHE_DIR setting, which determine the resolution."""
+    markers = {}
+    for name in _MARKERS:
+        try:
+            markers[name] = os.stat(os.path.join(pyenv_path, name)).st_mtime_ns
+        except OSError:
+            markers[name] = None
+    return {'version': _CACHE_VERSION, 'markers': markers, 'uv_cache_dir': os.environ.get('UV_CACHE_DIR')}
+
+
+def _cache_path(pyenv_path):
+    key = json.dumps([os.path.abspath(pyenv_path), pyenv_path])
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()[:16]}.json"
+
+
+def _uv_cache_dir():
+    """UV cache directory: $UV_CACHE_DIR, `uv cache dir`, or $XDG_CACHE_HOME/uv."""
+    import subprocess
+
+    if 'UV_CACHE_DIR' in os.environ:
+        return os.environ['UV_CACHE_DIR']
+    try:
+        result = subprocess.run(
+            ['uv', 'cache', 'dir'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip()
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        pass
+    return str(Path(XDG_CACHE_HOME) / "uv")
+
+
+def _resolve(pyenv_arg):
+    """
+    Mount the provided pyenv path to the same path inside the container
+    If conda env is provided, set CONDA_PREFIX env variable to the pyenv path. Python executable is automatically picked from conda env.
+    If uv env is provided, set VIRTUAL_ENV env variable to the pyenv path. Python executable base path is automatically picked
+    from uv env pyvenv.cfg and mounted as a volume.
+    Set PATH env variable to include the pyenv bin directory
+    """
+    pyenv_volume_details = []
+
+    volume_name = 'pyenv-volume'
+    host_path = pyenv_arg
+    mount_path = pyenv_arg
+    volume_type = 'Directory'
+    pyenv_volume_details.append({'name': volume_name, 'volume_type': 'hostPath', 'mount_path': mount_path, 'details': {'path': host_path, 'type': volume_type}})
+
+    # Check if the pyenv directory is present
+    if not os.path.isdir(pyenv_arg):
+        raise ValueError(f"The provided --pyenv path '{pyenv_arg}' is invalid or does not exist")
+
+    # Env vars and additional volume for uv env base path if detected
+    files_in_pyenv = os.listdir(pyenv_arg)
+    pyenv_env_vars = {}
+    if 'conda-meta' in files_in_pyenv:
+        pyenv_env_vars['CONDA_PREFIX'] = pyenv_arg
+        pyenv_env_vars['PATH'] = f"{pyenv_arg}/bin:{DEFAULT_PATH}"
+
+    elif 'pyvenv.cfg' in files_in_pyenv:
+        # Read pyvenv.cfg to get python executable base path for mounting
+        with open(os.path.join(pyenv_arg, 'pyvenv.cfg'), 'r') as f:
+            pyvenv = f.read()
+
+        config_parser = configparser.ConfigParser()
+        config_parser.read_string("[header]\n" + pyvenv)
+
+        # Validate it's a uv environment
+        if 'uv' not in config_parser["header"]:
+            raise ValueError(
+                "Unsupported pyenv type. Only conda and uv environments are supported. "
+                "Detected a standard venv (pyvenv.cfg without 'uv' key)."
+            )
+
+        # Get home path (required for uv envs)
+        if 'home' not in config_parser["header"]:
+            raise ValueError(
+                f"Invalid uv pyvenv.cfg format: 'home' key not found in {pyenv_arg}/pyvenv.cfg"
+            )
+
+        home_path = config_parser["header"]["home"]
+        # python_dir is "$UV_HOME/uv/python"
+        python_dir = str(Path(home_path).parents[1]) if home_path else None
+
+        pyenv_volume_details.append({'name': 'pyenv-base-volume', 'volume_type': 'hostPath',
+                                    'mount_path': python_dir, "read_only": True,
+                                    'details': {'path': python_dir, 'type': 'Directory'}})
+
+        # TODO: Set UV_HOME, UV_PYTHON_INSTALL_DIR, UV_TOOL_DIR, UV_TOOL_BIN_DIR and update PATH with UV_TOOL_BIN_DIR
+        # Set UV_CACHE_DIR and mount if exists
+        uv_cache_dir = _uv_cache_dir()
+        if os.path.exists(uv_cache_dir):
+            uv_cache_volume_name = 'uv-cache-volume'
+            pyenv_volume_details.append({'name': uv_cache_volume_name, 'volume_type': 'hostPath',
+                                        'mount_path': uv_cache_dir,
+                                        'details': {'path': uv_cache_dir, 'type': 'Directory'}})
+        else:
+            raise ValueError(f"UV cache directory '{uv_cache_dir}' does not exist. Please create it or set UV_CACHE_DIR environment variable.")
+
+        pyenv_env_vars['UV_CACHE_DIR'] = uv_cache_dir
+        pyenv_env_vars['VIRTUAL_ENV'] = pyenv_arg
+        pyenv_env_vars['PATH'] = f"{pyenv_arg}/bin:{DEFAULT_PATH}"
+
+        # Unset PYTHONHOME to avoid conflicts
+        pyenv_env_vars['PYTHONHOME'] = ''
+
+    else:
+        raise ValueError("Unsupported pyenv type. Supported envs are: conda, and uv. detected by presence of conda-meta or pyvenv.cfg (with 'uv' key) in the provided path.")
+
+    # Set PS1 to indicate pyenv is active in the container shell
+    # ps1 = f"({os.path.basename(pyenv_arg)}) \\u@\\h:\\w$ "
+    # pyenv_env_vars.update({'PS1': ps1})
+    # pyenv_env_vars.update({'PROMPT_COMMAND': f'export PS1="{ps1}"'})
+    # pyenv_env_vars.update({'PYTHONUNBUFFERED': '1'}) # To ensure python output is unbuffered in logs
+
+    return pyenv_volume_details, pyenv_env_vars
+
+
+def resolve_pyenv(pyenv_arg, refresh=False):
+    """
+    Resolve a --pyenv env into the volumes and env variables of the job container.
+
+    The resolution lists the env directory, parses pyvenv.cfg and may run `uv cache dir`, which
+    is slow for large envs on network filesystems. It is cached per env path and reused while
+    the mtimes of conda-meta and pyvenv.cfg and the UV_CACHE_DIR setting are unchanged and the
+    directories it mounts still exist.
+
+    Args:
+        pyenv_arg (str): Env path as given to --pyenv.
+        refresh (bool): Resolve again even if a valid cached resolution exists.
+
+    Returns:
+        tuple: (volumes, env variables, cached) where cached tells whether the cached
+            resolution was used.
+
+    Raises:
+        ValueError: If the path is not a conda or uv env.
+    """
+    signature = _signature(pyenv_arg)
+    cache_path = _cache_path(pyenv_arg)
+    if not refresh and any(signature['markers'].values()):
+        try:
+            with cache_path.open() as f:
+                cached = json.load(f)
+            # The resolution checked that the mounted directories (e.g. the uv cache) exist; check again
+            if cached.get('signature') == signature and all(os.path.isdir(v['details']['path']) for v in cached['volumes']):
+                return cached['volumes'], cached['env'], True
+        except (OSError, ValueError):
+            pass
+
+    volumes, env_vars = _resolve(pyenv_arg)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump({'path': pyenv_arg, 'signature': signature, 'volumes': volumes, 'env': env_vars}, f)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logging.debug(f"Could not cache pyenv resolution for {pyenv_arg}: {e}")
+    return volumes, env_vars, False
+
+
+def inspect_pyenv(pyenv_arg, refresh=False):
+    """Print how a --pyenv env is resolved and whether the cached resolution is used."""
+    volumes, env_vars, cached = resolve_pyenv(pyenv_arg, refresh=refresh)
+    env_type = 'conda' if 'CONDA_PREFIX' in env_vars else 'uv'
+
+    print(f"Env:        {pyenv_arg} ({env_type})")
+    print(f"Resolution: {'cached' if cached else 'resolved now'} ({_cache_path(pyenv_arg)})")
+    print("Volumes:")
+    for volume in volumes:
+        mode = ' (read-only)' if volume.get('read_only') else ''
+        print(f"  {volume['name']}: {volume['details']['path']} -> {volume['mount_path']}{mode}")
+    print("Env variables:")
+    for key, value in env_vars.items():
+        print(f"  {key}={value}")
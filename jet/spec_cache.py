@@ -0,0 +1,129 @@
+"""Cache of fully built launch specs, so repeated launches skip template parsing and argument processing."""
+import os
+import stat
+import json
+import time
+import hashlib
+import logging
+import dataclasses
+from pathlib import Path
+
+from .defaults import XDG_CACHE_HOME
+
+
+CACHE_DIR = Path(XDG_CACHE_HOME) / "jet" / "specs"
+
+# Set to 1 to disable the cache
+DISABLE_ENV = "JET_NO_SPEC_CACHE"
+
+# Bumped when the cached format changes
+_CACHE_VERSION = 2
+
+# Specs include the user's supplemental groups, which are not part of the key (looking them up
+# on every launch is what the cache avoids); rebuild daily so membership changes are picked up
+_MAX_AGE_SECONDS = 86400
+
+# Oldest specs are removed when the cache grows beyond this many entries
+_MAX_ENTRIES = 256
+
+# Modules whose code determines the built spec; editing them (e.g. in an editable install) invalidates the cache
+_SOURCE_FILES = ("process_args.py", "job_config.py", "defaults.py")
+
+
+def file_signature(path):
+    """(path, mtime in ns, size) of a file, or (path, None, None) if it does not exist."""
+    try:
+        stat = os.stat(path)
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (str(path), None, None)
+
+
+def content_hash(path):
+    """SHA-256 of a file's content."""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _path_type(path):
+    """'Directory' or 'File' if a host path exists, else None."""
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, TypeError, ValueError):
+        return None
+    return 'Directory' if stat.S_ISDIR(mode) else 'File'
+
+
+def _host_path_states(job_config):
+    """
+    hostPath volumes of a spec and whether they exist now.
+
+    Building a spec checks some of them (the --pyenv env, the uv cache directory), and a pod
+    mounting a missing one never starts, so a cached spec is only used while all of them are
+    as they were when it was built.
+    """
+    return {v.details.get('path'): _path_type(v.details.get('path'))
+            for v in job_config.spec.template_spec.volumes if v.volume_type == 'hostPath'}
+
+
+def spec_cache_key(*parts):
+    """
+    Cache key of a launch spec.
+
+    Args:
+        parts: JSON-serializable inputs the spec is built from (normalized CLI arguments, content
+            hashes and signatures of the files read while building it).
+
+    Returns:
+        str: Key, or None when the cache is disabled.
+    """
+    if os.environ.get(DISABLE_ENV) == "1":
+        return None
+    source_dir = Path(__file__).parent
+    sources = [file_signature(source_dir / name) for name in _SOURCE_FILES]
+    text = json.dumps([_CACHE_VERSION, sources, parts], sort_keys=True, default=str)
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+
+def load_spec(key):
+    """Return the cached JobConfig for a key, or None if it is missing, too old or a host path it mounts changed."""
+    from .job_config import JobConfig
+
+    if key is None:
+        return None
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > _MAX_AGE_SECONDS:
+            return None
+        with path.open() as f:
+            cached = json.load(f)
+        host_paths = cached["host_paths"]
+        if any(_path_type(host_path) != state for host_path, state in host_paths.items()):
+            logging.debug("Launch spec cache entry mounts a host path that was created or removed, rebuilding")
+            return None
+        return JobConfig.from_fields(cached["spec"])
+    except (OSError, ValueError, TypeError, KeyError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logging.debug(f"Ignoring unreadable launch spec cache entry {path}: {e}")
+        return None
+
+
+def store_spec(key, job_config):
+    """Cache a built JobConfig under a key."""
+    if key is None:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
+        path = CACHE_DIR / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump({"host_paths": _host_path_states(job_config), "spec": dataclasses.asdict(job_config)}, f)
+        tmp_path.replace(path)
+
+        entries = list(CACHE_DIR.glob("*.json"))
+        if len(entries) > _MAX_ENTRIES:
+            entries.sort(key=lambda p: p.stat().st_mtime)
+            for old in entries[:len(entries) - _MAX_ENTRIES]:
+                old.unlink()
+    except OSError as e:
+        logging.debug(f"Could not cache launch spec: {e}")
@@ -0,0 +1,183 @@
+"""Hyperparameter sweeps: parameter space expansion and cheap per-trial job derivation."""
+import re
+import math
+import random
+import itertools
+
+
+# Labels put on every trial job (and its pods) so a sweep can be listed/watched as one group
+SWEEP_LABEL = 'jet-sweep'
+TRIAL_LABEL = 'jet-sweep-trial'
+
+# Kubernetes object names (and label values) are limited to 63 characters
+_MAX_NAME_LENGTH = 63
+
+_PLACEHOLDER_RE = re.compile(r'\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+
+def parse_grid_arg(spec):
+    """
+    Parse a grid parameter. Format: <key>=<v1>,<v2>,...
+
+    Returns:
+        tuple: (key, list of values)
+    """
+    if '=' not in spec:
+        raise ValueError(f"Invalid grid parameter '{spec}'. Format: <key>=<v1>,<v2>,...")
+    key, values = spec.split('=', 1)
+    values = [v.strip() for v in values.split(',') if v.strip()]
+    if not key.strip() or not values:
+        raise ValueError(f"Invalid grid parameter '{spec}'. Format: <key>=<v1>,<v2>,...")
+    return key.strip(), values
+
+
+def parse_random_arg(spec):
+    """
+    Parse a random parameter. Format: <key>=<distribution>:<args>
+
+    Supported distributions:
+    - uniform:<low>:<high>
+    - loguniform:<low>:<high>
+    - int:<low>:<high> (inclusive)
+    - choice:<v1>,<v2>,...
+
+    Returns:
+        tuple: (key, sampler function taking a random.Random instance)
+    """
+    if '=' not in spec or ':' not in spec.split('=', 1)[1]:
+        raise ValueError(f"Invalid random parameter '{spec}'. Format: <key>=<distribution>:<args>")
+    key, dist_spec = spec.split('=', 1)
+    dist, _, dist_args = dist_spec.partition(':')
+    key, dist = key.strip(), dist.strip().lower()
+
+    if dist == 'choice':
+        choices = [v.strip() for v in dist_args.split(',') if v.strip()]
+        if not choices:
+            raise ValueError(f"Random parameter '{key}' has no choices")
+        return key, lambda rng: rng.choice(choices)
+
+    try:
+        low, high = (float(v) for v in dist_args.split(':'))
+    except ValueError:
+        raise ValueError(f"Invalid bounds for random parameter '{spec}'. Format: <key>={dist}:<low>:<high>")
+
+    if dist == 'uniform':
+        return key, lambda rng: repr(rng.uniform(low, high))
+    elif dist == 'loguniform':
+        if low <= 0 or high <= 0:
+            raise ValueError(f"loguniform bounds must be positive for '{key}'")
+        return key, lambda rng: repr(math.exp(rng.uniform(math.log(low), math.log(high))))
+    elif dist == 'int':
+        return key, lambda rng: str(rng.randint(int(low), int(high)))
+    raise ValueError(f"Unsupported distribution '{dist}' for '{key}'. Supported: uniform, loguniform, int, choice")
+
+
+def expand_space(grid=None, random_params=None, trials=None, seed=0, trial_list=None):
+    """
+    Expand a parameter space into a list of trial parameter dicts.
+
+    Grid parameters are expanded into their cartesian product. Random parameters are
+    sampled `trials` times for each grid point with a seeded generator, so the same
+    arguments always produce the same trials. An explicit trial list is used as-is.
+
+    Args:
+        grid (list[str]): Grid parameters (<key>=<v1>,<v2>,...).
+        random_params (list[str]): Random parameters (<key>=<distribution>:<args>).
+        trials (int): Number of random samples per grid point.
+        seed (int): Random seed.
+        trial_list (list[dict]): Explicit trial parameters.
+
+    Returns:
+        list[dict]: Parameters of each trial.
+    """
+    if trial_list is not None:
+        if grid or random_params:
+            raise ValueError("--params-file cannot be combined with --grid or --random")
+        return [{str(k): str(v) for k, v in params.items()} for params in trial_list]
+
+    grid_params = [parse_grid_arg(spec) for spec in (grid or [])]
+    keys = [key for key, _ in grid_params]
+    points = [dict(zip(keys, values)) for values in itertools.product(*(values for _, values in grid_params))]
+
+    if random_params:
+        samplers = [parse_random_arg(spec) for spec in random_params]
+        rng = random.Random(seed)
+        trials = trials or 1
+        points = [dict(point, **{key: sampler(rng) for key, sampler in samplers})
+                  for point in points for _ in range(trials)]
+    elif trials:
+        raise ValueError("--trials requires at least one --random parameter")
+
+    if not points or points == [{}]:
+        raise ValueError("Sweep parameter space is empty. Use --grid, --random or --params-file")
+    return points
+
+
+def env_var_name(key):
+    """Environment variable name for a sweep parameter (e.g. 'learning-rate' -> 'LEARNING_RATE')."""
+    return re.sub(r'[^A-Za-z0-9_]', '_', key).upper()
+
+
+def trial_name(sweep_name, index, total):
+    """Deterministic, sortable trial job name (e.g. my-sweep-007)."""
+    name = f"{sweep_name}-{index:0{len(str(max(total - 1, 0)))}d}"
+    if len(name) > _MAX_NAME_LENGTH:
+        raise ValueError(f"Trial name '{name}' exceeds {_MAX_NAME_LENGTH} characters. Use a shorter sweep name")
+    return name
+
+
+def substitute_params(text, params):
+    """Replace {key} placeholders of known parameters, leaving other braces (e.g. ${HOME}) untouched."""
+    return _PLACEHOLDER_RE.sub(lambda m: str(params[m.group(1)]) if m.group(1) in params else m.group(0), text)
+
+
+def derive_trial(base, sweep_name, index, total, params):
+    """
+    Derive a trial Job manifest from the base manifest.
+
+    Only the parts that differ between trials (names, labels, env and command) are
+    copied; everything else is shared with the base, which makes deriving thousands
+    of trials cheap. The returned manifests must be treated as read-only apart from
+    metadata.
+
+    Args:
+        base (dict): Base Job manifest (JobConfig.to_dict()).
+        sweep_name (str): Sweep name.
+        index (int): Trial index.
+        total (int): Number of trials (for zero-padding names).
+        params (dict): Trial parameters.
+
+    Returns:
+        dict: Trial Job manifest.
+    """
+    name = trial_name(sweep_name, index, total)
+    labels = {SWEEP_LABEL: sweep_name, TRIAL_LABEL: str(index)}
+
+    metadata = dict(base['metadata'], name=name)
+    metadata['labels'] = dict(base['metadata'].get('labels', {}), **labels)
+
+    template = dict(base['spec']['template'])
+    template['metadata'] = dict(template.get('metadata', {}))
+    template['metadata']['labels'] = dict(template['metadata'].get('labels', {}), **labels)
+
+    pod_spec = dict(template['spec'])
+    containers = list(pod_spec['containers'])
+    container = dict(containers[0])
+
+    param_env = {env_var_name(key): str(value) for key, value in params.items()}
+    container['env'] = [e for e in container.get('env', []) if e['name'] not in param_env] + \
+        [{'name': k, 'value': v} for k, v in param_env.items()]
+    if container.get('args'):
+        container['args'] = [substitute_params(arg, params) for arg in container['args']]
+
+    containers[0] = container
+    pod_spec['containers'] = containers
+    template['spec'] = pod_spec
+
+    return dict(base, metadata=metadata, spec=dict(base['spec'], template=template))
+
+
+def build_trials(base, sweep_name, trial_params):
+    """Derive one Job manifest per trial from the base manifest."""
+    total = len(trial_params)
+    return [derive_trial(base, sweep_name, i, total, params) for i, params in enumerate(trial_params)]
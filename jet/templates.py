@@ -0,0 +1,438 @@
+"""Saved job templates: content-addressed store with name/version pointers, and an index of plain template files."""
+import os
+import json
+import time
+import uuid
+import socket
+import hashlib
+import logging
+from pathlib import Path
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+# Bumped when the index format changes; older indexes are rebuilt
+_INDEX_VERSION = 1
+
+# The index lives in a subdirectory so rewriting it does not change the templates directory mtime
+_INDEX_DIR = ".index"
+_INDEX_FILE = "templates.json"
+
+# Bumped when the refs format changes; jet refuses to write refs it does not understand
+_REFS_VERSION = 1
+
+# Store layout inside the templates directory: store/objects/<sha256>.yaml and store/refs.json
+_STORE_DIR = "store"
+_OBJECTS_DIR = "objects"
+_REFS_FILE = "refs.json"
+_LOCK_FILE = "refs.lock"
+
+# Local snapshot of a shared registry's template versions, in the registry cache directory
+_SNAPSHOT_FILE = "manifest.json"
+
+# A lock held longer than this is left over by a crashed process (template writes take milliseconds)
+_LOCK_STALE_SECONDS = 60
+_LOCK_POLL_SECONDS = 0.05
+
+
+@contextmanager
+def _locked(lock_path):
+    """
+    Hold an exclusive lock file.
+
+    The lock is taken by creating the file with O_EXCL, which is atomic on local and network
+    filesystems (NFSv3+, BeeGFS), so writers on different hosts sharing a registry are serialized.
+    """
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > _LOCK_STALE_SECONDS:
+                    logging.warning(f"Removing stale template lock {lock_path}")
+                    lock_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            time.sleep(_LOCK_POLL_SECONDS)
+    try:
+        os.write(fd, f"{socket.gethostname()} {os.getpid()}\n".encode())
+        os.close(fd)
+        yield
+    finally:
+        try:
+            lock_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _write_atomic(path, text):
+    # Unique temporary name: process ids are not unique across the hosts sharing a registry
+    tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+    with tmp_path.open("w") as f:
+        f.write(text)
+    tmp_path.replace(path)
+
+
+class TemplateIndex:
+    """
+    Index of the template files in a templates directory: file name -> job name, job type and timestamp.
+
+    Template files are saved by earlier jet versions or copied into the directory by hand. They are
+    picked up by an incremental rescan, triggered when the templates directory mtime differs from
+    the one recorded in the index: only the names of new files are parsed, nothing is stat'ed.
+    """
+
+    def __init__(self, templates_dir):
+        self.templates_dir = Path(templates_dir)
+        self.index_path = self.templates_dir / _INDEX_DIR / _INDEX_FILE
+        self._entries = None
+        self._dir_mtime = None
+
+    def _dir_mtime_ns(self):
+        try:
+            return self.templates_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read(self):
+        try:
+            with self.index_path.open() as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None, {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return None, {}
+        return data.get("dir_mtime_ns"), data.get("templates", {})
+
+    def _write(self):
+        try:
+            self.index_path.parent.mkdir(exist_ok=True)
+            _write_atomic(self.index_path, json.dumps(
+                {"version": _INDEX_VERSION, "dir_mtime_ns": self._dir_mtime, "templates": self._entries}))
+        except OSError as e:
+            # A read-only templates directory still works, it is just rescanned every time
+            logging.debug(f"Could not write template index {self.index_path}: {e}")
+
+    def _rescan(self, entries):
+        """Sync entries with the files in the templates directory, parsing only new file names."""
+        from .utils import TemplateInfo
+
+        updated = {}
+        for entry in os.scandir(self.templates_dir):
+            name = entry.name
+            if name in entries:
+                updated[name] = entries[name]
+                continue
+            if not entry.is_file():
+                continue
+            ti = TemplateInfo.from_path(Path(name))
+            if ti is None:
+                continue
+            if ti.timestamp is not None:
+                ts = ti.timestamp.timestamp()
+            else:
+                # Same fallback as before indexing: the file mtime
+                ts = entry.stat().st_mtime
+            updated[name] = {"job_name": ti.job_name, "job_type": ti.job_type, "ts": ts}
+        return updated
+
+    def entries(self):
+        """
+        Return the indexed template files, rescanning the directory first if it changed.
+
+        Returns:
+            dict: File name -> {'job_name', 'job_type', 'ts' (POSIX timestamp)}.
+        """
+        # mtime is taken before listing, so files added during the rescan trigger another one next time
+        dir_mtime = self._dir_mtime_ns()
+        if self._entries is not None and dir_mtime == self._dir_mtime:
+            return self._entries
+
+        stored_mtime, entries = self._read()
+        if dir_mtime is None or stored_mtime != dir_mtime:
+            entries = self._rescan(entries) if dir_mtime is not None else {}
+            self._entries, self._dir_mtime = entries, dir_mtime
+            if dir_mtime is not None:
+                self._write()
+        else:
+            self._entries, self._dir_mtime = entries, dir_mtime
+        return self._entries
+
+
+class TemplateStore:
+    """
+    Content-addressed template store.
+
+    Template contents are stored once, as store/objects/<sha256>.yaml. Template versions are
+    pointers in store/refs.json: version name -> template name, job type, timestamp and object
+    hash. Saving a config identical to the latest version of a template adds nothing, and a
+    config identical to any other stored version only adds a pointer. Template files in the
+    templates directory itself (saved by earlier jet versions or copied by hand) are found through
+    the TemplateIndex and are listed, resolved and pruned like stored versions.
+
+    With a cache_dir, the store is a registry shared over a network filesystem and reads go
+    through a local cache: all template versions are kept in one local snapshot file, checked
+    against the registry with two stats (skipped entirely for cache_seconds after a check), and
+    objects, which never change, are copied locally on first use.
+    """
+
+    def __init__(self, templates_dir, cache_dir=None, cache_seconds=0):
+        self.templates_dir = Path(templates_dir)
+        self.store_dir = self.templates_dir / _STORE_DIR
+        self.objects_dir = self.store_dir / _OBJECTS_DIR
+        self.refs_path = self.store_dir / _REFS_FILE
+        self.lock_path = self.store_dir / _LOCK_FILE
+        self.index = TemplateIndex(self.templates_dir)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_seconds = cache_seconds
+        self._refs = None
+        self._refs_signature = None
+        self._snapshot = None
+
+    def _refs_file_signature(self):
+        try:
+            stat = self.refs_path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def _read_refs(self):
+        """
+        Read the version pointers from disk.
+
+        Raises:
+            ValueError: If the refs file is unreadable or written by a newer jet version.
+        """
+        try:
+            with self.refs_path.open() as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Could not read template refs {self.refs_path}: {e}")
+        if not isinstance(data, dict) or data.get("version") != _REFS_VERSION:
+            raise ValueError(f"Unsupported template refs format in {self.refs_path}. Upgrade jet to use these templates")
+        return data.get("templates", {})
+
+    def _write_refs(self, refs):
+        _write_atomic(self.refs_path, json.dumps({"version": _REFS_VERSION, "templates": refs}))
+        self._refs, self._refs_signature = refs, self._refs_file_signature()
+
+    def refs(self):
+        """Version name -> {'job_name', 'job_type', 'ts', 'object'}, re-read only when refs.json changes."""
+        signature = self._refs_file_signature()
+        if self._refs is None or signature != self._refs_signature:
+            try:
+                refs = self._read_refs()
+            except ValueError as e:
+                logging.warning(e)
+                refs = {}
+            self._refs, self._refs_signature = refs, signature
+        return self._refs
+
+    def _registry_entries(self):
+        entries = dict(self.index.entries())
+        entries.update(self.refs())
+        return entries
+
+    def _registry_signature(self):
+        """Changes whenever a version is saved or removed, or a template file is added or removed."""
+        return [self._refs_file_signature(), self.index._dir_mtime_ns()]
+
+    def _save_snapshot(self, snapshot):
+        self._snapshot = snapshot
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self.cache_dir / _SNAPSHOT_FILE, json.dumps(snapshot))
+        except OSError as e:
+            logging.debug(f"Could not write template registry snapshot in {self.cache_dir}: {e}")
+
+    def _load_snapshot(self):
+        if self._snapshot is None:
+            try:
+                with (self.cache_dir / _SNAPSHOT_FILE).open() as f:
+                    self._snapshot = json.load(f)
+            except (OSError, ValueError):
+                return None
+        return self._snapshot
+
+    def _invalidate_snapshot(self):
+        self._snapshot = None
+        if self.cache_dir is not None:
+            try:
+                (self.cache_dir / _SNAPSHOT_FILE).unlink()
+            except FileNotFoundError:
+                pass
+
+    def entries(self, refresh=False):
+        """
+        All template versions: stored versions and template files.
+
+        Args:
+            refresh (bool): Check a shared registry for changes even if the last check is recent.
+
+        Returns:
+            dict: Version name (file name for template files) -> {'job_name', 'job_type', 'ts'
+                and, for stored versions, 'object'}.
+        """
+        if self.cache_dir is None:
+            return self._registry_entries()
+
+        now = time.time()
+        snapshot = self._load_snapshot()
+        if snapshot and not refresh and now - snapshot["checked"] < self.cache_seconds:
+            return snapshot["entries"]
+        # JSON round trip turns the signature tuples into lists
+        signature = json.loads(json.dumps(self._registry_signature()))
+        if snapshot and signature == snapshot["signature"]:
+            self._save_snapshot(dict(snapshot, checked=now))
+            return snapshot["entries"]
+
+        entries = self._registry_entries()
+        self._save_snapshot({"signature": signature, "checked": now, "entries": entries})
+        return entries
+
+    def source_path(self, name, entry):
+        """Path of a template version in the templates directory or the shared registry."""
+        if "object" in entry:
+            return self.objects_dir / f"{entry['object']}.yaml"
+        return self.templates_dir / name
+
+    def path(self, name, entry):
+        """Path of the YAML file holding a template version (a local copy for shared registry objects)."""
+        object_path = self.source_path(name, entry)
+        if self.cache_dir is None or "object" not in entry:
+            return object_path
+        cached_path = self.cache_dir / _OBJECTS_DIR / object_path.name
+        if not cached_path.exists():
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(cached_path, object_path.read_text())
+        return cached_path
+
+    def _digest(self, name, entry):
+        if "object" in entry:
+            return entry["object"]
+        try:
+            return hashlib.sha256(self.source_path(name, entry).read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def find(self, job_name, job_type, entries=None):
+        """
+        Versions of a template, newest first.
+
+        A template missing from a recently checked registry snapshot is looked up again in the
+        registry, so templates saved by others in the meantime are found.
+
+        Returns:
+            list: (version name, entry) tuples.
+        """
+        job_type = job_type.lower()
+
+        def matches_in(entries):
+            matches = [(name, entry) for name, entry in entries.items()
+                       if entry["job_name"] == job_name and entry["job_type"].lower() == job_type]
+            matches.sort(key=lambda item: item[1]["ts"], reverse=True)
+            return matches
+
+        if entries is not None:
+            return matches_in(entries)
+        matches = matches_in(self.entries())
+        if not matches and self.cache_dir is not None:
+            matches = matches_in(self.entries(refresh=True))
+        return matches
+
+    def save(self, text, job_name, job_type):
+        """
+        Save a template version.
+
+        Args:
+            text (str): Template YAML.
+            job_name (str): Template name.
+            job_type (str): Job type ('job', 'jupyter' or 'debug').
+
+        Returns:
+            tuple: (path of the template YAML in the store, created) where created is False when the content is
+                identical to the latest version, which is then returned.
+        """
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        with _locked(self.lock_path):
+            refs = self._read_refs()
+            versions = self.find(job_name, job_type, entries=dict(self.index.entries(), **refs))
+            if versions and self._digest(*versions[0]) == digest:
+                return self.source_path(*versions[0]), False
+
+            object_path = self.objects_dir / f"{digest}.yaml"
+            if not object_path.exists():
+                _write_atomic(object_path, text)
+
+            now = datetime.now(timezone.utc)
+            name = f"{job_name}_{job_type}_template_{now.strftime('%Y%m%d-%H%M%S-%f')}"
+            refs = dict(refs)
+            refs[name] = {"job_name": job_name, "job_type": job_type, "ts": now.timestamp(), "object": digest}
+            self._write_refs(refs)
+            self._invalidate_snapshot()
+            return object_path, True
+
+    def remove(self, names):
+        """Remove template versions and delete objects no version points to any more."""
+        names = set(names)
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        with _locked(self.lock_path):
+            refs = self._read_refs()
+            if names & refs.keys():
+                refs = {name: entry for name, entry in refs.items() if name not in names}
+                self._write_refs(refs)
+            self._invalidate_snapshot()
+            files = self.index.entries()
+            for name in names:
+                if name in files:
+                    try:
+                        (self.templates_dir / name).unlink()
+                    except FileNotFoundError:
+                        pass
+
+            referenced = {entry["object"] for entry in refs.values()}
+            for path in self.objects_dir.glob("*.yaml"):
+                if path.stem not in referenced:
+                    path.unlink()
+
+    def prune(self, keep=1, older_than=None, job_name=None, job_type=None, dry_run=False):
+        """
+        Remove old template versions.
+
+        A version is removed when it is not among the `keep` newest versions of its template and,
+        if older_than is given, is older than that.
+
+        Args:
+            keep (int): Number of newest versions kept per template (0 to allow removing all).
+            older_than (float): Only remove versions older than this many seconds.
+            job_name (str): Only prune versions of this template.
+            job_type (str): Only prune templates of this job type.
+            dry_run (bool): Only return the versions that would be removed.
+
+        Returns:
+            list: Removed version names.
+        """
+        groups = defaultdict(list)
+        for name, entry in self.entries(refresh=True).items():
+            if job_name is not None and entry["job_name"] != job_name:
+                continue
+            if job_type is not None and entry["job_type"].lower() != job_type.lower():
+                continue
+            groups[(entry["job_name"], entry["job_type"].lower())].append((name, entry))
+
+        now = time.time()
+        pruned = []
+        for versions in groups.values():
+            versions.sort(key=lambda item: item[1]["ts"], reverse=True)
+            pruned.extend(name for name, entry in versions[keep:]
+                          if older_than is None or now - entry["ts"] > older_than)
+
+        if pruned and not dry_run:
+            self.remove(pruned)
+        return sorted(pruned)
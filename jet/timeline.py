@@ -0,0 +1,164 @@
+"""Launch timeline: when a job was submitted, its pod created, scheduled, its images pulled and its containers started."""
+import os
+import json
+import logging
+from datetime import datetime, timezone
+
+from .defaults import JET_HOME
+
+
+TIMELINE_DIR = JET_HOME / "timelines"
+
+# Set to disable storing timelines (they are still printed)
+DISABLE_ENV = "JET_NO_TIMELINE"
+
+# Steps in launch order, with their labels
+STEPS = {
+    'submitted': 'submitted',
+    'pod_created': 'pod created',
+    'scheduled': 'scheduled',
+    'pulling': 'image pulling',
+    'pulled': 'image pulled',
+    'initialized': 'initialized',
+    'containers_ready': 'containers ready',
+    'running': 'running',
+}
+
+# Pod conditions that mark a step
+_CONDITION_STEPS = {'PodScheduled': 'scheduled', 'Initialized': 'initialized', 'ContainersReady': 'containers_ready'}
+
+
+def _parse_time(value):
+    """Parse a Kubernetes timestamp (e.g. 2024-05-01T10:00:00Z or with microseconds)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
+
+class LaunchTimeline:
+    """
+    Timestamps of the launch steps of a job, per pod.
+
+    Times come from the API server: the Job and Pod creation timestamps, the PodScheduled,
+    Initialized and ContainersReady pod conditions, the container start times, and the
+    Scheduled/Pulling/Pulled events of the pod. Server timestamps have a resolution of one
+    second, except for events that carry an eventTime.
+
+    Attributes:
+        job_name (str): Name of the job.
+        namespace (str): Kubernetes namespace.
+        launch_type (str): 'job', 'jupyter' or 'debug'.
+        submitted (datetime): Creation time of the Job.
+    """
+
+    def __init__(self, job_name, namespace, job=None, launch_type='job'):
+        self.job_name = job_name
+        self.namespace = namespace
+        self.launch_type = launch_type
+        self.submitted = _parse_time((job or {}).get('metadata', {}).get('creationTimestamp')) or datetime.now(timezone.utc)
+        self._pods = {}  # pod UID -> (pod name, {step: datetime})
+
+    def _steps(self, pod_uid, pod_name=None):
+        name, steps = self._pods.setdefault(pod_uid, (pod_name, {}))
+        if pod_name and name != pod_name:
+            self._pods[pod_uid] = (pod_name, steps)
+        return steps
+
+    def _set(self, steps, step, when, earliest=True):
+        if when is None:
+            return
+        if step not in steps or (when < steps[step] if earliest else when > steps[step]):
+            steps[step] = when
+
+    def record_pod(self, pod):
+        """Record the steps shown by a raw Pod: creation, conditions and container start times."""
+        metadata, status = pod['metadata'], pod.get('status', {})
+        steps = self._steps(metadata.get('uid'), metadata['name'])
+        self._set(steps, 'pod_created', _parse_time(metadata.get('creationTimestamp')))
+        for cond in status.get('conditions', []):
+            if cond.get('status') == 'True' and cond.get('type') in _CONDITION_STEPS:
+                self._set(steps, _CONDITION_STEPS[cond['type']], _parse_time(cond.get('lastTransitionTime')))
+        for cs in status.get('containerStatuses', []):
+            state = cs.get('state', {})
+            started = (state.get('running') or state.get('terminated') or {}).get('startedAt')
+            self._set(steps, 'running', _parse_time(started))
+
+    def record_event(self, event):
+        """Record the Scheduled, Pulling (first) and Pulled (last) events of a pod."""
+        reason = event.get('reason')
+        if reason not in ('Scheduled', 'Pulling', 'Pulled'):
+            return
+        steps = self._steps(event.get('involvedObject', {}).get('uid'))
+        first = _parse_time(event.get('eventTime') or event.get('firstTimestamp'))
+        last = _parse_time(event.get('eventTime') or event.get('lastTimestamp')) or first
+        if reason == 'Scheduled':
+            self._set(steps, 'scheduled', first)
+        elif reason == 'Pulling':
+            self._set(steps, 'pulling', first)
+        else:
+            self._set(steps, 'pulled', last, earliest=False)
+
+    def pod_timeline(self, pod_name=None):
+        """
+        Steps of a pod (the first pod created if no name is given), in launch order.
+
+        Returns:
+            tuple: (pod name or None, list of (step, datetime)) including the submission.
+        """
+        pods = [(name, steps) for name, steps in self._pods.values() if name]
+        if pod_name:
+            pods = [(name, steps) for name, steps in pods if name == pod_name]
+        pods.sort(key=lambda pod: pod[1].get('pod_created') or datetime.max.replace(tzinfo=timezone.utc))
+        name, steps = pods[0] if pods else (None, {})
+        timeline = [('submitted', self.submitted)] + [(step, steps[step]) for step in STEPS if step in steps]
+        # Steps are ordered by time; ties keep the launch order
+        return name, sorted(timeline, key=lambda item: item[1])
+
+    def to_dict(self, pod_name=None):
+        name, timeline = self.pod_timeline(pod_name)
+        return {
+            'job': self.job_name,
+            'namespace': self.namespace,
+            'launch_type': self.launch_type,
+            'pod': name,
+            'steps': {step: when.isoformat() for step, when in timeline},
+            'seconds_since_submission': {step: round((when - self.submitted).total_seconds(), 3) for step, when in timeline},
+        }
+
+    def summary(self, pod_name=None):
+        """Compact breakdown, e.g. 'scheduled +41s, image pulling +1s, image pulled +12s, running +2s (total 56s)'."""
+        _, timeline = self.pod_timeline(pod_name)
+        parts = []
+        for (_, previous), (step, when) in zip(timeline, timeline[1:]):
+            parts.append(f"{STEPS[step]} +{(when - previous).total_seconds():g}s")
+        total = (timeline[-1][1] - self.submitted).total_seconds()
+        return f"{', '.join(parts)} (total {total:g}s)" if parts else "no pod created yet"
+
+    def save(self, pod_name=None):
+        """
+        Store the timeline as JSON under JET_HOME/timelines.
+
+        Returns:
+            Path: The file written, or None if storing is disabled or failed.
+        """
+        if os.environ.get(DISABLE_ENV):
+            return None
+        path = TIMELINE_DIR / f"{self.namespace}_{self.job_name}_{self.submitted.strftime('%Y%m%dT%H%M%S')}.json"
+        try:
+            TIMELINE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(pod_name), f, indent=2)
+        except OSError as e:
+            logging.debug(f"Could not store launch timeline of {self.job_name}: {e}")
+            return None
+        return path
+
+    def report(self, pod_name=None):
+        """Print the compact breakdown and store the timeline."""
+        print(f"Launch timeline: {self.summary(pod_name)}")
+        path = self.save(pod_name)
+        if path:
+            logging.info(f"Launch timeline stored in {path}")
@@ -6,6 +6,7 @@ from typing import Optional, List
 from .screens import JobsScreen, PodsScreen, DescribeScreen
 from .styles import STYLES
 from ..utils import get_current_namespace, detect_shell, exec_into_pod
+from ..credentials import kubectl_env
 
 
 class JetTUI(App):
@@ -26,6 +27,7 @@ class JetTUI(App):
                  resource_name: Optional[str] = None, follow: bool = False,
                  job_name: Optional[str] = None, resource_type: Optional[str] = None,
                  restore_state: Optional[dict] = None,
+                 label_selector: Optional[str] = None,
                  *args, **kwargs):
         """
         Initialize the TUI.
@@ -38,6 +40,7 @@ class JetTUI(App):
             job_name: Filter pods by job name
             resource_type: Type of resource ("job", "pod")
             restore_state: State to restore after returning from logs/exec
+            label_selector: Filter jobs by label selector (e.g. "jet-sweep=my-sweep")
         """
         super().__init__(*args, **kwargs)
         self.mode = mode
@@ -47,6 +50,7 @@ class JetTUI(App):
         self.job_name = job_name
         self.resource_type = resource_type
         self.restore_state = restore_state
+        self.label_selector = label_selector
     
     def action_quit(self) -> None:
         """Quit the application, canceling all workers first."""
@@ -79,6 +83,7 @@ class JetTUI(App):
                     jobs_cursor_row=state.get("jobs_cursor_row"),  # Pass through for future use
                     jobs_filter=state.get("jobs_filter"),  # Restore jobs filter
                     initial_filter=state.get("filter_text"),  # Restore pods filter
+                    jobs_selector=state.get("jobs_selector"),
                 )
                 screen._restore_cursor = state.get("cursor_row", 0)
                 # First push jobs screen if we came from there
@@ -86,6 +91,7 @@ class JetTUI(App):
                     jobs_screen = JobsScreen(
                         namespace=ns,
                         initial_filter=state.get("jobs_filter"),  # Restore jobs filter
+                        label_selector=state.get("jobs_selector"),
                     )
                     jobs_screen._restore_cursor = state.get("jobs_cursor_row")
                     self.push_screen(jobs_screen)
@@ -94,13 +100,14 @@ class JetTUI(App):
                 screen = JobsScreen(
                     namespace=ns,
                     initial_filter=state.get("filter_text"),  # Restore jobs filter
+                    label_selector=state.get("label_selector"),
                 )
                 screen._restore_cursor = state.get("cursor_row", 0)
                 self.push_screen(screen)
             else:
                 self.push_screen(JobsScreen(namespace=self.namespace))
         elif self.mode == "jobs":
-            self.push_screen(JobsScreen(namespace=self.namespace))
+            self.push_screen(JobsScreen(namespace=self.namespace, label_selector=self.label_selector))
         elif self.mode == "pods":
             self.push_screen(PodsScreen(namespace=self.namespace, job_name=self.job_name))
         elif self.mode == "describe":
@@ -120,7 +127,7 @@ class JetTUI(App):
 def run_tui(mode: str = "jobs", namespace: Optional[str] = None, 
             resource_name: Optional[str] = None, follow: bool = False,
             job_name: Optional[str] = None, resource_type: Optional[str] = None,
-            mouse: bool = False):
+            mouse: bool = False, label_selector: Optional[str] = None):
     """
     Run the Jet TUI.
     
@@ -132,6 +139,7 @@ def run_tui(mode: str = "jobs", namespace: Optional[str] = None,
         job_name: Job name for filtering pods or logs
         resource_type: Type of resource ("job", "pod")
         mouse: Whether to enable mouse input (default: False)
+        label_selector: Filter jobs by label selector (e.g. "jet-sweep=my-sweep")
     
     Returns:
         Optional tuple with action to perform after exit
@@ -173,7 +181,7 @@ def run_tui(mode: str = "jobs", namespace: Optional[str] = None,
         print_banner(title, lines)
         user_interrupted = False
         try:
-            subprocess.run(cmd)
+            subprocess.run(cmd, env=kubectl_env())
         except KeyboardInterrupt:
             user_interrupted = True
         if not user_interrupted:
@@ -192,6 +200,7 @@ def run_tui(mode: str = "jobs", namespace: Optional[str] = None,
                 stderr=subprocess.STDOUT,
                 text=True,
                 timeout=30,  # Timeout to prevent hanging on huge logs
+                env=kubectl_env(),
             )
             lines = result.stdout.splitlines()
             # Print the first N lines
@@ -218,7 +227,7 @@ def run_tui(mode: str = "jobs", namespace: Optional[str] = None,
             else:
                 print("Error: No resource specified for logs")
                 return
-            subprocess.run(cmd)
+            subprocess.run(cmd, env=kubectl_env())
         except KeyboardInterrupt:
             pass
         return
@@ -233,7 +242,8 @@ def run_tui(mode: str = "jobs", namespace: Optional[str] = None,
             follow=follow,
             job_name=job_name,
             resource_type=resource_type,
-            restore_state=restore_state
+            restore_state=restore_state,
+            label_selector=label_selector
         )
         
         result = None
@@ -5,7 +5,9 @@ from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 
-from ..utils import get_current_namespace
+from ..utils import get_current_namespace, count_indexes
+from ..credentials import kubectl_env
+from ..codec import json_loads
 
 
 @dataclass
@@ -47,6 +49,9 @@ class JobInfo:
     failed: int = 0
     start_time: Optional[datetime] = None  # For duration calculation
     completion_time: Optional[datetime] = None  # None if still running
+    completion_mode: str = "NonIndexed"
+    completed_indexes: str = ""  # Indexed jobs, e.g. "0-3,7"
+    failed_indexes: str = ""  # Indexed jobs with backoffLimitPerIndex
 
 
 def format_duration(start_time: Optional[datetime], completion_time: Optional[datetime]) -> str:
@@ -169,7 +174,8 @@ class K8sClient:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=timeout,
+                env=kubectl_env()
             )
             if result.returncode == 0:
                 return result.stdout
@@ -197,7 +203,7 @@ class K8sClient:
             return []
         
         try:
-            data = json.loads(output)
+            data = json_loads(output)
             jobs = []
             
             for item in data.get('items', []):
@@ -215,6 +221,10 @@ class K8sClient:
                 active = status.get('active', 0) or 0
                 completions = spec.get('completions', 1) or 1
                 completions_str = f"{succeeded}/{completions}"
+                # Indexed jobs: show the number of failed indexes
+                failed_indexes = status.get('failedIndexes', '')
+                if failed_indexes:
+                    completions_str += f" ✗{count_indexes(failed_indexes)}"
                 
                 # Duration
                 start_time = parse_datetime(status.get('startTime'))
@@ -256,7 +266,10 @@ class K8sClient:
                     labels=metadata.get('labels', {}),
                     active=active,
                     succeeded=succeeded,
-                    failed=failed
+                    failed=failed,
+                    completion_mode=spec.get('completionMode', 'NonIndexed'),
+                    completed_indexes=status.get('completedIndexes', ''),
+                    failed_indexes=failed_indexes
                 ))
             
             # Sort by creation time (newest first)
@@ -280,7 +293,7 @@ class K8sClient:
             return []
         
         try:
-            data = json.loads(output)
+            data = json_loads(output)
             pods = []
             
             for item in data.get('items', []):
@@ -440,7 +453,8 @@ class K8sClient:
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                bufsize=1  # Line buffered
+                bufsize=1,  # Line buffered
+                env=kubectl_env()
             )
             
             # Track this process so it can be killed externally
@@ -4,10 +4,11 @@ import time
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, AsyncGenerator
 import kr8s
-from kr8s.asyncio.objects import Job, Pod
 
 from .k8s import JobInfo, PodInfo, format_age, format_duration, parse_datetime
-from ..utils import get_current_namespace
+from ..utils import get_current_namespace, count_indexes
+from ..k8s_api import ResourceWatch, get_api
+from ..event_informer import EventInformer, get_event_informer
 
 
 class Kr8sWatcher:
@@ -20,18 +21,32 @@ class Kr8sWatcher:
     def __init__(self, namespace: Optional[str] = None):
         self.namespace = namespace or get_current_namespace()
         self._api: Optional[kr8s.asyncio.Api] = None
+        # Watch and the objects seen by it per (kind, label selector). Screens that are shown
+        # again or refreshed resume the watch instead of listing everything again.
+        self._watches: Dict[tuple, tuple] = {}
+        # Namespace events, to show why pending pods are not starting
+        self._events: Optional[EventInformer] = None
     
     async def _get_api(self) -> kr8s.asyncio.Api:
         """Get or create the kr8s API client."""
         if self._api is None:
-            self._api = await kr8s.asyncio.api()
+            self._api = await get_api()
         return self._api
     
-    def _job_from_kr8s(self, job: Job) -> JobInfo:
-        """Convert kr8s Job to JobInfo."""
-        metadata = job.raw.get('metadata', {})
-        status = job.raw.get('status', {})
-        spec = job.raw.get('spec', {})
+    async def _get_events(self) -> Optional[EventInformer]:
+        """Get the event informer of the namespace, or None if events cannot be watched."""
+        if self._events is None:
+            try:
+                self._events = await get_event_informer(self.namespace, api=await self._get_api())
+            except Exception:
+                return None
+        return self._events
+
+    def _job_from_raw(self, job: Dict) -> JobInfo:
+        """Convert a raw Job to JobInfo."""
+        metadata = job.get('metadata', {})
+        status = job.get('status', {})
+        spec = job.get('spec', {})
         
         name = metadata.get('name', '')
         created_str = metadata.get('creationTimestamp', '')
@@ -43,6 +58,10 @@ class Kr8sWatcher:
         active = status.get('active', 0) or 0
         completions = spec.get('completions', 1) or 1
         completions_str = f"{succeeded}/{completions}"
+        # Indexed jobs: show the number of failed indexes
+        failed_indexes = status.get('failedIndexes', '')
+        if failed_indexes:
+            completions_str += f" ✗{count_indexes(failed_indexes)}"
         
         # Duration
         start_time = parse_datetime(status.get('startTime'))
@@ -86,14 +105,17 @@ class Kr8sWatcher:
             succeeded=succeeded,
             failed=failed,
             start_time=start_time,
-            completion_time=completion_time
+            completion_time=completion_time,
+            completion_mode=spec.get('completionMode', 'NonIndexed'),
+            completed_indexes=status.get('completedIndexes', ''),
+            failed_indexes=failed_indexes
         )
     
-    def _pod_from_kr8s(self, pod: Pod, job_name: Optional[str] = None) -> PodInfo:
-        """Convert kr8s Pod to PodInfo."""
-        metadata = pod.raw.get('metadata', {})
-        status = pod.raw.get('status', {})
-        spec = pod.raw.get('spec', {})
+    def _pod_from_raw(self, pod: Dict, job_name: Optional[str] = None) -> PodInfo:
+        """Convert a raw Pod to PodInfo."""
+        metadata = pod.get('metadata', {})
+        status = pod.get('status', {})
+        spec = pod.get('spec', {})
         
         name = metadata.get('name', '')
         created_str = metadata.get('creationTimestamp', '')
@@ -131,6 +153,12 @@ class Kr8sWatcher:
                         pod_status = f"Error({exit_code})"
                     break
         
+        # Pending pods without a container reason: show the latest warning (e.g. FailedScheduling)
+        if pod_status == "Pending" and self._events is not None:
+            warnings = self._events.warnings(uid=metadata.get('uid'))
+            if warnings:
+                pod_status = warnings[-1].get('reason', pod_status)
+        
         # Restarts
         restarts = sum(cs.get('restartCount', 0) for cs in container_statuses)
         
@@ -159,39 +187,42 @@ class Kr8sWatcher:
             job_name=pod_job_name
         )
     
-    async def watch_jobs(self) -> AsyncGenerator[List[JobInfo], None]:
+    async def _watch(self, kind: str, label_selector: Optional[str]) -> AsyncGenerator[Dict[str, Dict], None]:
+        """Yield the objects by name at start and on every change.
+
+        The first call lists the objects; later calls for the same objects yield the known state
+        right away and resume the watch from its last resourceVersion.
+        """
+        key = (kind, label_selector)
+        if key not in self._watches:
+            watch = ResourceWatch(kind, namespace=self.namespace, label_selector=label_selector, api=await self._get_api())
+            objects = {item['metadata']['name']: item for item in await watch.list()}
+            self._watches[key] = (watch, objects)
+        watch, objects = self._watches[key]
+
+        yield objects
+        async for event, obj in watch.events():
+            name = obj['metadata']['name']
+            if event == "DELETED":
+                objects.pop(name, None)
+            else:
+                objects[name] = obj
+            yield objects
+
+    async def watch_jobs(self, label_selector: Optional[str] = None) -> AsyncGenerator[List[JobInfo], None]:
         """Watch jobs and yield full list on each change.
         
-        Does an immediate list fetch first for fast display, then watches for updates.
+        Yields the current jobs immediately, then watches for updates.
         This is designed to be used with Textual's run_worker.
+        
+        Args:
+            label_selector: Optional label selector (e.g. "jet-sweep=my-sweep") to watch a group of jobs
         """
-        jobs_dict: Dict[str, Job] = {}  # Store raw Job objects
+        jobs_dict: Dict[str, Dict] = {}
         
         try:
-            api = await self._get_api()
-            
-            # Fast initial fetch using Job.list() - much faster than kr8s.asyncio.get()
-            async for job in Job.list(namespace=self.namespace):
-                metadata = job.raw.get('metadata', {})
-                job_name = metadata.get('name', '')
-                jobs_dict[job_name] = job
-            
-            # Yield immediately with initial data
-            yield self._jobs_from_dict(jobs_dict)
-            
-            # Now watch for changes
-            async for event, job in kr8s.asyncio.watch("jobs", namespace=self.namespace):
-                metadata = job.raw.get('metadata', {})
-                job_name = metadata.get('name', '')
-                
-                if event in ("ADDED", "MODIFIED"):
-                    jobs_dict[job_name] = job
-                elif event == "DELETED":
-                    jobs_dict.pop(job_name, None)
-                
-                # Yield on every change
+            async for jobs_dict in self._watch('Job', label_selector):
                 yield self._jobs_from_dict(jobs_dict)
-                
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -199,60 +230,57 @@ class Kr8sWatcher:
             if jobs_dict:
                 yield self._jobs_from_dict(jobs_dict)
     
-    def _jobs_from_dict(self, jobs_dict: Dict[str, Job]) -> List[JobInfo]:
+    def _jobs_from_dict(self, jobs_dict: Dict[str, Dict]) -> List[JobInfo]:
         """Convert raw Job dict to sorted JobInfo list with fresh ages."""
-        jobs = [self._job_from_kr8s(job) for job in jobs_dict.values()]
+        jobs = [self._job_from_raw(job) for job in jobs_dict.values()]
         return sorted(jobs, key=lambda j: j.created_at, reverse=True)
     
     async def watch_pods(self, job_name: Optional[str] = None) -> AsyncGenerator[List[PodInfo], None]:
         """Watch pods and yield full list on each change.
         
-        Does an immediate list fetch first for fast display, then watches for updates.
+        Yields the current pods immediately, then watches for updates.
         This is designed to be used with Textual's run_worker.
         """
-        pods_dict: Dict[str, Pod] = {}  # Store raw Pod objects
-        
+        pods_dict: Dict[str, Dict] = {}
+        label_selector = f"job-name={job_name}" if job_name else None
+        events = await self._get_events()
+        # Pod updates and event changes (which can change the shown status) share one queue
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def follow_pods():
+            try:
+                async for objects in self._watch('Pod', label_selector):
+                    await queue.put(('Pod', None, objects))
+            except Exception as e:
+                await queue.put(('error', None, e))
+
+        task = asyncio.create_task(follow_pods())
+        if events is not None:
+            events.subscribe(queue)
         try:
-            api = await self._get_api()
-            
-            # Build label selector
-            label_selector = f"job-name={job_name}" if job_name else None
-            
-            # Build kwargs for list and watch
-            kwargs: Dict = {"namespace": self.namespace}
-            if label_selector:
-                kwargs["label_selector"] = label_selector
-            
-            # Fast initial fetch using Pod.list() - much faster than kr8s.asyncio.get()
-            async for pod in Pod.list(**kwargs):
-                metadata = pod.raw.get('metadata', {})
-                pod_name = metadata.get('name', '')
-                pods_dict[pod_name] = pod
-            
-            # Yield immediately with initial data
-            yield self._pods_from_dict(pods_dict, job_name)
-            
-            # Now watch for changes
-            async for event, pod in kr8s.asyncio.watch("pods", **kwargs):
-                metadata = pod.raw.get('metadata', {})
-                pod_name = metadata.get('name', '')
-                
-                if event in ("ADDED", "MODIFIED"):
-                    pods_dict[pod_name] = pod
-                elif event == "DELETED":
-                    pods_dict.pop(pod_name, None)
-                
-                # Yield on every change
+            while True:
+                kind, _, obj = await queue.get()
+                if kind == 'error':
+                    raise obj
+                if kind == 'Event':
+                    involved = obj.get('involvedObject', {})
+                    if involved.get('kind') != 'Pod' or involved.get('name') not in pods_dict:
+                        continue
+                else:
+                    pods_dict = obj
                 yield self._pods_from_dict(pods_dict, job_name)
-                
         except asyncio.CancelledError:
             raise
         except Exception:
             # On error, yield current state
             if pods_dict:
                 yield self._pods_from_dict(pods_dict, job_name)
+        finally:
+            if events is not None:
+                events.unsubscribe(queue)
+            task.cancel()
     
-    def _pods_from_dict(self, pods_dict: Dict[str, Pod], job_name: Optional[str] = None) -> List[PodInfo]:
+    def _pods_from_dict(self, pods_dict: Dict[str, Dict], job_name: Optional[str] = None) -> List[PodInfo]:
         """Convert raw Pod dict to sorted PodInfo list with fresh ages."""
-        pods = [self._pod_from_kr8s(pod, job_name) for pod in pods_dict.values()]
+        pods = [self._pod_from_raw(pod, job_name) for pod in pods_dict.values()]
         return sorted(pods, key=lambda p: p.created_at, reverse=True)
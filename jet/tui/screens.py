@@ -337,8 +337,10 @@ class JobsScreen(BaseListScreen):
         Binding("ctrl+C", "quit", "Quit", show=False, priority=True),
     ]
     
-    def __init__(self, namespace: Optional[str] = None, initial_filter: Optional[str] = None, *args, **kwargs):
+    def __init__(self, namespace: Optional[str] = None, initial_filter: Optional[str] = None,
+                 label_selector: Optional[str] = None, *args, **kwargs):
         super().__init__(namespace=namespace, initial_filter=initial_filter, *args, **kwargs)
+        self.label_selector = label_selector  # Server-side filter, e.g. all trials of a sweep
         self.jobs: List[JobInfo] = []
     
     def _setup_columns(self, table: DataTable) -> None:
@@ -435,7 +437,10 @@ class JobsScreen(BaseListScreen):
     def _update_header(self) -> None:
         """Update the header."""
         header = self.query_one("#header", Static)
-        title = f"jobs({self.namespace})[{self.resource_count}]"
+        if self.label_selector:
+            title = f"jobs({self.namespace}/{self.label_selector})[{self.resource_count}]"
+        else:
+            title = f"jobs({self.namespace})[{self.resource_count}]"
         
         # Build the center content first to calculate padding
         center_content = f" {title} "
@@ -476,7 +481,7 @@ class JobsScreen(BaseListScreen):
     async def _watch_jobs(self) -> None:
         """Watch jobs and update table on changes."""
         try:
-            async for jobs in self.watcher.watch_jobs():
+            async for jobs in self.watcher.watch_jobs(label_selector=self.label_selector):
                 self._update_table(jobs)
         except asyncio.CancelledError:
             pass
@@ -603,6 +608,7 @@ class JobsScreen(BaseListScreen):
                 job_name=job_name,
                 jobs_cursor_row=table.cursor_row,  # Pass current cursor for restoration
                 jobs_filter=self.filter_text,  # Pass current filter for restoration
+                jobs_selector=self.label_selector,
             ))
     
     def action_describe(self) -> None:
@@ -647,6 +653,7 @@ class JobsScreen(BaseListScreen):
             "namespace": self.namespace,
             "cursor_row": table.cursor_row or 0,
             "filter_text": self.filter_text,
+            "label_selector": self.label_selector,
         }
 
     def _start_tail_logs(self, job_name: str, line_count: int) -> None:
@@ -729,11 +736,12 @@ class PodsScreen(BaseListScreen):
     
     def __init__(self, namespace: Optional[str] = None, job_name: Optional[str] = None, 
                  jobs_cursor_row: Optional[int] = None, jobs_filter: Optional[str] = None,
-                 initial_filter: Optional[str] = None, *args, **kwargs):
+                 initial_filter: Optional[str] = None, jobs_selector: Optional[str] = None, *args, **kwargs):
         super().__init__(namespace=namespace, initial_filter=initial_filter, *args, **kwargs)
         self.job_name = job_name
         self.jobs_cursor_row = jobs_cursor_row  # Remember jobs screen cursor for restoration
         self.jobs_filter = jobs_filter  # Remember jobs screen filter for restoration
+        self.jobs_selector = jobs_selector  # Remember jobs screen label selector for restoration
         self.pods: List[PodInfo] = []
     
     def _setup_columns(self, table: DataTable) -> None:
@@ -956,6 +964,9 @@ class PodsScreen(BaseListScreen):
             "Pending": "yellow",
             "ContainerCreating": "yellow",
             "PodInitializing": "yellow",
+            "FailedScheduling": "red",
+            "Unschedulable": "red",
+            "FailedMount": "red",
             "Failed": "red",
             "Error": "red",
             "CrashLoopBackOff": "red",
@@ -1042,6 +1053,7 @@ class PodsScreen(BaseListScreen):
             "jobs_cursor_row": self.jobs_cursor_row,
             "filter_text": self.filter_text,
             "jobs_filter": self.jobs_filter,
+            "jobs_selector": self.jobs_selector,
         }
 
     def _start_tail_logs(self, pod_name: str, line_count: int) -> None:
@@ -1066,6 +1078,7 @@ class PodsScreen(BaseListScreen):
                 "jobs_cursor_row": self.jobs_cursor_row,  # Jobs screen cursor for restoration
                 "filter_text": self.filter_text,
                 "jobs_filter": self.jobs_filter,
+                "jobs_selector": self.jobs_selector,
             }
             self.app.exit(result=("exec", pod_name, self.namespace, state))
     
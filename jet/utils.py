@@ -1,6 +1,5 @@
 import logging
 import subprocess
-import yaml
 import time
 import os
 import json
@@ -11,8 +10,57 @@ from collections import defaultdict
 import shutil
 import textwrap
 import sys
-from .defaults import JET_HOME, KUBE_STATE_METRICS_URL
-from .k8s_events import K8S_EVENTS
+from .defaults import JET_HOME, KUBE_STATE_METRICS_URL, XDG_CACHE_HOME
+from .codec import yaml_load, yaml_dump, yaml_dump_all, json_load, json_loads
+from .templates import TemplateStore
+from .credentials import kubectl_env
+
+
+# Process-wide kubeconfig cache: (path, mtime, size) of every kubeconfig file -> merged kubeconfig
+_kubeconfig_cache = {}
+
+
+def _kubeconfig_file_signature(path):
+    """(path, mtime in ns, size) of a kubeconfig file; mtime and size are None if it does not exist."""
+    try:
+        stat = path.stat()
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return (str(path), None, None)
+
+
+def _load_kubeconfig_file(path, signature):
+    """
+    Parse a single kubeconfig file.
+
+    A pre-parsed JSON snapshot of the file is kept under $XDG_CACHE_HOME/jet/kubeconfig/ and used
+    while the file's mtime and size are unchanged, so a cold start skips YAML parsing. Snapshots
+    hold credentials and are only readable by the user. YAML is parsed with libyaml when available.
+    """
+    import hashlib
+
+    snapshot_dir = Path(XDG_CACHE_HOME) / "jet" / "kubeconfig"
+    snapshot_path = snapshot_dir / f"{hashlib.sha1(str(path).encode()).hexdigest()[:16]}.json"
+    try:
+        with open(snapshot_path) as f:
+            snapshot = json_load(f)
+        if snapshot.get("signature") == list(signature):
+            return snapshot["config"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    with open(path) as f:
+        cfg = yaml_load(f) or {}
+
+    try:
+        snapshot_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as f:
+            json.dump({"signature": list(signature), "config": cfg}, f)
+        tmp_path.replace(snapshot_path)
+    except (OSError, TypeError, ValueError) as e:
+        logging.debug(f"Could not write kubeconfig snapshot for {path}: {e}")
+    return cfg
 
 
 def get_kubeconfig():
@@ -22,6 +70,9 @@ def get_kubeconfig():
     Resolution order (matches kubectl exactly):
     1. $KUBECONFIG environment variable (colon-separated list of files, merged in order)
     2. ~/.kube/config
+
+    The merged config is cached for the process and reloaded when any of the files changes
+    (mtime or size), so callers should treat it as read-only.
     
     Returns:
         dict: Merged kubeconfig dictionary, or empty dict if no config found.
@@ -35,6 +86,10 @@ def get_kubeconfig():
     else:
         # Default: ~/.kube/config
         config_paths = [Path.home() / ".kube" / "config"]
+
+    signatures = tuple(_kubeconfig_file_signature(config_path) for config_path in config_paths)
+    if signatures in _kubeconfig_cache:
+        return _kubeconfig_cache[signatures]
     
     # Merge configs in order (later files override earlier for conflicts,
     # but kubectl merges lists like contexts/clusters/users)
@@ -49,12 +104,11 @@ def get_kubeconfig():
     seen_contexts = set()
     seen_users = set()
     
-    for config_path in config_paths:
-        if not config_path.exists():
+    for config_path, signature in zip(config_paths, signatures):
+        if signature[1] is None:
             continue
         try:
-            with open(config_path) as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = _load_kubeconfig_file(config_path, signature)
             
             # First file's current-context wins (if set)
             if merged["current-context"] is None and cfg.get("current-context"):
@@ -83,7 +137,10 @@ def get_kubeconfig():
                     
         except Exception:
             continue
-    
+
+    # Only the current set of files is kept
+    _kubeconfig_cache.clear()
+    _kubeconfig_cache[signatures] = merged
     return merged
 
 def get_current_namespace(kubeconfig=None):
@@ -139,40 +196,78 @@ def print_job_yaml(job_yaml, dry_run=False, verbose=False, resource_type='job'):
         pass
 
 def submit_job(job_config, dry_run=False, verbose=False, resource_type='job'):
+    """
+    Submit a Kubernetes resource using server-side apply through the shared API client.
 
-    job_yaml = yaml.dump(job_config, sort_keys=False, default_flow_style=False)
+    Args:
+        job_config (dict): Resource manifest (Job, Service, ...).
+        dry_run (bool): If True, only print the manifest.
+        verbose (bool): If True, print the manifest before submitting.
+        resource_type (str): Type of resource (e.g., 'job', 'service'). Default is 'job'.
 
-    print_job_yaml(job_yaml, dry_run=dry_run, verbose=verbose, resource_type=resource_type)
+    Returns:
+        dict: The applied object returned by the API server (includes uid and resourceVersion),
+              or None on dry run.
+    """
+    from .k8s_api import run_sync, apply_resource
+
+    if dry_run or verbose:
+        print_job_yaml(yaml_dump(job_config), dry_run=dry_run, verbose=verbose, resource_type=resource_type)
     if dry_run:
-        return
+        return None
 
     # TODO: Check if there is no existing resource with the same name and all its pods are terminated
 
     # Submit the resource
     resource_name = resource_type.capitalize()
     try:
-        result = subprocess.run(
-            ['kubectl', 'apply', '-f', '-'],
-            input=job_yaml,
-            capture_output=True,
-            text=True
-        )
+        applied, created = run_sync(apply_resource, job_config)
+    except Exception as e:
+        # TODO: Handle immutable fields error (gracefully ask user to delete and recreate resource). Add a custom exception class for this.
+        raise Exception(f"Error submitting {resource_type}: {e}")
 
-        if result.returncode == 0:
-            if "created" in result.stdout:
-                print(
-                    f"\n{resource_name} \x1b[1;32m{job_config['metadata']['name']}\x1b[0m created in namespace \x1b[38;5;245m{job_config['metadata'].get('namespace', 'default')}\x1b[0m\n"
-                )
-            elif "configured" in result.stdout:
-                print(result.stdout)
-            else:
-                print(result.stdout)
-            # TODO: Handle immutable fields error (gracefully ask user to delete and recreate resource). Add a custom exception class for this.
-        else:
-            raise Exception(result.stderr)
-        
+    metadata = applied.get('metadata', {})
+    action = "created" if created else "configured"
+    print(
+        f"\n{resource_name} \x1b[1;32m{metadata.get('name')}\x1b[0m {action} in namespace \x1b[38;5;245m{metadata.get('namespace', 'default')}\x1b[0m\n"
+    )
+    return applied
+
+def submit_job_with_dependents(job_config, build_dependents, hold_suspended=False, dry_run=False, verbose=False):
+    """
+    Submit a Job together with resources owned by it (e.g. a gang scheduling PodGroup or the
+    headless Service of a distributed job). Dependents are garbage collected with the Job.
+
+    Args:
+        job_config (dict): Job manifest.
+        build_dependents (callable): Called with the (applied) Job; returns the dependent manifests.
+        hold_suspended (bool): Keep the Job suspended until its dependents exist.
+        dry_run (bool): If True, only print the manifests.
+        verbose (bool): If True, print the manifests before submitting.
+
+    Returns:
+        dict: The applied Job, or None on dry run.
+    """
+    from .k8s_api import run_sync, apply_job_with_dependents
+
+    if dry_run or verbose:
+        print_job_yaml(yaml_dump_all([job_config] + build_dependents(job_config)), dry_run=dry_run, verbose=verbose)
+    if dry_run:
+        return None
+
+    try:
+        applied, dependents, created = run_sync(apply_job_with_dependents, job_config, build_dependents, hold_suspended=hold_suspended)
     except Exception as e:
-        raise Exception(f"Error submitting {resource_type} with subprocess: {e}")
+        raise Exception(f"Error submitting job: {e}")
+
+    metadata = applied.get('metadata', {})
+    action = "created" if created else "configured"
+    with_text = ", ".join(f"{d.get('kind')} {d.get('metadata', {}).get('name')}" for d in dependents)
+    print(
+        f"\nJob \x1b[1;32m{metadata.get('name')}\x1b[0m {action} in namespace \x1b[38;5;245m{metadata.get('namespace', 'default')}\x1b[0m "
+        f"with {with_text}\n"
+    )
+    return applied
 
 def delete_resource(name, resource_type, namespace=None, kubectl_args=None):
     """
@@ -194,7 +289,8 @@ def delete_resource(name, resource_type, namespace=None, kubectl_args=None):
             cmd,
             check=True,
             capture_output=True,
-            text=True
+            text=True,
+            env=kubectl_env()
         )
 
         print(f"{resource_type} \x1b[1;32m{name}\x1b[0m \x1b[31mdeleted\x1b[0m from \x1b[38;5;245m{namespace}\x1b[0m namespace")
@@ -222,7 +318,8 @@ def forward_port_background(name, resource_type, host_port, pod_port, namespace=
             ['kubectl', 'port-forward', f'{resource_type}/{name}', f'{host_port}:{pod_port}', '-n', namespace],
             # stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
-            text=True
+            text=True,
+            env=kubectl_env()
         )
 
         # Wait for the port-forwarding to start
@@ -251,9 +348,14 @@ def init_pod_object(resource, namespace=None, **kwargs):
     Returns:
         Pod: kr8s Pod object.
     """
+    import kr8s
     from kr8s.objects import Pod
+    from .credentials import kubeconfig_path
 
     try:
+        kubeconfig = kubeconfig_path()
+        if kubeconfig and 'api' not in kwargs:
+            kwargs['api'] = kr8s.api(kubeconfig=kubeconfig)
         pod = Pod(resource=resource, namespace=namespace, **kwargs)
         return pod
     except Exception as e:
@@ -357,9 +459,9 @@ def get_job_pod_names(job_name, namespace=None, field_selector=None):
             cmd.insert(-2, f'--field-selector={field_selector}')
 
         result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True)
+            cmd, capture_output=True, text=True, check=True, env=kubectl_env())
         
-        pods_data = json.loads(result.stdout)
+        pods_data = json_loads(result.stdout)
         items = pods_data.get('items', [])
         
         if not items:
@@ -461,40 +563,13 @@ _TRANSITIONAL_STATES = {
     'PodInitializing': 'Pod is initializing',
 }
 
-def _get_pod_events(pod_name, namespace, filter_warning=True):
-    """Get events for a pod."""
-    import kr8s
-
-    try:
-        events = kr8s.get(
-            "events",
-            namespace=namespace,
-            field_selector=f"involvedObject.name={pod_name},involvedObject.kind=Pod"
-        )
-        events_list = []
-        for e in events:
-            if filter_warning and e.raw.get('type') != 'Warning':
-                continue
-            if e.raw.get('reason') not in K8S_EVENTS:
-                continue
-            events_list.append({
-                'reason': e.raw.get('reason', ''),
-                'message': e.raw.get('message', '')
-            })
-        return events_list
-    except Exception:
-        return []
-
-
-def _handle_pod_status(pod, last_reported_reasons, namespace=None, pods_events_checked=None):
+def _handle_pod_status(pod, last_reported_reasons):
     """
     Process pod status and return result.
     
     Args:
         pod: kr8s Pod object
         last_reported_reasons: The last waiting reason we reported to avoid spam for each pod
-        namespace: Kubernetes namespace
-        pods_events_checked: Set of pod names for which events have been checked (to avoid duplicate event checks)
     
     Returns:
         tuple: (result, new_last_reported_reason)
@@ -505,22 +580,6 @@ def _handle_pod_status(pod, last_reported_reasons, namespace=None, pods_events_c
     pod_name = pod.name
     last_reported_reason = last_reported_reasons.get(pod_name)
 
-    # Check pod events once per pod (before phase checks)
-    if phase not in ('Running', 'Succeeded'):
-        if pods_events_checked is not None and pod_name not in pods_events_checked:
-            pod_warnings = _get_pod_events(pod_name, namespace)
-
-            # Retry once if no events yet (race condition)
-            if not pod_warnings:
-                time.sleep(0.5)  # Small delay to allow events to be registered
-                pod_warnings = _get_pod_events(pod_name, namespace)
-
-            if pod_warnings:
-                print(f"Warning events for pod {pod_name}:")
-                pods_events_checked.add(pod_name)
-                for event in pod_warnings:
-                    print(f"{event['reason']} - {event['message']}")
-
     if phase == 'Running':
         logging.info(f"Pod {pod_name} is Running.")
         return 'running', last_reported_reasons
@@ -575,93 +634,126 @@ def _handle_pod_status(pod, last_reported_reasons, namespace=None, pods_events_c
     return None, last_reported_reasons
 
 
-def _get_job_status(job_name, namespace):
+def _job_status_from_raw(status):
     """
-    Get Job status to check if it has failed (backoffLimit reached) or succeeded.
+    Summarize a Job's raw status block.
 
-    Args:
-        job_name (str): Name of the job.
-        namespace (str): Kubernetes namespace.
-    
     Returns:
-        dict with keys: 'active', 'succeeded', 'failed', 'complete', 'failed_permanently'
-        Or None if job not found.
+        dict with keys: 'active', 'succeeded', 'failed', 'complete', 'failed_permanently', 'failure_reason',
+        'failure_message', 'completed_indexes', 'failed_indexes' (index ranges such as '0-3,7', Indexed jobs only)
     """
-    from kr8s.objects import Job
+    # Check conditions for Complete or Failed
+    conditions = status.get('conditions', [])
+    is_complete = False
+    is_failed_permanently = False
+    failure_reason = None
+    failure_message = None
+
+    for cond in conditions:
+        if cond.get('type') == 'Complete' and cond.get('status') == 'True':
+            is_complete = True
+        if cond.get('type') == 'Failed' and cond.get('status') == 'True':
+            is_failed_permanently = True
+            failure_reason = cond.get('reason', '')
+            failure_message = cond.get('message', '')
 
-    try:
-        job = Job.get(job_name, namespace=namespace)
-        status = job.status
-        
-        # Check conditions for Complete or Failed
-        conditions = status.get('conditions', [])
-        is_complete = False
-        is_failed_permanently = False
-        failure_reason = None
-        
-        for cond in conditions:
-            if cond.get('type') == 'Complete' and cond.get('status') == 'True':
-                is_complete = True
-            if cond.get('type') == 'Failed' and cond.get('status') == 'True':
-                is_failed_permanently = True
-                failure_reason = cond.get('reason', '')
-        
-        return {
-            'active': status.get('active', 0),
-            'succeeded': status.get('succeeded', 0),
-            'failed': status.get('failed', 0),
-            'complete': is_complete,
-            'failed_permanently': is_failed_permanently,
-            'failure_reason': failure_reason,
-        }
-    except Exception:
-        return None
+    return {
+        'active': status.get('active', 0),
+        'succeeded': status.get('succeeded', 0),
+        'failed': status.get('failed', 0),
+        'complete': is_complete,
+        'failed_permanently': is_failed_permanently,
+        'failure_reason': failure_reason,
+        'failure_message': failure_message,
+        'completed_indexes': status.get('completedIndexes', ''),
+        'failed_indexes': status.get('failedIndexes', ''),
+    }
 
-def _get_job_events(job_name, namespace, filter_warning=True):
-    """Get recent events for a job."""
-    import kr8s
-    from kr8s.objects import Job
 
-    try:
-        # Get the job's UID
-        job = Job.get(job_name, namespace=namespace)
-        job_uid = job.metadata.get('uid')
-
-        events = kr8s.get(
-            "events",
-            namespace=namespace,
-            field_selector=f"involvedObject.name={job_name},involvedObject.kind=Job"
-        )
-        
-        events_list = []
-        for e in events:
-            if filter_warning and e.raw.get('type') != 'Warning':
-                continue
-            if e.raw.get('reason') not in K8S_EVENTS:
-                continue
+# Completion index of a pod of an Indexed job
+_JOB_COMPLETION_INDEX_ANNOTATION = 'batch.kubernetes.io/job-completion-index'
 
-            if e.raw.get('involvedObject', {}).get('uid') == job_uid:
-                events_list.append({
-                    'reason': e.raw.get('reason', ''),
-                    'message': e.raw.get('message', '')
-                })
-        return events_list
-    
-    except Exception:
-        return []
 
-# INFO: Timeout is only checked when an event is received. 
-# INFO: If no events occur, the watch will exceed the timeout indefinitely until new events or errors occur.
-def wait_for_job_pods_ready(job_name, namespace=None, timeout=300):
+def count_indexes(index_ranges):
+    """Count the indexes in a Job index range string such as '0-3,7' (completedIndexes/failedIndexes)."""
+    count = 0
+    for part in (index_ranges or '').split(','):
+        if not part:
+            continue
+        start, _, end = part.partition('-')
+        count += int(end) - int(start) + 1 if end else 1
+    return count
+
+
+def _pod_label(pod):
+    """Pod name with its completion index for pods of Indexed jobs, e.g. 'my-job-3-x7k2p (index 3)'."""
+    index = pod.metadata.get('annotations', {}).get(_JOB_COMPLETION_INDEX_ANNOTATION)
+    return f"{pod.name} (index {index})" if index is not None else pod.name
+
+
+def _describe_pod_failure_rule(rule):
+    """Human readable pod failure policy rule, e.g. 'FailJob on exit codes In [1, 2]'."""
+    if 'onExitCodes' in rule:
+        on_exit_codes = rule['onExitCodes']
+        container = f" (container {on_exit_codes['containerName']})" if on_exit_codes.get('containerName') else ''
+        return f"{rule['action']} on exit codes {on_exit_codes.get('operator')} {on_exit_codes.get('values')}{container}"
+    conditions = ', '.join(c.get('type', '') for c in rule.get('onPodConditions', []))
+    return f"{rule['action']} on pod condition {conditions}"
+
+
+def _match_pod_failure_rule(rules, pod_raw):
     """
-    Wait for a Job pod to be in Running state, or handle terminal/failure states.
-    Uses kr8s watch for efficient single-connection streaming updates.
+    Find the first pod failure policy rule matching a failed pod (same semantics as the Job controller).
+
+    Returns:
+        tuple: (rule index, rule) or (None, None) if no rule matches.
+    """
+    status = pod_raw.get('status', {})
+    container_statuses = status.get('containerStatuses', []) + status.get('initContainerStatuses', [])
+    true_conditions = {c.get('type') for c in status.get('conditions', []) if c.get('status') == 'True'}
+
+    for i, rule in enumerate(rules or []):
+        if 'onExitCodes' in rule:
+            requirement = rule['onExitCodes']
+            values = set(requirement.get('values', []))
+            for cs in container_statuses:
+                if requirement.get('containerName') and cs.get('name') != requirement['containerName']:
+                    continue
+                exit_code = cs.get('state', {}).get('terminated', {}).get('exitCode')
+                # Successful containers (exit code 0) are excluded from the check
+                if not exit_code:
+                    continue
+                if (exit_code in values) == (requirement.get('operator') == 'In'):
+                    return i, rule
+        else:
+            for condition in rule.get('onPodConditions', []):
+                if condition.get('type') in true_conditions:
+                    return i, rule
+    return None, None
+
+
+def _print_failure_message(job_status):
+    """Print the message of a Job's Failed condition (e.g. which pod failure policy rule fired)."""
+    if job_status.get('failure_message'):
+        print(f"  Message: {job_status['failure_message']}")
+
+
+def _print_index_status(job_name, job_status):
+    """Print per-index progress of an Indexed job."""
+    if job_status.get('completed_indexes') or job_status.get('failed_indexes'):
+        print(f"Job {job_name} indexes - completed: {job_status['completed_indexes'] or 'none'}, "
+              f"failed: {job_status['failed_indexes'] or 'none'}")
+
+def wait_for_job_pods_ready(job_name, namespace=None, timeout=300, job=None, min_running=1, timeline=None):
+    """
+    Wait for Job pods to be in Running state, or handle terminal/failure states.
+    Pods and the Job are watched concurrently by the asyncio wait engine (see jet.wait), which
+    stops exactly at the timeout even if no event occurs.
     
     Behaviors:
-    - If pod reaches Running state, return the pod name
-    - If pod reaches Succeeded state, return the pod name
+    - If `min_running` pods reach Running (or Succeeded) state, return the name of the first one
     - If pod fails, print logs and continue watching for retries/new pods
-    - If Job reaches backoffLimit (permanent failure), return None
+    - If Job reaches backoffLimit (permanent failure) or is deleted, return None
     - If pod is in a waiting state (ImagePullBackOff, etc.), inform user and keep waiting
     - Handle fast completion where pod goes to terminal state quickly
 
@@ -669,145 +761,35 @@ def wait_for_job_pods_ready(job_name, namespace=None, timeout=300):
         job_name (str): Name of the job.
         namespace (str): Kubernetes namespace. If None, uses current kubectl context namespace.
         timeout (int): Maximum time to wait in seconds.
+        job (dict): Optional Job object as returned by submit_job. When provided, its UID and
+            status are used directly instead of fetching the Job again before watching.
+        min_running (int): Number of pods that must be running, e.g. the PodGroup minMember of a
+            gang scheduled job.
+        timeline (timeline.LaunchTimeline): Optional timeline to record the launch steps in.
     
     Returns:
         str: Pod name if pod reached running/succeeded, or None if failed/timeout.
     """
-    import kr8s
-    import httpx
-    from kr8s.objects import Job
+    from .k8s_api import run_sync
+    from .wait import wait_for_job_pods
 
     namespace = namespace if namespace else get_current_namespace()
-    start_time = time.time()
-    last_reported_reasons = {}
-    failed_pods_logged = set()  # Track pods we have already printed logs for
-    pods_events_checked = set()  # Track pods for which we have checked events
-
     logging.info(f"Watching pods for job {job_name}...")
 
-    # Get job UID
     try:
-        job = Job.get(job_name, namespace=namespace)
-        job_uid = job.metadata.get('uid')
-    except Exception:
-        print(f"Job {job_name} not found in namespace {namespace}")
+        return run_sync(wait_for_job_pods, job_name, namespace, timeout, job=job, min_running=min_running,
+                        timeline=timeline)
+    except KeyboardInterrupt:
+        print("\nInterrupted while waiting for pod.")
         return None
-    
-    # TODO: Should a small delay be added here to allow initial pod creation? Otherwise should one more watch for Job events be added?
-    
-    # Check if job already failed or has warning events
-    # INFO: Checks for job events once before starting the watch. Any adverse events after that will not be reported.
-    job_status = _get_job_status(job_name, namespace)
-    if job_status['failed_permanently']:
-        print(f"Job {job_name} failed: {job_status['failure_reason']}")
-        for event in _get_job_events(job_name, namespace):
-            print(f"{event['reason']}: {event['message']}")
+    except Exception as e:
+        logging.error(f"Error watching pods for job {job_name}: {e}")
         return None
-    
-    # Even if not failed yet, warn about issues
-    warning_events = _get_job_events(job_name, namespace)
-    if warning_events and job_status['active'] == 0:
-        print(f"Job {job_name} has warnings and no active pods:")
-        for event in warning_events:
-            print(f"{event['reason']}: {event['message']}")
-
-    while True:
-        # Check if we've exceeded total timeout
-        elapsed = time.time() - start_time
-        if elapsed >= timeout:
-            print(f"Timeout waiting for job {job_name} pods after {timeout}s.")
-            return None
-        
-        try:
-            for event, pod in kr8s.watch(
-                "pods",
-                namespace=namespace,
-                label_selector=f"job-name={job_name}",
-            ):
-                # Check timeout
-                elapsed = time.time() - start_time
-                if elapsed >= timeout:
-                    print(f"Timeout waiting for job {job_name} pods after {timeout}s.")
-                    return None
-                
-                # Skip pods from previous job instances (same name, different UID)
-                owner_refs = pod.metadata.get('ownerReferences', [])
-                pod_job_uid = None
-                for ref in owner_refs:
-                    if ref.get('kind') == 'Job':
-                        pod_job_uid = ref.get('uid')
-                        break
-                if pod_job_uid != job_uid:
-                    logging.debug(f"Skipping pod {pod.name} from previous job instance")
-                    continue
-
-                # Skip DELETED events
-                if event == "DELETED":
-                    logging.debug(f"Pod {pod.name} was deleted.")
-                    time.sleep(0.5)
-                    job_status = _get_job_status(job_name, namespace)
-                    if job_status is None:
-                        print(f"Job {job_name} was deleted.")
-                        return None
-
-                    if job_status['failed_permanently']:
-                        reason = job_status.get('failure_reason', 'BackoffLimitExceeded')
-                        print(f"Job {job_name} has permanently failed. Reason: {reason}")
-                        return None
-                    
-                    continue
-
-                # Process ADDED and MODIFIED events
-                result, last_reported_reasons = _handle_pod_status(pod, last_reported_reasons, namespace, pods_events_checked)
-                
-                if result == 'running':
-                    return pod.name
-                
-                elif result == 'succeeded':
-                    logging.info(f"Pod {pod.name} completed successfully (Succeeded).")
-                    return pod.name
-                
-                elif result == 'failed':
-                    if pod.name not in failed_pods_logged:
-                        print(f"Pod {pod.name} failed. Printing logs...")
-                        get_logs(pod.name, namespace, follow=False, timeout=30)
-                        failed_pods_logged.add(pod.name)
-                    
-                        time.sleep(0.5)
-                        job_status = _get_job_status(job_name, namespace)
-                        if job_status:
-                            if job_status['failed_permanently']:
-                                reason = job_status.get('failure_reason', 'BackoffLimitExceeded')
-                                print(f"Job {job_name} has permanently failed. Reason: {reason}")
-                                return None
-                            elif job_status['active'] > 0:
-                                print(f"Job has {job_status['active']} active pod(s). Continuing to watch...")
-                            else:
-                                logging.info(f"No active pods for job {job_name}, waiting for new pod or job failure...")
-
-        except KeyboardInterrupt:
-            print("\nInterrupted while waiting for pod.")
-            return None
-        
-        except (httpx.RemoteProtocolError, kr8s._exceptions.ServerError, kr8s._exceptions.ConnectionClosedError) as e:
-            elapsed = time.time() - start_time
-            remaining = timeout - elapsed
-            
-            if remaining <= 0:
-                print(f"Timeout waiting for job {job_name} pods after {timeout}s.")
-                return None
-            
-            logging.warning(f"Watch connection error: {e}. Retrying in 2s... ({int(remaining)}s remaining)")
-            time.sleep(2)
-        
-        except Exception as e:
-            logging.error(f"Error watching pods for job {job_name}: {e}")
-            return None
 
 def wait_for_pod_ready(pod_name, namespace=None, timeout=300):
     """
     Wait for a Kubernetes pod to be in the 'Running' state, or handle terminal states.
-    Uses kr8s watch for efficient single-connection streaming updates.
+    Uses the asyncio wait engine (see jet.wait), which stops exactly at the timeout.
     
     Behaviors:
     - Returns 'running' if pod reaches Running state
@@ -824,38 +806,14 @@ def wait_for_pod_ready(pod_name, namespace=None, timeout=300):
     Returns:
         str: 'running', 'succeeded', 'failed', or 'timeout'
     """
-    import kr8s
+    from .k8s_api import run_sync
+    from .wait import wait_for_pod
 
     namespace = namespace if namespace else get_current_namespace()
-    start_time = time.time()
-    last_reported_reasons = {}
-
     logging.info(f"Watching pod {pod_name} for ready state...")
 
     try:
-        # Use kr8s to watch a specific pod by field selector
-        for event, pod in kr8s.watch(
-            "pods",
-            namespace=namespace,
-            field_selector=f"metadata.name={pod_name}",
-        ):
-            # Check timeout
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
-                print(f"Timeout waiting for pod {pod_name} after {timeout}s.")
-                return 'timeout'
-
-            # Skip DELETED events
-            if event == "DELETED":
-                logging.warning(f"Pod {pod_name} was deleted while waiting.")
-                return 'failed'
-
-            # Process ADDED and MODIFIED events
-            result, last_reported_reasons = _handle_pod_status(pod, last_reported_reasons)
-            
-            if result is not None:
-                return result
-
+        return run_sync(wait_for_pod, pod_name, namespace, timeout)
     except KeyboardInterrupt:
         print("\nInterrupted while waiting for pod.")
         return 'timeout'
@@ -875,9 +833,10 @@ def get_shell_from_container_spec(pod_name, namespace=None, container_name=None)
             capture_output=True, 
             text=True,
             timeout=10,
-            check=True
+            check=True,
+            env=kubectl_env()
         )
-        pod_spec = json.loads(result.stdout)
+        pod_spec = json_loads(result.stdout)
         
         containers = pod_spec.get("spec", {}).get("containers", [])
         if not containers:
@@ -929,7 +888,8 @@ def detect_shell(pod_name, namespace=None, container_name=None):
             result = subprocess.run(
                 base_cmd + ["--", "test", "-x", shell],
                 capture_output=True,
-                timeout=2
+                timeout=2,
+                env=kubectl_env()
             )
             logging.debug(f"Probing for shell {shell}, result code: {result}")
             if result.returncode == 0:
@@ -960,7 +920,7 @@ def exec_into_pod(pod_name, namespace=None, shell='/bin/sh', container_name=None
             cmd += ['-c', container_name]
         cmd += ['--', shell]
         
-        result = subprocess.run(cmd, check=False)
+        result = subprocess.run(cmd, check=False, env=kubectl_env())
 
         # Exit code 130 = user pressed Ctrl+C in the shell (normal)
         if result.returncode == 130:
@@ -1015,31 +975,38 @@ class TemplateInfo:
 
 class TemplateManager():
     def __init__(self, templates_dir=None):
-        if templates_dir is None:
-            self.templates_dir = JET_HOME / "templates"
+        from .defaults import JET_TEMPLATE_REGISTRY, DEFAULT_TEMPLATE_REGISTRY_CACHE_SECONDS
+
+        if templates_dir is None and JET_TEMPLATE_REGISTRY:
+            # Shared registry: read through a local cache and avoid metadata operations on the shared filesystem
+            import hashlib
+
+            self.templates_dir = Path(JET_TEMPLATE_REGISTRY).expanduser()
+            registry_key = hashlib.sha1(str(self.templates_dir.absolute()).encode()).hexdigest()[:16]
+            self.store = TemplateStore(self.templates_dir,
+                                       cache_dir=Path(XDG_CACHE_HOME) / "jet" / "templates" / registry_key,
+                                       cache_seconds=DEFAULT_TEMPLATE_REGISTRY_CACHE_SECONDS)
         else:
-            self.templates_dir = Path(templates_dir)
-        self.templates_dir.mkdir(parents=True, exist_ok=True)
-        self.TS_RE = re.compile(r"_template_(?P<ts>\d{8}-\d{6}-\d{6})\.(yaml|yml)$")
+            self.templates_dir = JET_HOME / "templates" if templates_dir is None else Path(templates_dir)
+            self.templates_dir.mkdir(parents=True, exist_ok=True)
+            self.store = TemplateStore(self.templates_dir)
 
     def save_job_template(self, job_config, job_name, job_type, verbose= False):
-        print_job_yaml(yaml.dump(job_config, sort_keys=False, default_flow_style=False),
-                    verbose=verbose)
-
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S-%f")
-        filename = f"{job_name}_{job_type}_template_{timestamp}.yaml"
-        job_yaml_path = self.templates_dir / filename
-        # Write YAML
-        with job_yaml_path.open("w") as f:
-            yaml.dump(job_config, f, sort_keys=False, default_flow_style=False)
+        job_yaml = yaml_dump(job_config)
+        print_job_yaml(job_yaml, verbose=verbose)
 
-        print(f"Job template saved to {job_yaml_path}")
+        job_yaml_path, created = self.store.save(job_yaml, job_name, job_type)
+        if created:
+            print(f"Job template saved to {job_yaml_path}")
+        else:
+            print(f"Job template {job_name} is unchanged, latest version: {job_yaml_path}")
         return str(job_yaml_path)
 
     def resolve_template_path(self, template_arg: str, job_type: str) -> str:
         """
         Resolve either:
         - a path to an existing YAML file (absolute or relative), or
+        - a template version name, e.g. {job_name}_{job_type}_template_{timestamp}, or
         - a template name (job_name) which will be searched in ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/
             matching: {job_name}_{job_type}_template_*.yaml or *.yml
         Returns the absolute path to the template file as a string.
@@ -1050,52 +1017,36 @@ class TemplateManager():
         if candidate.is_file():
             return str(candidate)
 
-        # Fallback: search ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/ for matching template files
-        if not self.templates_dir.is_dir():
-            raise ValueError(f"Template directory not found: {self.templates_dir}. Please ensure it exists.")
+        # A specific template version, by the version name `jet list templates` shows (with or without extension)
+        entries = self.store.entries()
+        for version_name in (template_arg, Path(template_arg).stem):
+            if version_name in entries:
+                return str(self.store.path(version_name, entries[version_name]))
 
+        # Fallback: search ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/ for matching template files
         # Use stem of template_arg to accept inputs like "foo", "foo.yaml", or "dir/foo"
         job_name_stem = Path(template_arg).stem
-        prefix = f"{job_name_stem}_{job_type}_template_"
 
-        # Gather matches (only files), support .yaml and .yml
-        matches = [p for p in self.templates_dir.iterdir()
-                if p.is_file() and p.suffix.lower() in (".yaml", ".yml") and p.name.startswith(prefix)]
+        # Indexed matches, newest first (.yaml and .yml)
+        matches = self.store.find(job_name_stem, job_type)
 
         if not matches:
+            if not self.templates_dir.is_dir():
+                raise ValueError(f"Template directory not found: {self.templates_dir}. Please ensure it exists.")
             raise ValueError(
                 f"No templates named {job_name_stem} found in {self.templates_dir} for job type {job_type}. "
                 "Provide a valid template name saved in ~/.local/share/jet/templates/ or $XDG_DATA_HOME/jet/templates/ or a full path to a job yaml file."
             )
 
-        latest = max(matches, key=lambda p: p.stat().st_mtime)
-        return str(latest)
+        return str(self.store.path(*matches[0]))
 
     def _discover_all(self):
         infos = []
-        for p in self.templates_dir.iterdir():
-            if not p.is_file():
-                continue
-            ti = TemplateInfo.from_path(p)
-            if ti:
-                infos.append(ti)
+        for name, entry in self.store.entries().items():
+            # Versions are listed by name, which --template and `jet templates prune` use too
+            infos.append(TemplateInfo(path=name, job_name=entry["job_name"], job_type=entry["job_type"],
+                                      timestamp=datetime.fromtimestamp(entry["ts"], tz=timezone.utc)))
         return infos
-        
-    def _ts_from_template_info(self, ti):
-        """
-        Extract timestamp from template info (the one you write into templates).
-        Return a timezone-aware datetime in UTC if parse succeeds.
-        If parsing fails, fallback to filesystem mtime (UTC).
-        If that also fails, return epoch (1970-01-01 UTC).
-        """
-        if ti.timestamp is not None:
-            return ti.timestamp
-
-        # fallback to filesystem mtime if timestamp not present
-        try:
-            return datetime.fromtimestamp(Path(ti.path).stat().st_mtime, tz=timezone.utc)
-        except Exception:
-            return datetime.fromtimestamp(0, tz=timezone.utc)
 
     def list_templates(self, job_type=None, verbose=False,
                    filter_by=None, filter_regex=None,
@@ -1128,11 +1079,7 @@ class TemplateManager():
             if regex and not regex.search(ti.job_name):
                 continue
 
-            # Determine timestamp: use parsed timestamp from TemplateInfo when available,
-            # otherwise fall back to filesystem mtime (UTC), otherwise epoch.
-            ts = self._ts_from_template_info(ti)
-
-            grouped[ti.job_type][ti.job_name]["versions"].append((str(ti.path), ts))
+            grouped[ti.job_type][ti.job_name]["versions"].append((ti.path, ti.timestamp))
 
         # For each job_name sort versions newest-first and set latest & _latest_ts
         for jtype, jobs in grouped.items():
@@ -1197,7 +1144,8 @@ class TemplateManager():
             print("No templates found")
             return
 
-        # If verbose, print all paths and mark latest
+        # If verbose, print all versions with the file holding them and mark latest
+        entries = self.store.entries() if verbose else {}
         templates_dict = {}
         for jtype, jobs in templates.items():
             templates_dict[jtype] = {}
@@ -1206,15 +1154,45 @@ class TemplateManager():
                     paths_info = []
                     for p in info.get("paths", []):
                         mark = " (latest)" if p == info.get("latest") else ""
-                        paths_info.append(f"{p}{mark}")
+                        source = f" - {self.store.source_path(p, entries[p])}" if p in entries else ""
+                        paths_info.append(f"{p}{mark}{source}")
                     templates_dict[jtype][jname] = paths_info
                 else:
                     mark = " (latest)" if info.get("latest") else ""
                     templates_dict[jtype][jname] = f"{info.get('latest', 'None')}{mark}"
         print_tables_wrapped(templates_dict, headers=["Job Type", "Template Name", "Template(s)"], padding=4)
     
-    # TODO: add delete_template method
-    # TODO: add clear_templates method
+    def prune_templates(self, keep=1, older_than=None, job_name=None, job_type=None, dry_run=False):
+        """
+        Remove old template versions, keeping the `keep` newest versions of every template.
+
+        Args:
+            keep (int): Number of newest versions kept per template.
+            older_than (float): Only remove versions older than this many seconds.
+            job_name (str): Only prune versions of this template.
+            job_type (str): Only prune templates of this job type.
+            dry_run (bool): Print the versions that would be removed without removing them.
+
+        Returns:
+            list: Removed version names.
+        """
+        pruned = self.store.prune(keep=keep, older_than=older_than, job_name=job_name, job_type=job_type, dry_run=dry_run)
+        action = "Would remove" if dry_run else "Removed"
+        for name in pruned:
+            print(f"{action} {name}")
+        print(f"{action} {len(pruned)} template version(s)")
+        return pruned
+
+    def delete_template(self, job_name, job_type=None, dry_run=False):
+        """Delete all versions of a template (of every job type unless job_type is given)."""
+        pruned = self.prune_templates(keep=0, job_name=job_name, job_type=job_type, dry_run=dry_run)
+        if not pruned:
+            raise ValueError(f"No templates named {job_name} found" + (f" for job type {job_type}" if job_type else ""))
+        return pruned
+
+    def clear_templates(self, job_type=None, dry_run=False):
+        """Delete all templates (of a job type if given)."""
+        return self.prune_templates(keep=0, job_type=job_type, dry_run=dry_run)
 
 # Pretty print functions (for listing templates and other items)
 def _is_scalar(x):
@@ -1366,30 +1344,29 @@ def print_tables_wrapped(data,
             print((" " * padding).join(out_cells))
 
 
-def get_cluster_resources():
-    """Query kube-state-metrics and display cluster resource availability.
-        
+def get_node_resources(timeout=10):
+    """Query kube-state-metrics for per-node allocatable and requested resources.
+
+    Args:
+        timeout (float): Request timeout in seconds.
+
     Returns:
-        0 on success, 1 on error
+        dict: node name -> {'cpu_allocatable', 'cpu_requests', 'mem_allocatable', 'mem_requests' (GB),
+              'gpu_allocatable', 'gpu_requests', 'gpu_product', 'gpu_count', 'unschedulable', 'labels'}
+
+    Raises:
+        httpx.RequestError, httpx.HTTPStatusError: If kube-state-metrics cannot be queried.
     """
     import httpx
-    from tabulate import tabulate
 
     url = KUBE_STATE_METRICS_URL
 
     logging.info(f"Connecting to kube-state-metrics at: {url}")
 
-    try:
-        response = httpx.get(url, timeout=10)
-        response.raise_for_status()
-        logging.info(f"Successfully connected")
-        logging.info(f"Response size: {len(response.text)} bytes")
-    except httpx.RequestError as e:
-        logging.error(f"Error connecting: {e}")
-        return 1
-    except httpx.HTTPStatusError as e:
-        logging.error(f"HTTP error: {e}")
-        return 1
+    response = httpx.get(url, timeout=timeout)
+    response.raise_for_status()
+    logging.info(f"Successfully connected")
+    logging.info(f"Response size: {len(response.text)} bytes")
 
     # Parse Prometheus metrics
     metrics = _parse_prometheus_metrics(response.text)
@@ -1403,7 +1380,8 @@ def get_cluster_resources():
         'gpu_requests': 0,
         'gpu_product': 'N/A',
         'gpu_count': '0',
-        'unschedulable': False
+        'unschedulable': False,
+        'labels': {}
     })
 
     # Track pod phases (namespace/pod -> phase)
@@ -1499,6 +1477,9 @@ def get_cluster_resources():
                 if not node:
                     continue
 
+                # Node labels exposed by kube-state-metrics (label_<sanitized name>), used for node selector matching
+                nodes[node]['labels'].update({k[len('label_'):]: v for k, v in labels.items() if k.startswith('label_')})
+
                 # Check for GPU product label
                 if 'label_nvidia_com_gpu_product' in labels:
                     gpu_product = labels['label_nvidia_com_gpu_product']
@@ -1524,6 +1505,27 @@ def get_cluster_resources():
                 nodes[node]['mem_requests'] += resources['memory']
                 nodes[node]['gpu_requests'] += resources['gpu']
 
+    return dict(nodes)
+
+
+def get_cluster_resources():
+    """Query kube-state-metrics and display cluster resource availability.
+        
+    Returns:
+        0 on success, 1 on error
+    """
+    import httpx
+    from tabulate import tabulate
+
+    try:
+        nodes = get_node_resources()
+    except httpx.RequestError as e:
+        logging.error(f"Error connecting: {e}")
+        return 1
+    except httpx.HTTPStatusError as e:
+        logging.error(f"HTTP error: {e}")
+        return 1
+
     # Format output table
     table_data = []
     for node_name in sorted(nodes.keys()):
@@ -1582,6 +1584,44 @@ def get_cluster_resources():
     return 0
 
 
+_QUANTITY_SUFFIXES = {
+    'Ki': 1024, 'Mi': 1024**2, 'Gi': 1024**3, 'Ti': 1024**4, 'Pi': 1024**5, 'Ei': 1024**6,
+    'n': 1e-9, 'u': 1e-6, 'm': 1e-3, 'k': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+}
+
+
+def parse_quantity(quantity):
+    """
+    Parse a Kubernetes resource quantity (e.g. '500m', '4', '16Gi', '1e3') into a number.
+
+    Returns:
+        float: Value in base units (cores for CPU, bytes for memory).
+    """
+    value = str(quantity).strip()
+    match = re.fullmatch(r'([+-]?[0-9.]+(?:[eE][+-]?[0-9]+)?)([A-Za-z]*)', value)
+    if not match or (match.group(2) and match.group(2) not in _QUANTITY_SUFFIXES):
+        raise ValueError(f"Invalid resource quantity: {quantity}")
+    number, suffix = match.groups()
+    return float(number) * _QUANTITY_SUFFIXES.get(suffix, 1)
+
+
+_DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_duration(duration):
+    """
+    Parse a duration such as '90s', '30m', '12h', '7d' or '2w' (a bare number is seconds).
+
+    Returns:
+        float: Duration in seconds.
+    """
+    match = re.fullmatch(r'([0-9]+(?:\.[0-9]+)?)\s*([smhdw]?)', str(duration).strip())
+    if not match:
+        raise ValueError(f"Invalid duration: {duration}. Use e.g. 90s, 30m, 12h, 7d or 2w")
+    number, unit = match.groups()
+    return float(number) * _DURATION_UNITS.get(unit or 's')
+
+
 def _parse_prometheus_metrics(text):
     """Parse Prometheus text format metrics into a dictionary.
     
@@ -0,0 +1,419 @@
+"""Asyncio wait engine for job and pod startup (used by wait_for_job_pods_ready and wait_for_pod_ready).
+
+Pods and the Job are followed by resumable list + watch streams (k8s_api.ResourceWatch) running
+as concurrent tasks that feed one queue. The waiting loop consumes the queue with the remaining
+time as timeout, so the deadline is exact even when no event arrives. Warning events come from
+the namespace's event informer (event_informer.py), which feeds the same queue, so warnings of
+the Job and its pods are printed as soon as they are recorded, including late ones; the Job
+status comes from its own watch instead of extra requests.
+"""
+import asyncio
+import logging
+
+from .event_informer import is_warning
+from .utils import (
+    _handle_pod_status, _job_status_from_raw, _match_pod_failure_rule, _describe_pod_failure_rule,
+    _print_failure_message, _print_index_status, _pod_label,
+)
+
+
+# Longest time spent printing the logs of a failed pod (never beyond the wait deadline)
+_LOGS_TIMEOUT_SECONDS = 30
+
+
+async def _follow(watch, queue, tag=None):
+    """Put the (kind or tag, event, raw object) of a ResourceWatch on the queue."""
+    try:
+        async for event, obj in watch.events():
+            await queue.put((tag or watch.kind, event, obj))
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        await queue.put(('error', None, e))
+
+
+async def _event_informer(namespace, api):
+    """Shared event informer of the namespace, or None if events cannot be watched (e.g. no RBAC access)."""
+    from .event_informer import get_event_informer
+
+    try:
+        return await get_event_informer(namespace, api=api)
+    except Exception as e:
+        logging.debug(f"Not reporting warning events in namespace {namespace}: {e}")
+        return None
+
+
+def _print_warnings(label, events, reported):
+    """Print the warning events that were not printed yet."""
+    for event in events:
+        if event['metadata']['name'] not in reported:
+            reported.add(event['metadata']['name'])
+            print(f"{label}: {event['reason']} - {event.get('message', '')}")
+
+
+async def _print_pod_logs(pod, timeout=_LOGS_TIMEOUT_SECONDS):
+    """Print the logs of a (terminated) pod, for at most `timeout` seconds."""
+    async def stream():
+        async for line in pod.logs(timeout=timeout):
+            print(line)
+
+    try:
+        await asyncio.wait_for(stream(), timeout)
+    except asyncio.TimeoutError:
+        logging.warning(f"Stopped printing logs of pod {pod.name} after {timeout:.1f}s.")
+    except Exception as e:
+        logging.error(f"Error streaming logs for pod {pod.name}: {e}")
+
+
+def _owner_job_uid(pod_raw):
+    for ref in pod_raw['metadata'].get('ownerReferences', []):
+        if ref.get('kind') == 'Job':
+            return ref.get('uid')
+    return None
+
+
+async def _stop(tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def wait_for_job_pods(job_name, namespace, timeout, job=None, min_running=1, api=None, timeline=None):
+    """
+    Wait for Job pods to be running, or for the Job to fail (see utils.wait_for_job_pods_ready).
+
+    Args:
+        job_name (str): Name of the job.
+        namespace (str): Kubernetes namespace.
+        timeout (float): Maximum time to wait in seconds.
+        job (dict): Optional Job object as returned by submit_job.
+        min_running (int): Number of pods that must be running.
+        api: Optional kr8s async API client. Defaults to the shared client.
+        timeline (timeline.LaunchTimeline): Optional timeline to record the launch steps of the pods in.
+
+    Returns:
+        str: Name of the first pod that became ready, or None if the job failed, was deleted or the timeout expired.
+    """
+    from kr8s.asyncio.objects import Pod
+    from .k8s_api import get_api, get_resource, ResourceWatch
+
+    api = api or await get_api()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    last_reported_reasons = {}
+    failed_pods_logged = set()  # Pods we have already printed logs for
+    job_pod_uids = {}  # UID -> name of the pods of this job instance
+    reported_events = set()  # Names of the warning events already printed
+    ready_pods = {}  # Running/succeeded pods, in the order they became ready
+
+    # Get job UID and status, from the submitted object if available
+    if job is None:
+        job = await get_resource('Job', job_name, namespace=namespace, api=api)
+        if job is None:
+            print(f"Job {job_name} not found in namespace {namespace}")
+            return None
+    job_uid = job.get('metadata', {}).get('uid')
+    job_status = _job_status_from_raw(job.get('status', {}))
+    pod_failure_rules = job.get('spec', {}).get('podFailurePolicy', {}).get('rules', [])
+    informer = await _event_informer(namespace, api)
+
+    if job_status['failed_permanently']:
+        print(f"Job {job_name} failed: {job_status['failure_reason']}")
+        _print_failure_message(job_status)
+        _print_index_status(job_name, job_status)
+        if informer:
+            _print_warnings(f"Job {job_name}", informer.warnings(uid=job_uid), reported_events)
+        return None
+
+    # Even if not failed yet, warn about issues
+    if informer and job_status['active'] == 0 and informer.warnings(uid=job_uid):
+        print(f"Job {job_name} has warnings and no active pods:")
+        _print_warnings(f"Job {job_name}", informer.warnings(uid=job_uid), reported_events)
+
+    queue = asyncio.Queue()
+    if informer:
+        informer.subscribe(queue)
+    watches = [
+        ResourceWatch('Pod', namespace=namespace, label_selector=f"job-name={job_name}", api=api),
+        ResourceWatch('Job', namespace=namespace, field_selector=f"metadata.name={job_name}", api=api),
+    ]
+    watchers = [loop.create_task(_follow(watch, queue)) for watch in watches]
+    # Set when a pod failed; the Job's next status update tells whether it is retried
+    report_after_failure = False
+
+    try:
+        while True:
+            try:
+                kind, event, obj = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                print(f"Timeout waiting for job {job_name} pods after {timeout}s.")
+                return None
+
+            if kind == 'error':
+                logging.error(f"Error watching pods for job {job_name}: {obj}")
+                return None
+
+            if kind == 'Event':
+                # Warnings of the job and its pods, as they are recorded
+                involved_uid = obj.get('involvedObject', {}).get('uid')
+                if timeline and event != 'DELETED' and involved_uid in job_pod_uids:
+                    timeline.record_event(obj)
+                if event != 'DELETED' and is_warning(obj):
+                    if involved_uid == job_uid:
+                        _print_warnings(f"Job {job_name}", [obj], reported_events)
+                    elif involved_uid in job_pod_uids:
+                        _print_warnings(f"Pod {job_pod_uids[involved_uid]}", [obj], reported_events)
+                continue
+
+            if kind == 'Job':
+                if obj['metadata'].get('uid') != job_uid:
+                    continue
+                if event == 'DELETED':
+                    print(f"Job {job_name} was deleted.")
+                    return None
+                job_status = _job_status_from_raw(obj.get('status', {}))
+                if job_status['failed_permanently']:
+                    reason = job_status.get('failure_reason', 'BackoffLimitExceeded')
+                    print(f"Job {job_name} has permanently failed. Reason: {reason}")
+                    _print_failure_message(job_status)
+                    _print_index_status(job_name, job_status)
+                    return None
+                if report_after_failure:
+                    report_after_failure = False
+                    _print_index_status(job_name, job_status)
+                    if job_status['active'] > 0:
+                        print(f"Job has {job_status['active']} active pod(s). Continuing to watch...")
+                    else:
+                        logging.info(f"No active pods for job {job_name}, waiting for new pod or job failure...")
+                continue
+
+            # Skip pods from previous job instances (same name, different UID)
+            pod = Pod(obj, api=api)
+            if _owner_job_uid(obj) != job_uid:
+                logging.debug(f"Skipping pod {pod.name} from previous job instance")
+                continue
+
+            # Job failure and deletion are reported by the Job watch
+            if event == 'DELETED':
+                logging.debug(f"Pod {pod.name} was deleted.")
+                ready_pods.pop(pod.name, None)
+                continue
+
+            # Warnings recorded before the pod was first seen; later ones arrive as events
+            pod_uid = obj['metadata'].get('uid')
+            if pod_uid not in job_pod_uids:
+                job_pod_uids[pod_uid] = pod.name
+                if informer:
+                    _print_warnings(f"Pod {pod.name}", informer.warnings(uid=pod_uid), reported_events)
+            if timeline:
+                timeline.record_pod(obj)
+
+            # Process ADDED and MODIFIED events
+            result, last_reported_reasons = _handle_pod_status(pod, last_reported_reasons)
+
+            if result in ('running', 'succeeded'):
+                if result == 'succeeded':
+                    logging.info(f"Pod {pod.name} completed successfully (Succeeded).")
+                if pod.name not in ready_pods:
+                    ready_pods[pod.name] = True
+                    if min_running > 1:
+                        print(f"Gang: {len(ready_pods)}/{min_running} pods running")
+                if len(ready_pods) >= min_running:
+                    return next(iter(ready_pods))
+
+            elif result == 'failed':
+                ready_pods.pop(pod.name, None)
+                if pod.name not in failed_pods_logged:
+                    print(f"Pod {_pod_label(pod)} failed. Printing logs...")
+                    await _print_pod_logs(pod, timeout=min(_LOGS_TIMEOUT_SECONDS, max(deadline - loop.time(), 0)))
+                    failed_pods_logged.add(pod.name)
+
+                    rule_index, rule = _match_pod_failure_rule(pod_failure_rules, obj)
+                    if rule is not None:
+                        print(f"Pod failure policy rule {rule_index} matched: {_describe_pod_failure_rule(rule)}")
+                    report_after_failure = True
+    finally:
+        await _stop(watchers)
+        if informer:
+            informer.unsubscribe(queue)
+            logging.debug(f"Event informer: {informer.stats()}")
+            # Events of the pods that were recorded but not delivered yet (e.g. Pulled just before Running)
+            if timeline:
+                for pod_uid in job_pod_uids:
+                    for event in informer.events(uid=pod_uid):
+                        timeline.record_event(event)
+        for watch in watches:
+            logging.debug(f"{watch.kind} watch: {watch.stats()}")
+
+
+async def wait_for_pod(pod_name, namespace, timeout, api=None):
+    """
+    Wait for a pod to be running or terminated (see utils.wait_for_pod_ready).
+
+    Returns:
+        str: 'running', 'succeeded', 'failed', or 'timeout'
+    """
+    from kr8s.asyncio.objects import Pod
+    from .k8s_api import get_api, ResourceWatch
+
+    api = api or await get_api()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    last_reported_reasons = {}
+    pod_uid = None
+    reported_events = set()
+
+    queue = asyncio.Queue()
+    informer = await _event_informer(namespace, api)
+    if informer:
+        informer.subscribe(queue)
+    watch = ResourceWatch('Pod', namespace=namespace, field_selector=f"metadata.name={pod_name}", api=api)
+    watchers = [loop.create_task(_follow(watch, queue))]
+    try:
+        while True:
+            try:
+                kind, event, obj = await asyncio.wait_for(queue.get(), max(deadline - loop.time(), 0))
+            except asyncio.TimeoutError:
+                print(f"Timeout waiting for pod {pod_name} after {timeout}s.")
+                return 'timeout'
+
+            if kind == 'error':
+                logging.error(f"Error watching pod {pod_name}: {obj}")
+                return 'failed'
+
+            if kind == 'Event':
+                if pod_uid and event != 'DELETED' and is_warning(obj) and obj['involvedObject'].get('uid') == pod_uid:
+                    _print_warnings(f"Pod {pod_name}", [obj], reported_events)
+                continue
+
+            if event == "DELETED":
+                logging.warning(f"Pod {pod_name} was deleted while waiting.")
+                return 'failed'
+
+            if pod_uid is None:
+                pod_uid = obj['metadata'].get('uid')
+                if informer:
+                    _print_warnings(f"Pod {pod_name}", informer.warnings(uid=pod_uid), reported_events)
+
+            # Process ADDED and MODIFIED events
+            result, last_reported_reasons = _handle_pod_status(Pod(obj, api=api), last_reported_reasons)
+            if result is not None:
+                return result
+    finally:
+        await _stop(watchers)
+        if informer:
+            informer.unsubscribe(queue)
+        logging.debug(f"Pod watch: {watch.stats()}")
+
+
+# Phases each `jet wait --for` condition is met by; a job that reaches another final phase never meets it
+WAIT_CONDITIONS = {
+    'complete': ('complete',),
+    'failed': ('failed',),
+    'running': ('running', 'complete'),
+}
+
+
+async def wait_for_jobs(names, condition, namespace=None, label_selector=None, timeout=None, api=None):
+    """
+    Wait for many jobs to meet a condition, following all of them with a single list + watch.
+
+    Named jobs are followed with one watch of the namespace's jobs and jobs matching the label
+    selector with one watch of the selector, so the number of API requests does not grow with
+    the number of jobs. Named jobs that do not exist yet are waited for until they are created
+    or the timeout expires, and jobs that start matching the selector while waiting are waited
+    for as well. Each job is reported as soon as its outcome is known.
+
+    Args:
+        names (list[str]): Job names.
+        condition (str): 'complete', 'failed' or 'running' (see WAIT_CONDITIONS).
+        namespace (str): Kubernetes namespace.
+        label_selector (str): Optional label selector; matching jobs are waited for as well.
+        timeout (float): Maximum time to wait in seconds, or None to wait indefinitely.
+        api: Optional kr8s async API client. Defaults to the shared client.
+
+    Returns:
+        dict: Outcome per job name: 'met', the final phase that cannot meet the condition
+            ('complete', 'failed' or 'deleted'), 'not found' (never created before the timeout)
+            or 'timeout'. Empty if no job is named and none matches the selector.
+    """
+    from .api import JobStatus
+    from .k8s_api import get_api, ResourceWatch
+
+    api = api or await get_api()
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    met_phases = WAIT_CONDITIONS[condition]
+    outcomes = {}
+    pending = set()
+    seen = set()  # Pending jobs that exist (or existed) while waiting
+
+    def report(name, outcome, status=None):
+        outcomes[name] = outcome
+        pending.discard(name)
+        if outcome == 'met':
+            print(f"job.batch/{name} condition met")
+        elif outcome == 'failed' and status is not None and status.failure_reason:
+            print(f"job.batch/{name} failed: {status.failure_reason}")
+        else:
+            print(f"job.batch/{name} {outcome}")
+
+    def update(job, deleted=False):
+        name = job['metadata']['name']
+        if name not in pending:
+            return
+        seen.add(name)
+        status = JobStatus.from_raw(job)
+        if deleted:
+            report(name, 'deleted')
+        elif status.phase in met_phases:
+            report(name, 'met')
+        elif status.done:
+            report(name, status.phase, status)
+
+    # Named jobs are matched by name on the namespace's jobs; the selector is matched by the API server
+    watches = {}
+    if names:
+        watches['names'] = ResourceWatch('Job', namespace=namespace, api=api)
+    if label_selector:
+        watches['selector'] = ResourceWatch('Job', namespace=namespace, label_selector=label_selector, api=api)
+    listed = {source: await watch.list() for source, watch in watches.items()}
+
+    pending.update(names)
+    pending.update(job['metadata']['name'] for job in listed.get('selector', []))
+    if not pending:
+        return outcomes
+    for jobs in listed.values():
+        for job in jobs:
+            update(job)
+    for name in sorted(pending - seen):
+        print(f"job.batch/{name} not found yet, waiting for it to be created")
+
+    queue = asyncio.Queue()
+    watchers = [loop.create_task(_follow(watch, queue, tag=source)) for source, watch in watches.items()] if pending else []
+    try:
+        while pending:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            try:
+                source, event, obj = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                for name in sorted(pending):
+                    if name in seen:
+                        print(f"job.batch/{name} timed out waiting for the condition ({condition}) after {timeout}s")
+                        outcomes[name] = 'timeout'
+                    else:
+                        print(f"job.batch/{name} not found after {timeout}s")
+                        outcomes[name] = 'not found'
+                break
+            if source == 'error':
+                raise obj
+            name = obj['metadata']['name']
+            # Jobs that start matching the selector while waiting are waited for as well
+            if source == 'selector' and event != 'DELETED' and name not in outcomes:
+                pending.add(name)
+            update(obj, deleted=event == 'DELETED')
+    finally:
+        await _stop(watchers)
+        for watch in watches.values():
+            logging.debug(f"Job watch: {watch.stats()}")
+    return outcomes
@@ -0,0 +1,60 @@
+import pytest
+
+from jet.bulk import apply_overrides
+from jet.job_config import JobConfig, JobMetadata, JobSpec, PodSpec, ContainerSpec
+
+
+def make_config():
+    return JobConfig(
+        metadata=JobMetadata(name='base', labels={'job-type': 'batch'}),
+        spec=JobSpec(template_spec=PodSpec(containers=[ContainerSpec(name='main', image='base:1')])),
+    )
+
+
+def test_apply_overrides_sets_job_and_container_fields():
+    config = make_config()
+    apply_overrides(config, {
+        'name': 'run-1', 'namespace': 'team', 'image': 'trainer:2', 'command': 'python train.py',
+        'gpu': '2', 'gpu-type': 'a100', 'parallelism': '4', 'priority': 'high',
+    })
+    container = config.spec.template_spec.containers[0]
+    assert config.metadata.name == 'run-1'
+    assert config.metadata.namespace == 'team'
+    assert container.image == 'trainer:2'
+    assert container.args == ['python train.py']
+    assert container.resources.gpu_count == 2
+    assert container.resources.gpu_type == 'a100'
+    assert config.spec.template_spec.node_selectors == {'gpu-type': 'a100'}
+    assert config.spec.parallelism == 4
+    assert config.spec.template_spec.priority_class_name == 'high'
+
+
+def test_apply_overrides_splits_request_and_limit():
+    config = make_config()
+    apply_overrides(config, {'cpu': '2:4', 'memory': '8Gi'})
+    resources = config.spec.template_spec.containers[0].resources
+    assert (resources.cpu_request, resources.cpu_limit) == ('2', '4')
+    assert (resources.memory_request, resources.memory_limit) == ('8Gi', None)
+
+
+def test_apply_overrides_merges_env_and_labels():
+    config = make_config()
+    config.spec.template_spec.containers[0].env['KEEP'] = '1'
+    apply_overrides(config, {
+        'env': 'A=1 B=x=y', 'env.SEED': 7,
+        'job_labels': 'team=ml,run=a', 'pod_labels': ['role=worker'], 'node_selector': {'zone': 'a'},
+    })
+    assert config.spec.template_spec.containers[0].env == {'KEEP': '1', 'A': '1', 'B': 'x=y', 'SEED': '7'}
+    assert config.metadata.labels == {'job-type': 'batch', 'team': 'ml', 'run': 'a'}
+    assert config.spec.template_spec.labels == {'role': 'worker'}
+    assert config.spec.template_spec.node_selectors == {'zone': 'a'}
+
+
+def test_apply_overrides_rejects_unknown_keys():
+    with pytest.raises(ValueError, match="Unknown manifest key 'gpus'"):
+        apply_overrides(make_config(), {'gpus': 1})
+
+
+def test_apply_overrides_rejects_malformed_key_values():
+    with pytest.raises(ValueError, match='Invalid key=value pair'):
+        apply_overrides(make_config(), {'job_labels': 'team'})
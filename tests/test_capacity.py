@@ -0,0 +1,97 @@
+import pytest
+
+from jet.capacity import check_fit, _matches_selector
+from jet.utils import parse_quantity
+
+
+@pytest.mark.parametrize('quantity, value', [
+    ('500m', 0.5),
+    ('4', 4.0),
+    (2, 2.0),
+    ('16Gi', 16 * 1024**3),
+    ('1.5G', 1.5e9),
+    ('1e3', 1000.0),
+    (' 128Mi ', 128 * 1024**2),
+])
+def test_parse_quantity(quantity, value):
+    assert parse_quantity(quantity) == pytest.approx(value)
+
+
+@pytest.mark.parametrize('quantity', ['', 'abc', '16GB', '1.5 Gi'])
+def test_parse_quantity_rejects_invalid_quantities(quantity):
+    with pytest.raises(ValueError, match='Invalid resource quantity'):
+        parse_quantity(quantity)
+
+
+def node(cpu=(16, 0), mem=(64, 0), gpu=(0, 0), gpu_product='', labels=None, unschedulable=False):
+    """Node data as returned by utils.get_node_resources(): (allocatable, requested) per resource."""
+    return {
+        'cpu_allocatable': cpu[0], 'cpu_requests': cpu[1],
+        'mem_allocatable': mem[0], 'mem_requests': mem[1],
+        'gpu_allocatable': gpu[0], 'gpu_requests': gpu[1],
+        'gpu_product': gpu_product, 'labels': labels or {}, 'unschedulable': unschedulable,
+    }
+
+
+def job(cpu='1', memory='4Gi', gpu=None, node_selector=None, limits=None):
+    requests = {'cpu': cpu, 'memory': memory}
+    if gpu:
+        requests['nvidia.com/gpu'] = gpu
+    pod_spec = {'containers': [{'name': 'main', 'resources': {'requests': requests, 'limits': limits or {}}}]}
+    if node_selector:
+        pod_spec['nodeSelector'] = node_selector
+    return {'spec': {'template': {'spec': pod_spec}}}
+
+
+def test_matches_selector_compares_exposed_labels():
+    a100 = node(labels={'zone': 'a'})
+    assert _matches_selector(a100, {'zone': 'a'}, {'zone'})
+    assert not _matches_selector(a100, {'zone': 'b'}, {'zone'})
+
+
+def test_matches_selector_ignores_unexposed_labels_except_gpu_type():
+    a100 = node(gpu_product='NVIDIA-A100-SXM4-80GB')
+    assert _matches_selector(a100, {'team': 'ml'}, set())
+    assert _matches_selector(a100, {'gpu-type': 'a100'}, set())
+    assert not _matches_selector(a100, {'gpu-type': 'h100'}, set())
+    assert not _matches_selector(node(labels={'gpu_type': 'h100'}, gpu_product='A100'), {'gpu-type': 'a100'}, {'gpu_type'})
+
+
+def test_check_fit_sums_container_requests_and_uses_limits_as_requests():
+    manifest = job(cpu='500m', memory='2Gi', gpu='1')
+    manifest['spec']['template']['spec']['containers'].append(
+        {'name': 'sidecar', 'resources': {'limits': {'cpu': '1500m', 'memory': '1Gi'}}})
+    verdict, request, _ = check_fit(manifest, {'n1': node(gpu=(1, 0))})
+    assert verdict == 'fits'
+    assert request == {'cpu': 2.0, 'memory': 3.0, 'gpu': 1}
+
+
+def test_check_fit_verdicts():
+    nodes = {'busy': node(gpu=(8, 7), gpu_product='A100'), 'small': node(gpu=(1, 0), gpu_product='A100')}
+    assert check_fit(job(gpu='1'), nodes)[0] == 'fits'
+    assert check_fit(job(gpu='2'), nodes)[0] == 'fits_later'
+    assert check_fit(job(gpu='1'), nodes, pods=3)[0] == 'fits_later'
+    assert check_fit(job(gpu='9'), nodes)[0] == 'never'
+    assert check_fit(job(memory='128Gi'), nodes)[0] == 'never'
+
+
+def test_check_fit_skips_unschedulable_and_non_matching_nodes():
+    nodes = {
+        'cordoned': node(gpu=(8, 0), gpu_product='H100', unschedulable=True),
+        'a100': node(gpu=(8, 0), gpu_product='A100'),
+    }
+    assert check_fit(job(gpu='1', node_selector={'gpu-type': 'h100'}), nodes)[0] == 'never'
+    verdict, _, candidates = check_fit(job(gpu='1', node_selector={'gpu-type': 'a100'}), nodes)
+    assert verdict == 'fits'
+    assert [name for name, _ in candidates] == ['a100']
+
+
+def test_check_fit_ranks_nodes_that_fit_now_first():
+    nodes = {
+        'full': node(gpu=(8, 8)),
+        'two-free': node(gpu=(4, 2)),
+        'four-free': node(gpu=(4, 0)),
+        'one-free': node(gpu=(2, 1)),
+    }
+    _, _, candidates = check_fit(job(gpu='2'), nodes)
+    assert [name for name, _ in candidates] == ['four-free', 'two-free', 'one-free']
@@ -0,0 +1,15 @@
+import pytest
+
+from jet.utils import count_indexes
+
+
+@pytest.mark.parametrize('index_ranges, count', [
+    (None, 0),
+    ('', 0),
+    ('3', 1),
+    ('0-3', 4),
+    ('0-3,7', 5),
+    ('1,3,5-9,12-13', 9),
+])
+def test_count_indexes(index_ranges, count):
+    assert count_indexes(index_ranges) == count
@@ -0,0 +1,62 @@
+import asyncio
+import contextlib
+
+import pytest
+
+kr8s = pytest.importorskip('kr8s')
+pytest.importorskip('httpx')
+
+from jet.k8s_api import ResourceWatch
+
+
+class FakeResponse:
+    def __init__(self, lines, error=None):
+        self.lines = lines
+        self.error = error
+
+    async def aiter_lines(self):
+        for line in self.lines:
+            yield line
+        if self.error:
+            raise self.error
+
+
+class FakeApi:
+    """Serves one scripted watch stream per call_api call and records the resourceVersion asked for."""
+
+    namespace = 'default'
+
+    def __init__(self, streams):
+        self.streams = list(streams)
+        self.resource_versions = []
+
+    @contextlib.asynccontextmanager
+    async def call_api(self, method, version, namespace, url, params=None, stream=False, timeout=None):
+        self.resource_versions.append(params['resourceVersion'])
+        yield self.streams.pop(0)
+
+
+def event(event_type, name, resource_version):
+    return ('{"type": "%s", "object": {"metadata": {"name": "%s", "namespace": "default", "resourceVersion": "%s"}}}'
+            % (event_type, name, resource_version))
+
+
+def test_events_resume_from_last_resource_version_after_a_stream_timeout(monkeypatch):
+    monkeypatch.setattr(ResourceWatch, 'RECONNECT_DELAY_SECONDS', 0)
+    api = FakeApi([
+        FakeResponse([event('ADDED', 'a', '11')], error=kr8s._exceptions.APITimeoutError('read timed out')),
+        FakeResponse([event('MODIFIED', 'a', '12')]),
+    ])
+    watch = ResourceWatch('Job', namespace='default', api=api)
+    watch.resource_version = '10'
+
+    async def first_events(count):
+        events = []
+        async for event_type, obj in watch.events():
+            events.append((event_type, obj['metadata']['resourceVersion']))
+            if len(events) == count:
+                return events
+
+    assert asyncio.run(first_events(2)) == [('ADDED', '11'), ('MODIFIED', '12')]
+    assert api.resource_versions == ['10', '11']
+    assert watch.reconnects == 1
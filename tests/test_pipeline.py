@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from jet import bulk, k8s_api
+from jet.bulk import SubmitResult
+from jet.pipeline import topological_order, run_pipeline
+
+
+def stages(**depends_on):
+    return [{'name': name, 'depends_on': deps} for name, deps in depends_on.items()]
+
+
+def test_topological_order_keeps_file_order_among_ready_stages():
+    order = topological_order(stages(train=['prep'], prep=[], fetch=[], evaluate=['train', 'fetch']))
+    assert order == ['prep', 'fetch', 'train', 'evaluate']
+
+
+@pytest.mark.parametrize('graph, message', [
+    (stages(a=[], b=['a'], c=['b', 'd'], d=['c']), 'Dependency cycle between stages: c, d'),
+    (stages(a=['a']), "Stage 'a' depends on itself"),
+    (stages(a=['missing']), "depends on unknown stage 'missing'"),
+    (stages(a=[]) * 2, "Duplicate stage name 'a'"),
+])
+def test_topological_order_rejects_invalid_graphs(graph, message):
+    with pytest.raises(ValueError, match=message):
+        topological_order(graph)
+
+
+class FakeCluster:
+    """Stands in for submit_many and the Job watch: submitted jobs finish with a scripted phase."""
+
+    def __init__(self, phases):
+        self.phases = phases  # job name -> 'complete' or 'failed'
+        self.submitted = []
+        self.events = asyncio.Queue()
+
+    async def submit_many(self, resources, concurrency, qps, api=None):
+        results = []
+        for job in resources:
+            name = job['metadata']['name']
+            self.submitted.append(name)
+            condition = 'Failed' if self.phases[name] == 'failed' else 'Complete'
+            self.events.put_nowait(('MODIFIED', {'metadata': {'name': name},
+                                                 'status': {'conditions': [{'type': condition, 'status': 'True'}]}}))
+            results.append(SubmitResult(name=name, status='created'))
+        return results
+
+    def watch(self, kind, namespace=None, label_selector=None, api=None):
+        cluster = self
+
+        class Watch:
+            async def list(self):
+                return []
+
+            async def events(self):
+                while True:
+                    yield await cluster.events.get()
+
+        return Watch()
+
+
+def test_run_pipeline_skips_stages_downstream_of_a_failure(monkeypatch):
+    dependencies = {'prep': [], 'train': ['prep'], 'evaluate': ['train'], 'report': ['evaluate'], 'lint': []}
+    cluster = FakeCluster({'p-prep': 'complete', 'p-train': 'failed', 'p-lint': 'complete'})
+    monkeypatch.setattr(bulk, 'submit_many', cluster.submit_many)
+    monkeypatch.setattr(k8s_api, 'ResourceWatch', cluster.watch)
+
+    jobs = {stage: {'metadata': {'name': f'p-{stage}'}} for stage in dependencies}
+    states = asyncio.run(run_pipeline(jobs, dependencies, 'default', 'jet-pipeline=p', api=object()))
+
+    assert states == {'prep': 'complete', 'train': 'failed', 'evaluate': 'skipped', 'report': 'skipped', 'lint': 'complete'}
+    assert sorted(cluster.submitted) == ['p-lint', 'p-prep', 'p-train']
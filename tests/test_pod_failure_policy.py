@@ -0,0 +1,63 @@
+import pytest
+
+from jet.process_args import ProcessArguments
+from jet.utils import _match_pod_failure_rule
+
+
+@pytest.fixture
+def parse_rule():
+    return ProcessArguments.__new__(ProcessArguments)._parse_pod_failure_rule
+
+
+@pytest.mark.parametrize('rule, parsed', [
+    ('FailJob:exit-codes=42,1,42', {'action': 'FailJob', 'onExitCodes': {'operator': 'In', 'values': [1, 42]}}),
+    ('Count:exit-codes!=0@trainer', {'action': 'Count', 'onExitCodes': {'containerName': 'trainer', 'operator': 'NotIn', 'values': [0]}}),
+    ('Ignore:condition=DisruptionTarget', {'action': 'Ignore', 'onPodConditions': [{'type': 'DisruptionTarget'}]}),
+])
+def test_parse_pod_failure_rule(parse_rule, rule, parsed):
+    assert parse_rule(rule) == parsed
+
+
+@pytest.mark.parametrize('rule, message', [
+    ('exit-codes=1', 'Invalid pod failure rule'),
+    ('Retry:exit-codes=1', 'Invalid pod failure rule'),
+    ('FailJob:codes=1', 'Match must be'),
+    ('FailJob:exit-codes=a', 'Invalid exit codes'),
+    ('FailJob:exit-codes=@main', 'No exit codes'),
+])
+def test_parse_pod_failure_rule_rejects_invalid_rules(parse_rule, rule, message):
+    with pytest.raises(ValueError, match=message):
+        parse_rule(rule)
+
+
+def failed_pod(exit_codes, conditions=()):
+    return {'status': {
+        'containerStatuses': [{'name': name, 'state': {'terminated': {'exitCode': code}}} for name, code in exit_codes.items()],
+        'conditions': [{'type': condition, 'status': 'True'} for condition in conditions],
+    }}
+
+
+RULES = [
+    {'action': 'Ignore', 'onPodConditions': [{'type': 'DisruptionTarget'}]},
+    {'action': 'FailJob', 'onExitCodes': {'containerName': 'trainer', 'operator': 'In', 'values': [42]}},
+    {'action': 'Count', 'onExitCodes': {'operator': 'NotIn', 'values': [1, 2]}},
+]
+
+
+@pytest.mark.parametrize('pod, index', [
+    (failed_pod({'trainer': 42}, conditions=['DisruptionTarget']), 0),
+    (failed_pod({'trainer': 42}), 1),
+    (failed_pod({'sidecar': 42}), 2),
+    (failed_pod({'trainer': 1, 'sidecar': 0}), None),
+    (failed_pod({'trainer': 0}), None),
+])
+def test_match_pod_failure_rule_returns_first_matching_rule(pod, index):
+    matched_index, rule = _match_pod_failure_rule(RULES, pod)
+    assert matched_index == index
+    assert rule == (RULES[index] if index is not None else None)
+
+
+def test_match_pod_failure_rule_checks_init_containers():
+    pod = {'status': {'initContainerStatuses': [{'name': 'trainer', 'state': {'terminated': {'exitCode': 42}}}]}}
+    assert _match_pod_failure_rule(RULES, pod)[0] == 1
+    assert _match_pod_failure_rule(None, pod) == (None, None)
@@ -0,0 +1,102 @@
+import math
+
+import pytest
+
+from jet.sweep import parse_grid_arg, parse_random_arg, expand_space, trial_name
+
+
+def test_parse_grid_arg_strips_keys_and_values():
+    assert parse_grid_arg(' lr = 0.1, 0.01 ,,0.001') == ('lr', ['0.1', '0.01', '0.001'])
+
+
+@pytest.mark.parametrize('spec', ['lr', 'lr=', '=1,2', 'lr= , '])
+def test_parse_grid_arg_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError, match='Invalid grid parameter'):
+        parse_grid_arg(spec)
+
+
+class FixedRandom:
+    """random.Random stand-in returning the bounds, to check the samplers' value ranges."""
+
+    def __init__(self, pick_high):
+        self.pick_high = pick_high
+
+    def uniform(self, low, high):
+        return high if self.pick_high else low
+
+    def randint(self, low, high):
+        return high if self.pick_high else low
+
+    def choice(self, choices):
+        return choices[-1] if self.pick_high else choices[0]
+
+
+@pytest.mark.parametrize('spec, low, high', [
+    ('lr=uniform:0.1:0.5', '0.1', '0.5'),
+    ('lr=loguniform:1e-4:1e-2', repr(math.exp(math.log(1e-4))), repr(math.exp(math.log(1e-2)))),
+    ('layers=int:2:8', '2', '8'),
+    ('opt=choice:adam, sgd', 'adam', 'sgd'),
+])
+def test_parse_random_arg_samples_within_bounds(spec, low, high):
+    key, sampler = parse_random_arg(spec)
+    assert key == spec.split('=')[0]
+    assert sampler(FixedRandom(pick_high=False)) == low
+    assert sampler(FixedRandom(pick_high=True)) == high
+
+
+@pytest.mark.parametrize('spec, message', [
+    ('lr', 'Invalid random parameter'),
+    ('lr=uniform', 'Invalid random parameter'),
+    ('lr=uniform:a:b', 'Invalid bounds'),
+    ('lr=loguniform:0:1', 'must be positive'),
+    ('lr=normal:0:1', 'Unsupported distribution'),
+    ('opt=choice:,', 'has no choices'),
+])
+def test_parse_random_arg_rejects_invalid_specs(spec, message):
+    with pytest.raises(ValueError, match=message):
+        parse_random_arg(spec)
+
+
+def test_expand_space_grid_is_cartesian_product_in_order():
+    assert expand_space(grid=['lr=0.1,0.01', 'bs=32,64']) == [
+        {'lr': '0.1', 'bs': '32'}, {'lr': '0.1', 'bs': '64'},
+        {'lr': '0.01', 'bs': '32'}, {'lr': '0.01', 'bs': '64'},
+    ]
+
+
+def test_expand_space_random_is_seeded_and_sampled_per_grid_point():
+    args = dict(grid=['bs=32,64'], random_params=['lr=loguniform:1e-4:1e-1', 'layers=int:1:4'], trials=3)
+    trials = expand_space(seed=7, **args)
+    assert len(trials) == 6
+    assert [t['bs'] for t in trials] == ['32'] * 3 + ['64'] * 3
+    assert all(1e-4 <= float(t['lr']) <= 1e-1 and 1 <= int(t['layers']) <= 4 for t in trials)
+    assert expand_space(seed=7, **args) == trials
+    assert expand_space(seed=8, **args) != trials
+
+
+def test_expand_space_uses_trial_list_as_strings():
+    assert expand_space(trial_list=[{'lr': 0.1, 'bs': 32}]) == [{'lr': '0.1', 'bs': '32'}]
+    with pytest.raises(ValueError, match='cannot be combined'):
+        expand_space(grid=['lr=1'], trial_list=[{'lr': 1}])
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({}, 'parameter space is empty'),
+    ({'grid': ['lr=1'], 'trials': 2}, '--trials requires'),
+])
+def test_expand_space_rejects_empty_or_inconsistent_spaces(kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        expand_space(**kwargs)
+
+
+def test_trial_name_is_zero_padded_to_the_largest_index():
+    assert trial_name('sweep', 0, 1) == 'sweep-0'
+    assert trial_name('sweep', 7, 10) == 'sweep-7'
+    assert trial_name('sweep', 7, 11) == 'sweep-07'
+    assert trial_name('sweep', 42, 1000) == 'sweep-042'
+
+
+def test_trial_name_rejects_names_longer_than_63_characters():
+    assert len(trial_name('s' * 60, 10, 11)) == 63
+    with pytest.raises(ValueError, match='exceeds 63 characters'):
+        trial_name('s' * 61, 10, 11)